@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+data.go.kr XML 응답 파서 마이크로 벤치마크
+기존 ElementTree 전체 트리 파서와 StreamingXMLParser(스트리밍 단일 패스)의 CPU 시간/최대 메모리 비교
+
+사용법:
+    python bench_parse.py                    # fixtures/ 의 모든 샘플 응답
+    python bench_parse.py resp1.xml ...      # 직접 저장한 응답 파일
+    python bench_parse.py --rows 10 100 1000 # 페이지 크기별 메모리 비교
+    python bench_parse.py --transactions     # 실거래가: 문자열 dict(기존) vs Transaction 레코드, 1,000건당
+"""
+
+import argparse
+import importlib.util
+import os
+import re
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVERS_DIR = os.path.dirname(BENCH_DIR)
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+
+
+def load_server(name: str):
+    """mcp-servers/<name>/server.py 를 모듈로 로드"""
+    path = os.path.join(SERVERS_DIR, name, "server.py")
+    spec = importlib.util.spec_from_file_location(f"{name.replace('-', '_')}_server", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, os.path.dirname(path))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.pop(0)
+    return module
+
+
+def legacy_parse_xml_response(xml_text: str) -> dict:
+    """비교 기준: 스트리밍 파서 도입 전 building-register 의 parse_xml_response"""
+    root = ET.fromstring(xml_text)
+
+    result = {
+        "resultCode": root.findtext(".//resultCode", ""),
+        "resultMsg": root.findtext(".//resultMsg", ""),
+        "totalCount": int(root.findtext(".//totalCount", "0")),
+        "numOfRows": int(root.findtext(".//numOfRows", "10")),
+        "pageNo": int(root.findtext(".//pageNo", "1")),
+        "items": [],
+    }
+    for item in root.iter("item"):
+        item_dict = {}
+        for child in item:
+            if child.text:
+                item_dict[child.tag] = child.text.strip()
+        if item_dict:
+            result["items"].append(item_dict)
+    return result
+
+
+def resize_page(xml_bytes: bytes, rows: int) -> bytes:
+    """샘플 응답의 item 을 반복/절삭하여 rows 건짜리 페이지 생성"""
+    text = xml_bytes.decode("utf-8")
+    items = re.findall(r"<item>.*?</item>", text, flags=re.S)
+    body = "".join(items[i % len(items)] for i in range(rows))
+    text = re.sub(r"<items>.*</items>", lambda _: f"<items>{body}</items>", text, flags=re.S)
+    return text.encode("utf-8")
+
+
+def measure(fn, data, repeat: int) -> tuple:
+    """(평균 ms, 최대 메모리 KB)"""
+    fn(data)  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(data)
+    elapsed_ms = (time.perf_counter() - started) / repeat * 1000
+
+    tracemalloc.start()
+    fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def legacy_transaction_parse(xml_bytes: bytes) -> dict:
+    """비교 기준: Transaction 도입 전 real-estate-transaction 처리 (문자열 dict + totalCount 를 위한 재파싱)"""
+    text = xml_bytes.decode("utf-8")
+    result = legacy_parse_xml_response(text)
+    result["totalCount"] = int(ET.fromstring(text).findtext(".//totalCount", "0"))
+    return result
+
+
+def measure_retained(fn, data) -> float:
+    """결과를 들고 있는 동안 남는 메모리 (KB)"""
+    tracemalloc.start()
+    result = fn(data)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained / 1024
+
+
+def bench_transactions(repeat: int) -> None:
+    """실거래가 응답 1,000건 기준 파싱 CPU 시간/최대 메모리/결과 보유 메모리"""
+    real_estate = load_server("real-estate-transaction")
+    candidates = {
+        "문자열 dict + totalCount 재파싱": legacy_transaction_parse,
+        "Transaction 단일 패스": real_estate.parse_xml_response,
+    }
+    print(f"{'응답 (1,000건)':<40} {'파서':<32} {'평균(ms)':>10} {'최대메모리(KB)':>14} {'보유(KB)':>10}")
+    print("-" * 112)
+    for name in ("getRTMSDataSvcAptTrade.xml", "getRTMSDataSvcAptRent.xml"):
+        with open(os.path.join(FIXTURES_DIR, "real-estate-transaction", name), "rb") as f:
+            data = resize_page(f.read(), 1000)
+        for label, fn in candidates.items():
+            assert fn(data)["totalCount"] == legacy_transaction_parse(data)["totalCount"]
+            elapsed_ms, peak_kb = measure(fn, data, repeat)
+            print(f"{name:<40} {label:<32} {elapsed_ms:>10.1f} {peak_kb:>14.1f} {measure_retained(fn, data):>10.1f}")
+
+
+def chunked(parser_cls, chunk_size: int):
+    """네트워크에서 chunk_size 바이트씩 받아 feed 하는 경우를 흉내"""
+    def parse(data: bytes) -> dict:
+        parser = parser_cls()
+        for offset in range(0, len(data), chunk_size):
+            parser.feed(data[offset:offset + chunk_size])
+        return parser.close()
+    return parse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="XML 응답 파일 (기본: fixtures/ 전체)")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수 (기본: 200)")
+    parser.add_argument("--rows", type=int, nargs="*", help="페이지 크기를 바꿔가며 측정 (예: 10 100 1000)")
+    parser.add_argument("--chunk-size", type=int, default=16384, help="스트리밍 feed 단위 바이트 (기본: 16384)")
+    parser.add_argument("--transactions", action="store_true", help="실거래가 레코드 파싱 비교 (1,000건당)")
+    args = parser.parse_args()
+
+    if args.transactions:
+        bench_transactions(max(1, args.repeat // 10))
+        return
+
+    building = load_server("building-register")
+    candidates = {
+        "legacy (ET.fromstring)": legacy_parse_xml_response,
+        "streaming parse_xml_response": building.parse_xml_response,
+        f"streaming ({args.chunk_size // 1024}KB chunk feed)": chunked(building.StreamingXMLParser, args.chunk_size),
+    }
+
+    files = args.files or sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(FIXTURES_DIR)
+        for name in names
+        if name.endswith(".xml")
+    )
+
+    print(f"{'응답':<48} {'행':>5} {'파서':<28} {'평균(ms)':>10} {'최대메모리(KB)':>14}")
+    print("-" * 110)
+    for path in files:
+        with open(path, "rb") as f:
+            original = f.read()
+        pages = [original] + [resize_page(original, rows) for rows in args.rows or []]
+        for data in pages:
+            expected = legacy_parse_xml_response(data)["items"]
+            for label, fn in candidates.items():
+                result = fn(data)
+                assert result["items"] == expected, f"{label}: 결과가 기존 파서와 다릅니다 ({path})"
+                elapsed_ms, peak_kb = measure(fn, data, args.repeat)
+                name = os.path.relpath(path, FIXTURES_DIR) if path.startswith(FIXTURES_DIR) else path
+                print(f"{name:<48} {len(expected):>5} {label:<28} {elapsed_ms:>10.3f} {peak_kb:>14.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+MCP 도구 지연시간/처리량 벤치마크
+로컬 대역 서버(standin.py)를 띄우고 세 MCP 서버의 @mcp.tool() 함수를 직접 호출하여
+도구별 p50/p95/p99 지연시간과 처리량을 측정 (API 키, 네트워크 불필요)
+
+사용법:
+    python bench_tools.py                                  # 전체 시나리오
+    python bench_tools.py --iterations 200 --concurrency 8 --latency-ms 50 --jitter-ms 30
+    python bench_tools.py --only search_building --error-rate 0.05
+    python bench_tools.py --save baseline.json             # 결과 저장
+    python bench_tools.py --baseline baseline.json         # 저장한 결과와 비교 (회귀 확인)
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+
+from bench_parse import load_server
+from standin import StandInServer
+
+# (시나리오 이름, 서버, 도구, 인자)
+SCENARIOS = [
+    ("search_building_basic", "building-register", "search_building_basic", {"sigungu_cd": "11680", "bjdong_cd": "10300"}),
+    ("search_building_recap_title", "building-register", "search_building_recap_title", {"sigungu_cd": "11680", "bjdong_cd": "10300"}),
+    ("search_building_recap_title[json]", "building-register", "search_building_recap_title",
+     {"sigungu_cd": "11680", "bjdong_cd": "10300", "output_format": "json"}),
+    ("search_building_title", "building-register", "search_building_title",
+     {"sigungu_cd": "11680", "bjdong_cd": "10300", "num_of_rows": 100}),
+    ("search_building_floor", "building-register", "search_building_floor", {"sigungu_cd": "11680", "bjdong_cd": "10300"}),
+    ("search_building_floor[fetch_all]", "building-register", "search_building_floor",
+     {"sigungu_cd": "11680", "bjdong_cd": "10300", "bun": "0012", "fetch_all": True}),
+    ("search_building_expos", "building-register", "search_building_expos", {"sigungu_cd": "11680", "bjdong_cd": "10300"}),
+    ("search_building_expos[fetch_all]", "building-register", "search_building_expos",
+     {"sigungu_cd": "11680", "bjdong_cd": "10300", "bun": "0012", "fetch_all": True}),
+    ("search_building_price", "building-register", "search_building_price", {"sigungu_cd": "11680", "bjdong_cd": "10300"}),
+    ("search_building_zone", "building-register", "search_building_zone", {"sigungu_cd": "11680", "bjdong_cd": "10300"}),
+    ("get_parcel_dossier", "building-register", "get_parcel_dossier", {"sigungu_cd": "11680", "bjdong_cd": "10300", "bun": "0012"}),
+    ("summarize_unit_areas", "building-register", "summarize_unit_areas", {"sigungu_cd": "11680", "bjdong_cd": "10300", "bun": "0012"}),
+    ("screen_reconstruction_candidates", "building-register", "screen_reconstruction_candidates",
+     {"sigungu_cd": "11680", "bjdong_cds": ["10300", "10600"], "min_age": 10}),
+    ("search_real_estate_transaction[매매]", "real-estate-transaction", "search_real_estate_transaction",
+     {"sigungu_code": "11680", "year_month": "202401", "num_of_rows": 100}),
+    ("search_real_estate_transaction[전월세]", "real-estate-transaction", "search_real_estate_transaction",
+     {"sigungu_code": "11680", "year_month": "202401", "trade_type": "전월세", "num_of_rows": 100}),
+    ("search_real_estate_transaction[12개월]", "real-estate-transaction", "search_real_estate_transaction",
+     {"sigungu_code": "11680", "year_month": "202301", "end_year_month": "202312"}),
+    ("get_price_statistics[12개월]", "real-estate-transaction", "get_price_statistics",
+     {"sigungu_code": "11680", "year_month": "202301", "end_year_month": "202312", "group_by": "complex"}),
+    ("get_jeonse_ratio[12개월]", "real-estate-transaction", "get_jeonse_ratio",
+     {"sigungu_code": "11680", "year_month": "202301", "end_year_month": "202312"}),
+    ("search_multi_region_transaction[서울]", "real-estate-transaction", "search_multi_region_transaction",
+     {"regions": ["서울"], "year_month": "202401"}),
+    ("find_region_code[local]", "real-estate-transaction", "find_region_code", {"query": "강남구"}),
+    ("find_region_code[api]", "real-estate-transaction", "find_region_code", {"query": "개포동"}),
+    ("search_law", "korea-law", "search_law", {"query": "건축법"}),
+]
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values) + 0.5))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def configure_environment(base_url: str, workdir: str) -> None:
+    """서버 모듈을 불러오기 전에 대역 서버 주소와 측정용 설정을 환경변수로 지정"""
+    os.environ.update({
+        "DATA_GO_KR_BASE_URL": base_url,
+        "DATA_GO_KR_API_KEY": "bench",
+        "KOREA_LAW_API_KEY": "bench",
+        # 캐시/호출 한도가 측정을 가리지 않도록 끔
+        "BUILDING_CACHE_TTL": "0",
+        "REAL_ESTATE_STORE_PATH": "",
+        "DATA_GO_KR_QUOTA_PATH": os.path.join(workdir, "quota.sqlite3"),
+        "DATA_GO_KR_RATE_LIMIT": "1000000",
+        "DATA_GO_KR_BURST": "1000000",
+        "DATA_GO_KR_DAILY_LIMIT": "0",
+    })
+
+
+async def run_scenario(fn, kwargs: dict, iterations: int, concurrency: int) -> dict:
+    """iterations 회 호출 (동시 concurrency 개) - 지연시간 목록과 처리량 반환"""
+    is_async = inspect.iscoroutinefunction(fn)
+
+    async def call() -> str:
+        if is_async:
+            return await fn(**kwargs)
+        return await asyncio.to_thread(fn, **kwargs)
+
+    await call()  # warm-up (커넥션 생성, 지연 import)
+
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed() -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            output = await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+            if output.startswith(("오류", "HTTP 오류", "네트워크 오류")) or "❌" in output:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(iterations)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "calls": iterations,
+        "errors": errors,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "throughput": iterations / elapsed if elapsed else 0.0,
+    }
+
+
+def print_report(results: dict, baseline: dict | None, threshold: float) -> int:
+    """결과 표 출력 - baseline 이 있으면 p50 변화율과 회귀 여부 표시, 회귀 건수 반환"""
+    header = f"{'시나리오':<40} {'호출':>6} {'오류':>5} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'처리량(/s)':>11}"
+    if baseline:
+        header += f" {'p50 변화':>10}"
+    print(header)
+    print("-" * len(header.encode("utf-8")))
+
+    regressions = 0
+    for name, r in results.items():
+        line = (
+            f"{name:<40} {r['calls']:>6} {r['errors']:>5} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} "
+            f"{r['p99_ms']:>9.2f} {r['throughput']:>11.1f}"
+        )
+        previous = (baseline or {}).get(name)
+        if previous and previous["p50_ms"]:
+            change = r["p50_ms"] / previous["p50_ms"] - 1
+            mark = " ⚠️" if change > threshold else ""
+            regressions += change > threshold
+            line += f" {change * 100:>+9.1f}%{mark}"
+        print(line)
+    return regressions
+
+
+async def main_async(args) -> int:
+    workdir = tempfile.mkdtemp(prefix="mcp-bench-")
+    standin = StandInServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_code=args.error_code,
+        http_error_rate=args.http_error_rate,
+        seed=args.seed,
+    )
+    configure_environment(standin.start(), workdir)
+
+    servers = {}
+    results = {}
+    try:
+        for name, server_name, tool, kwargs in SCENARIOS:
+            if args.only and not any(pattern in name for pattern in args.only):
+                continue
+            if server_name not in servers:
+                servers[server_name] = load_server(server_name)
+            fn = getattr(servers[server_name], tool)
+            results[name] = await run_scenario(fn, kwargs, args.iterations, args.concurrency)
+            print(f"  {name}: p50 {results[name]['p50_ms']:.2f}ms", file=sys.stderr)
+    finally:
+        for module in servers.values():
+            # 비동기 클라이언트는 이 루프에 묶여 있으므로 루프를 끝내기 전에 닫음
+            if hasattr(module, "async_executor"):
+                await module.async_executor.aclose()
+        standin.stop()
+
+    print(
+        f"\n대역 서버 지연 {args.latency_ms:g}±{args.jitter_ms:g}ms, 결과코드 오류 {args.error_rate:.0%}, "
+        f"HTTP 오류 {args.http_error_rate:.0%} / 반복 {args.iterations}회, 동시 {args.concurrency}개\n"
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    regressions = print_report(results, baseline, args.threshold)
+    print(f"\n대역 서버 요청 {standin.stats['requests']:,}건 (응답 없음 {standin.stats['missing']}건)")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"settings": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.save}")
+    if regressions:
+        print(f"⚠️ p50 이 {args.threshold:.0%} 넘게 느려진 시나리오 {regressions}개")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100, help="시나리오별 호출 횟수 (기본: 100)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 호출 수 (기본: 4)")
+    parser.add_argument("--only", nargs="*", help="이름에 포함된 문자열로 시나리오 선택")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="대역 서버 응답 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지연 ± 편차(ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="결과 코드 오류 주입 비율")
+    parser.add_argument("--error-code", default="20", help="주입할 결과 코드 (기본: 20)")
+    parser.add_argument("--http-error-rate", type=float, default=0.0, help="HTTP 503 주입 비율")
+    parser.add_argument("--seed", type=int, default=1, help="주입 난수 시드 (기본: 1)")
+    parser.add_argument("--save", help="결과를 JSON 으로 저장")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 볼 p50 증가율 (기본: 0.2)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+HTTP 전송 계층 벤치마크 - 요청마다 새로 연결하는 urllib.request.urlopen 과
+real-estate-transaction / korea-law 의 keep-alive + gzip HTTPConnectionPool 을 같은 호스트 반복 호출로 비교
+대역 서버(standin.py)에 연결 지연(TCP+TLS 핸드셰이크 대신)과 응답 지연을 주입하여 측정 (API 키, 네트워크 불필요)
+
+사용법:
+    python bench_transport.py
+    python bench_transport.py --calls 200 --concurrency 8 --connect-latency-ms 30 --latency-ms 20
+    python bench_transport.py --no-gzip                  # 압축 없이 커넥션 재사용 효과만
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_parse import load_server
+from bench_tools import configure_environment, percentile
+from standin import StandInServer
+
+# (이름, 서버, 요청 경로) - 서버가 실제로 보내는 것과 같은 요청
+TARGETS = [
+    ("실거래가 1,000건 페이지", "real-estate-transaction",
+     "/1613000/RTMSDataSvcAptTrade/getRTMSDataSvcAptTrade?serviceKey=bench&LAWD_CD=11680&DEAL_YMD=202401&numOfRows=1000&pageNo=1"),
+    ("법령 목록", "korea-law", "/1170000/law/lawSearchList.do?serviceKey=bench&target=law&query=%EA%B1%B4%EC%B6%95%EB%B2%95&numOfRows=10&pageNo=1"),
+]
+
+
+def urllib_get(base_url: str, path: str) -> int:
+    """기존 방식: 요청마다 urlopen (새 커넥션, 압축 없음)"""
+    req = urllib.request.Request(f"{base_url}{path}")
+    req.add_header("User-Agent", "Mozilla/5.0 (compatible; RealEstateBot/1.0)")
+    with urllib.request.urlopen(req, timeout=30) as response:
+        return len(response.read())
+
+
+def pool_get(pool, path: str) -> int:
+    status, _, body = pool.request("GET", path, headers={"User-Agent": "Mozilla/5.0 (compatible; RealEstateBot/1.0)"})
+    assert status == 200, status
+    return len(body)
+
+
+def measure(fn, calls: int, concurrency: int) -> dict:
+    """calls 회 호출 (동시 concurrency 개) - 지연시간 p50/p95, 전체 시간"""
+    fn()  # warm-up
+
+    def timed(_):
+        started = time.perf_counter()
+        fn()
+        return (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(timed, range(calls)))
+    elapsed = time.perf_counter() - started
+    return {
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "mean": statistics.fmean(latencies),
+        "throughput": calls / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100, help="대상별 호출 횟수 (기본: 100)")
+    parser.add_argument("--concurrency", nargs="*", type=int, default=[1, 4], help="동시 호출 수 (기본: 1 4)")
+    parser.add_argument("--connect-latency-ms", type=float, default=30.0, help="새 커넥션마다 주입할 연결 지연 (기본: 30ms)")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="응답 지연 (기본: 10ms)")
+    parser.add_argument("--no-gzip", action="store_true", help="대역 서버 압축 응답 끄기")
+    args = parser.parse_args()
+
+    standin = StandInServer(latency_ms=args.latency_ms, connect_latency_ms=args.connect_latency_ms, compress=not args.no_gzip)
+    base_url = standin.start()
+    configure_environment(base_url, tempfile.mkdtemp(prefix="mcp-bench-"))
+    servers = {}
+
+    print(
+        f"대역 서버: 연결 지연 {args.connect_latency_ms:g}ms, 응답 지연 {args.latency_ms:g}ms, "
+        f"gzip {'끔' if args.no_gzip else '켬'} / 대상별 {args.calls}회\n"
+    )
+    header = f"{'대상':<22} {'동시':>4} {'방식':<8} {'p50(ms)':>9} {'p95(ms)':>9} {'평균(ms)':>9} {'처리량(/s)':>11} {'전송량/건':>10}"
+    print(header)
+    print("-" * len(header.encode("utf-8")))
+    try:
+        for name, server_name, path in TARGETS:
+            if server_name not in servers:
+                servers[server_name] = load_server(server_name)
+            pool = servers[server_name].connection_pool
+            for concurrency in args.concurrency:
+                before = pool.stats()
+                rows = [
+                    ("urllib", measure(lambda: urllib_get(base_url, path), args.calls, concurrency)),
+                    ("pool", measure(lambda: pool_get(pool, path), args.calls, concurrency)),
+                ]
+                after = pool.stats()
+                calls = after["requests"] - before["requests"]
+                wire = (after["wire_bytes"] - before["wire_bytes"]) / max(1, calls)
+                body = (after["body_bytes"] - before["body_bytes"]) / max(1, calls)
+                for method, r in rows:
+                    size = body if method == "urllib" else wire  # urllib 은 압축 없이 받음
+                    print(
+                        f"{name:<22} {concurrency:>4} {method:<8} {r['p50']:>9.2f} {r['p95']:>9.2f} {r['mean']:>9.2f} "
+                        f"{r['throughput']:>11.1f} {size / 1024:>8.1f}KB"
+                    )
+                speedup = rows[0][1]["mean"] / rows[1][1]["mean"] if rows[1][1]["mean"] else 0.0
+                print(f"{'':<22} {'':>4} → 평균 {speedup:.1f}배, 재사용률 {after['reuse_rate']:.0%}")
+    finally:
+        standin.stop()
+    print(f"\n대역 서버 커넥션 {standin.stats['connections']:,}개 / 요청 {standin.stats['requests']:,}건", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
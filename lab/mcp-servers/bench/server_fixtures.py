@@ -0,0 +1,48 @@
+"""MCP 서버 테스트 공통 pytest 픽스처 - 각 서버의 tests/conftest.py 에서 가져다 씀
+
+서버는 import 시점에 환경변수를 읽으므로 캐시/저장소/호출 한도 파일을 임시 디렉터리로 돌린 뒤 로드하고,
+모듈 로드와 응답 픽스처는 벤치마크(bench_parse.py)와 같은 것을 사용
+"""
+
+import os
+
+import pytest
+
+from bench_parse import FIXTURES_DIR, load_server
+
+
+@pytest.fixture(scope="session")
+def read_fixture():
+    """(서버 이름, 파일명) → bench/fixtures/<서버 이름>/<파일명> 응답 원문"""
+
+    def read(name: str, filename: str) -> bytes:
+        with open(os.path.join(FIXTURES_DIR, name, filename), "rb") as f:
+            return f.read()
+
+    return read
+
+
+@pytest.fixture(scope="session")
+def load_test_server(tmp_path_factory):
+    """서버 이름 → 임시 경로로 로드한 모듈 (세션당 한 번)"""
+    workdir = tmp_path_factory.mktemp("mcp-servers")
+    env = {
+        "DATA_GO_KR_API_KEY": "test-key",
+        "DATA_GO_KR_QUOTA_PATH": str(workdir / "quota.sqlite3"),
+        "BUILDING_CACHE_PATH": str(workdir / "responses.sqlite3"),
+        "BUILDING_BJDONG_INDEX_PATH": str(workdir / "bjdong_codes.tsv"),
+        "BUILDING_METRICS_PATH": "",
+        "REAL_ESTATE_STORE_PATH": "",
+        "REAL_ESTATE_SIGUNGU_TABLE_PATH": str(workdir / "sigungu_codes.tsv"),
+    }
+    modules = {}
+
+    def load(name: str):
+        if name not in modules:
+            with pytest.MonkeyPatch.context() as mp:
+                for key, value in env.items():
+                    mp.setenv(key, value)
+                modules[name] = load_server(name)
+        return modules[name]
+
+    return load
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+apis.data.go.kr 로컬 대역 서버 (record/replay)
+fixtures/ 에 저장된 응답을 엔드포인트 이름으로 찾아 돌려주므로 API 키/네트워크 없이 MCP 서버를 실행·측정할 수 있음
+- 건축물대장(BldRgstHubService), 실거래가(RTMSDataSvc*), 법정동코드(StanReginCd), 국가법령정보(1170000/law)
+- XML 응답은 요청한 numOfRows/pageNo 에 맞춰 item 을 반복/절삭하여 totalCount 까지 페이지를 만들어 줌
+- 지연시간(--latency-ms, --jitter-ms), 결과 코드 오류(--error-rate, --error-code), HTTP 오류(--http-error-rate) 주입
+- 새 커넥션마다 연결 지연(--connect-latency-ms, TCP+TLS 핸드셰이크 대신), gzip 압축 응답(--gzip)
+- --record 를 주면 실제 API 로 요청(serviceKey 포함)을 전달하고 응답 본문만 fixtures 에 저장
+
+사용법:
+    python standin.py --port 8089 --latency-ms 80 --jitter-ms 40
+    DATA_GO_KR_BASE_URL=http://127.0.0.1:8089 python ../building-register/server.py
+    python standin.py --port 8089 --record https://apis.data.go.kr   # 응답 녹화
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+
+# 녹화한 응답을 저장할 서버별 디렉터리 (요청 경로 접두사 기준)
+RECORD_DIRS = {
+    "/1613000/BldRgstHubService/": "building-register",
+    "/1613000/": "real-estate-transaction",
+    "/1741000/": "real-estate-transaction",
+    "/1170000/": "korea-law",
+}
+
+# 주입할 수 있는 결과 코드 (MCP 서버들의 RESULT_CODE_MESSAGES 와 같은 의미)
+ERROR_MESSAGES = {
+    "01": "APPLICATION_ERROR",
+    "03": "NODATA_ERROR",
+    "04": "HTTP_ERROR",
+    "12": "NO_OPENAPI_SERVICE_ERROR",
+    "20": "TRAFFIC_EXCEEDED_ERROR",
+    "21": "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR",
+    "22": "SERVICE_TIME_OUT_ERROR",
+    "30": "SERVICE_KEY_IS_NOT_REGISTERED_ERROR",
+}
+
+ITEM_PATTERN = re.compile(rb"<item>.*?</item>", re.S)
+
+
+class Fixture:
+    """녹화된 응답 하나 - XML 이면 item 목록을 분리해 두고 요청한 페이지를 조립"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.body = f.read()
+        self.content_type = "application/json;charset=UTF-8" if path.endswith(".json") else "application/xml;charset=UTF-8"
+        self.items = ITEM_PATTERN.findall(self.body) if path.endswith(".xml") else []
+        total = re.search(rb"<totalCount>(\d+)</totalCount>", self.body)
+        self.total_count = int(total.group(1)) if total else len(self.items)
+        if self.items:
+            start = self.body.index(b"<items>") + len(b"<items>")
+            end = self.body.rindex(b"</items>")
+            self.head, self.tail = self.body[:start], self.body[end:]
+
+    def render(self, query: dict) -> bytes:
+        """numOfRows/pageNo 에 맞는 페이지 응답 생성 (item 이 없는 응답은 그대로)"""
+        if not self.items:
+            return self.body
+        try:
+            num_of_rows = max(1, int(query.get("numOfRows", "10")))
+            page_no = max(1, int(query.get("pageNo", "1")))
+        except ValueError:
+            return self.body
+        start = (page_no - 1) * num_of_rows
+        count = max(0, min(num_of_rows, self.total_count - start))
+        items = b"".join(self.items[(start + i) % len(self.items)] for i in range(count))
+        tail = re.sub(rb"<numOfRows>\d+</numOfRows>", b"<numOfRows>%d</numOfRows>" % num_of_rows, self.tail)
+        tail = re.sub(rb"<pageNo>\d+</pageNo>", b"<pageNo>%d</pageNo>" % page_no, tail)
+        return self.head + items + tail
+
+
+def load_fixtures(fixtures_dir: str) -> dict:
+    """fixtures/<서버>/<엔드포인트 이름>.(xml|json) 를 엔드포인트 이름으로 색인"""
+    fixtures = {}
+    for root, _, names in os.walk(fixtures_dir):
+        for name in names:
+            stem, ext = os.path.splitext(name)
+            if ext in (".xml", ".json"):
+                fixtures[stem] = Fixture(os.path.join(root, name))
+    return fixtures
+
+
+def endpoint_name(path: str) -> str:
+    """/1613000/RTMSDataSvcAptTrade/getRTMSDataSvcAptTrade → getRTMSDataSvcAptTrade, lawSearchList.do → lawSearchList"""
+    name = path.rstrip("/").rsplit("/", 1)[-1]
+    return name[:-3] if name.endswith(".do") else name
+
+
+def error_body(code: str) -> bytes:
+    """data.go.kr 형식의 결과 코드 오류 응답"""
+    message = ERROR_MESSAGES.get(code, "UNKNOWN_ERROR")
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?><response><header>'
+        f"<resultCode>{code}</resultCode><resultMsg>{message}</resultMsg></header></response>"
+    ).encode("utf-8")
+
+
+class StandInServer:
+    """대역 서버 - 스레드에서 실행되며 start() 가 base URL 을 반환"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        fixtures_dir: str = FIXTURES_DIR,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: str = "20",
+        http_error_rate: float = 0.0,
+        record_upstream: str = "",
+        seed: int | None = None,
+        connect_latency_ms: float = 0.0,
+        compress: bool = False,
+    ):
+        self.fixtures_dir = fixtures_dir
+        self.fixtures = load_fixtures(fixtures_dir)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.http_error_rate = http_error_rate
+        self.record_upstream = record_upstream.rstrip("/")
+        self.connect_latency_ms = connect_latency_ms
+        self.compress = compress
+        self.random = random.Random(seed)
+        self.stats = {"requests": 0, "connections": 0, "compressed": 0, "replayed": 0, "recorded": 0, "missing": 0, "injected_errors": 0, "injected_http_errors": 0}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _delay(self) -> float:
+        """이번 요청에 주입할 지연(초)"""
+        with self._lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def _roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self.random.random() < rate
+
+    def respond(self, path: str, query: dict) -> tuple:
+        """(status, content_type, body)"""
+        self._count("requests")
+        if self._roll(self.http_error_rate):
+            self._count("injected_http_errors")
+            return 503, "text/plain", b"Service Unavailable"
+        if self._roll(self.error_rate):
+            self._count("injected_errors")
+            return 200, "application/xml;charset=UTF-8", error_body(self.error_code)
+
+        name = endpoint_name(path)
+        if self.record_upstream:
+            return self._record(path, query, name)
+
+        fixture = self.fixtures.get(name)
+        if fixture is None:
+            self._count("missing")
+            return 200, "application/xml;charset=UTF-8", error_body("03")
+        self._count("replayed")
+        return 200, fixture.content_type, fixture.render(query)
+
+    def _record(self, path: str, query: dict, name: str) -> tuple:
+        """실제 API 로 전달하고 정상 응답이면 fixtures 에 저장"""
+        url = f"{self.record_upstream}{path}?{urllib.parse.urlencode(query, quote_via=urllib.parse.quote)}"
+        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (compatible; StandInRecorder/1.0)"})
+        try:
+            with urllib.request.urlopen(req, timeout=30) as response:
+                body = response.read()
+                content_type = response.headers.get("Content-Type", "application/xml;charset=UTF-8")
+        except urllib.error.HTTPError as e:
+            return e.code, "text/plain", e.read()
+
+        subdir = next((d for prefix, d in RECORD_DIRS.items() if path.startswith(prefix)), "misc")
+        ext = ".json" if "json" in content_type or body.lstrip().startswith(b"{") else ".xml"
+        target = os.path.join(self.fixtures_dir, subdir, name + ext)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "wb") as f:
+            f.write(body)
+        with self._lock:
+            self.fixtures[name] = Fixture(target)
+        self._count("recorded")
+        print(f"recorded {path} → {os.path.relpath(target, self.fixtures_dir)}", file=sys.stderr)
+        return 200, content_type, body
+
+    def _handler_class(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더와 본문을 따로 보낼 때 Nagle + delayed ACK 로 ~40ms 씩 지연되지 않도록
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                standin._count("connections")
+                if standin.connect_latency_ms:
+                    time.sleep(standin.connect_latency_ms / 1000)
+
+            def do_GET(self):
+                parsed = urllib.parse.urlsplit(self.path)
+                query = dict(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True))
+                delay = standin._delay()
+                if delay:
+                    time.sleep(delay)
+                status, content_type, body = standin.respond(parsed.path, query)
+                compress = standin.compress and status == 200 and "gzip" in self.headers.get("Accept-Encoding", "")
+                if compress:
+                    body = gzip.compress(body, compresslevel=6)
+                    standin._count("compressed")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                if compress:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # 클라이언트가 시간 제한으로 먼저 끊음
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="응답 디렉터리 (기본: bench/fixtures)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답마다 주입할 지연시간(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지연시간 ± 무작위 편차(ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="결과 코드 오류를 돌려줄 비율 (0~1)")
+    parser.add_argument("--error-code", default="20", help="주입할 결과 코드 (기본: 20 트래픽 초과)")
+    parser.add_argument("--http-error-rate", type=float, default=0.0, help="HTTP 503 을 돌려줄 비율 (0~1)")
+    parser.add_argument("--record", default="", metavar="UPSTREAM", help="실제 API 로 전달하고 응답을 녹화 (예: https://apis.data.go.kr)")
+    parser.add_argument("--seed", type=int, help="오류/지연 주입 난수 시드")
+    parser.add_argument("--connect-latency-ms", type=float, default=0.0, help="새 커넥션마다 주입할 연결 지연(ms)")
+    parser.add_argument("--gzip", action="store_true", help="Accept-Encoding: gzip 요청에 압축 응답")
+    args = parser.parse_args()
+
+    standin = StandInServer(
+        args.host, args.port, args.fixtures, args.latency_ms, args.jitter_ms,
+        args.error_rate, args.error_code, args.http_error_rate, args.record, args.seed,
+        args.connect_latency_ms, args.gzip,
+    )
+    print(f"대역 서버: {standin.base_url} (응답 {len(standin.fixtures)}개)", file=sys.stderr)
+    print(f"  DATA_GO_KR_BASE_URL={standin.base_url}", file=sys.stderr)
+    try:
+        standin._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(standin.stats, ensure_ascii=False), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
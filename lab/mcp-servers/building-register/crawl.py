@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+건축물대장 법정동 일괄 수집 (배치 작업)
+법정동(들)의 전체 페이지를 오퍼레이션별로 수집하여 SQLite 에 저장
+- 페이지마다 체크포인트를 남기므로 중단(오류, 일일 호출건수 초과 등) 후 같은 명령으로 다시 실행하면 이어서 수집
+- 이미 저장된 페이지는 다시 요청하지 않음
+
+사용법:
+    python crawl.py --sigungu 11680 --bjdong 10300 10600
+    python crawl.py --sigungu 11680 --bjdong 10300 --operations 총괄표제부 표제부
+    python crawl.py --sigungu 11680 --bjdong-file bjdong_codes.txt
+    python crawl.py --sigungu 11680 --all-bjdong      # 법정동코드 색인(build_bjdong_index.py)의 모든 법정동
+    python crawl.py --status
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from server import OPERATIONS, bjdong_index, build_params, call_api, get_rate_limiter
+
+DEFAULT_DB_PATH = "building_register.sqlite3"
+ROWS_PER_PAGE = 100
+
+# 재시도해도 소용없으므로 즉시 중단할 결과 코드 (일일 호출건수 초과, 서비스 시간 외, 키 오류)
+STOP_CODES = {"12", "21", "22", "30", "31", "32"}
+# 잠시 후 재시도할 결과 코드 (트래픽 초과, 일시적 서버 오류)
+RETRY_CODES = {"01", "02", "04", "05", "20"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sweeps (
+    operation   TEXT NOT NULL,
+    sigungu_cd  TEXT NOT NULL,
+    bjdong_cd   TEXT NOT NULL,
+    total_count INTEGER NOT NULL,
+    total_pages INTEGER NOT NULL,
+    updated_at  REAL NOT NULL,
+    PRIMARY KEY (operation, sigungu_cd, bjdong_cd)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    operation  TEXT NOT NULL,
+    sigungu_cd TEXT NOT NULL,
+    bjdong_cd  TEXT NOT NULL,
+    page_no    INTEGER NOT NULL,
+    item_count INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (operation, sigungu_cd, bjdong_cd, page_no)
+);
+CREATE TABLE IF NOT EXISTS records (
+    operation   TEXT NOT NULL,
+    sigungu_cd  TEXT NOT NULL,
+    bjdong_cd   TEXT NOT NULL,
+    page_no     INTEGER NOT NULL,
+    row_no      INTEGER NOT NULL,
+    bun         TEXT,
+    ji          TEXT,
+    bld_nm      TEXT,
+    plat_plc    TEXT,
+    use_apr_day TEXT,
+    data        TEXT NOT NULL,
+    PRIMARY KEY (operation, sigungu_cd, bjdong_cd, page_no, row_no)
+);
+CREATE INDEX IF NOT EXISTS records_use_apr_day ON records (operation, use_apr_day);
+"""
+
+
+class QuotaExceeded(Exception):
+    """더 진행할 수 없는 API 오류 (일일 호출건수 초과 등)"""
+
+
+def open_store(path: str) -> sqlite3.Connection:
+    """결과 저장소(SQLite) 열기"""
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def fetch_page(operation: str, params: dict, retries: int, backoff: float) -> dict:
+    """한 페이지 조회 - 일시적 오류는 backoff 간격으로 재시도, 중단 코드는 QuotaExceeded"""
+    for attempt in range(retries + 1):
+        result = call_api(operation, params)
+        if "error" not in result:
+            return result
+        if result.get("quotaExhausted"):
+            raise QuotaExceeded(result["error"])
+        code = result.get("resultCode", "")
+        if code in STOP_CODES:
+            raise QuotaExceeded(f"{result['error']} (resultCode {code})")
+        if code and code not in RETRY_CODES:
+            return result
+        if attempt < retries:
+            wait = backoff * (2 ** attempt)
+            print(f"  ! {result['error']} - {wait:.0f}초 후 재시도 ({attempt + 1}/{retries})", file=sys.stderr)
+            time.sleep(wait)
+    return result
+
+
+def save_page(db: sqlite3.Connection, op_name: str, sigungu_cd: str, bjdong_cd: str, page_no: int, items: list) -> None:
+    """페이지 결과와 체크포인트를 한 트랜잭션으로 저장"""
+    with db:
+        db.executemany(
+            "INSERT OR REPLACE INTO records"
+            " (operation, sigungu_cd, bjdong_cd, page_no, row_no, bun, ji, bld_nm, plat_plc, use_apr_day, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    op_name, sigungu_cd, bjdong_cd, page_no, row_no,
+                    item.get("bun"), item.get("ji"), item.get("bldNm"), item.get("platPlc"),
+                    item.get("useAprDay") or None,
+                    json.dumps(item, ensure_ascii=False),
+                )
+                for row_no, item in enumerate(items, 1)
+            ],
+        )
+        db.execute(
+            "INSERT OR REPLACE INTO pages (operation, sigungu_cd, bjdong_cd, page_no, item_count, fetched_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (op_name, sigungu_cd, bjdong_cd, page_no, len(items), time.time()),
+        )
+
+
+def sweep(db: sqlite3.Connection, op_name: str, sigungu_cd: str, bjdong_cd: str, args) -> None:
+    """법정동 하나의 오퍼레이션 전체 페이지 수집 (완료된 페이지는 건너뜀)"""
+    operation = OPERATIONS[op_name]
+    done = {
+        row[0]
+        for row in db.execute(
+            "SELECT page_no FROM pages WHERE operation = ? AND sigungu_cd = ? AND bjdong_cd = ?",
+            (op_name, sigungu_cd, bjdong_cd),
+        )
+    }
+    row = db.execute(
+        "SELECT total_pages FROM sweeps WHERE operation = ? AND sigungu_cd = ? AND bjdong_cd = ?",
+        (op_name, sigungu_cd, bjdong_cd),
+    ).fetchone()
+    total_pages = row[0] if row else None
+
+    page_no = 1
+    while total_pages is None or page_no <= total_pages:
+        if page_no in done and total_pages is not None:
+            page_no += 1
+            continue
+
+        params = build_params(sigungu_cd, bjdong_cd, plat_gb_cd=args.plat_gb_cd, num_of_rows=ROWS_PER_PAGE, page_no=page_no)
+        result = fetch_page(operation, params, args.retries, args.backoff)
+        if "error" in result:
+            print(f"  ! {op_name} {sigungu_cd}-{bjdong_cd} page {page_no}: {result['error']} - 다음 실행 때 다시 시도", file=sys.stderr)
+            return
+
+        if total_pages is None:
+            total_pages = max(1, (result["totalCount"] + ROWS_PER_PAGE - 1) // ROWS_PER_PAGE)
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO sweeps (operation, sigungu_cd, bjdong_cd, total_count, total_pages, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (op_name, sigungu_cd, bjdong_cd, result["totalCount"], total_pages, time.time()),
+                )
+
+        save_page(db, op_name, sigungu_cd, bjdong_cd, page_no, result["items"])
+        print(f"  {op_name} {sigungu_cd}-{bjdong_cd} page {page_no}/{total_pages} ({len(result['items'])}건)")
+        page_no += 1
+        if args.delay:
+            time.sleep(args.delay)
+
+
+def print_status(db: sqlite3.Connection) -> None:
+    """수집 진행 상황 출력"""
+    rows = db.execute(
+        "SELECT s.operation, s.sigungu_cd, s.bjdong_cd, s.total_count, s.total_pages,"
+        " (SELECT COUNT(*) FROM pages p WHERE p.operation = s.operation"
+        "  AND p.sigungu_cd = s.sigungu_cd AND p.bjdong_cd = s.bjdong_cd)"
+        " FROM sweeps s ORDER BY s.sigungu_cd, s.bjdong_cd, s.operation"
+    ).fetchall()
+    if not rows:
+        print("수집 기록이 없습니다.")
+        return
+    for op_name, sigungu_cd, bjdong_cd, total_count, total_pages, done in rows:
+        mark = "완료" if done >= total_pages else "진행중"
+        print(f"{sigungu_cd}-{bjdong_cd} {op_name}: {done}/{total_pages} 페이지, 총 {total_count}건 [{mark}]")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sigungu", help="시군구코드 5자리 (예: 11680)")
+    parser.add_argument("--bjdong", nargs="*", default=[], help="법정동코드 5자리 목록 (예: 10300 10600)")
+    parser.add_argument("--bjdong-file", help="법정동코드 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--all-bjdong", action="store_true", help="법정동코드 색인에 있는 시군구의 모든 법정동")
+    parser.add_argument("--operations", nargs="*", default=["총괄표제부"], help="수집할 오퍼레이션 (기본: 총괄표제부)")
+    parser.add_argument("--plat-gb-cd", default="0", help="대지구분코드 (0: 대지, 1: 산, 2: 블록)")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help=f"저장할 SQLite 파일 (기본: {DEFAULT_DB_PATH})")
+    parser.add_argument("--delay", type=float, default=0.0, help="페이지 요청 사이 대기 시간(초)")
+    parser.add_argument("--retries", type=int, default=3, help="일시적 오류 재시도 횟수 (기본: 3)")
+    parser.add_argument("--backoff", type=float, default=5.0, help="재시도 기본 대기 시간(초), 재시도마다 2배")
+    parser.add_argument("--status", action="store_true", help="수집 진행 상황만 출력")
+    args = parser.parse_args()
+
+    db = open_store(args.db)
+    if args.status:
+        print_status(db)
+        return
+
+    bjdong_codes = list(args.bjdong)
+    if args.bjdong_file:
+        with open(args.bjdong_file, encoding="utf-8") as f:
+            bjdong_codes += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    if args.all_bjdong and args.sigungu:
+        found = [code[5:] for code, *_ in bjdong_index.search(args.sigungu, limit=10000)]
+        if not found:
+            parser.error(
+                f"법정동코드 색인({bjdong_index.path or '없음'})에 {args.sigungu} 의 법정동이 없습니다. "
+                "build_bjdong_index.py 로 최신 전체자료 색인을 생성하세요."
+            )
+        bjdong_codes += [code for code in found if code not in bjdong_codes]
+    if not args.sigungu or not bjdong_codes:
+        parser.error("--sigungu 와 --bjdong (또는 --bjdong-file, --all-bjdong) 를 지정하세요.")
+
+    unknown = [name for name in args.operations if name not in OPERATIONS]
+    if unknown:
+        parser.error(f"알 수 없는 오퍼레이션: {', '.join(unknown)} (가능한 값: {', '.join(OPERATIONS)})")
+
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        sys.exit("오류: DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다.")
+
+    limiter = get_rate_limiter(api_key)
+    for op_name in args.operations:
+        remaining = limiter.remaining(OPERATIONS[op_name])
+        if remaining is not None:
+            print(f"{op_name}: 오늘 남은 호출 가능 건수 {remaining:,}건")
+
+    started = time.time()
+    try:
+        for bjdong_cd in bjdong_codes:
+            for op_name in args.operations:
+                sweep(db, op_name, args.sigungu, bjdong_cd, args)
+    except QuotaExceeded as e:
+        print(f"\n중단: {e}", file=sys.stderr)
+        print("같은 명령으로 다시 실행하면 완료된 페이지는 건너뛰고 이어서 수집합니다.", file=sys.stderr)
+        sys.exit(2)
+    except KeyboardInterrupt:
+        print("\n중단됨 - 같은 명령으로 다시 실행하면 이어서 수집합니다.", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        fetched = db.execute("SELECT COUNT(*) FROM pages WHERE fetched_at >= ?", (started,)).fetchone()[0]
+        print(f"\n새로 받은 페이지: {fetched}개 (저장소: {args.db})")
+
+    print_status(db)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,48 @@
 """
 
 import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import asyncio
+import select
+import bisect
+import contextlib
+import collections
+import threading
 import http.client
 import urllib.parse
 import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+import httpx
+import numpy as np
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
 # 환경 변수 로드 (.env)
 load_dotenv()
 
-mcp = FastMCP("building-register")
 
-API_BASE_URL = "https://apis.data.go.kr/1613000/BldRgstHubService"
+
+@contextlib.asynccontextmanager
+async def server_lifespan(server: FastMCP):
+    """서버가 도는 동안 비동기 HTTP 클라이언트를 유지하고, 종료할 때 그 루프에서 커넥션 정리"""
+    try:
+        yield
+    finally:
+        await async_executor.aclose()
+
+
+mcp = FastMCP("building-register", lifespan=server_lifespan)
+
+# httpx 요청 로그에 serviceKey 가 그대로 노출되지 않도록 INFO 로그 끔
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# data.go.kr 주소 - 로컬 대역 서버(bench/standin.py)로 테스트할 때 DATA_GO_KR_BASE_URL 로 변경
+DATA_GO_KR_BASE_URL = os.environ.get("DATA_GO_KR_BASE_URL", "https://apis.data.go.kr").rstrip("/")
+API_BASE_URL = f"{DATA_GO_KR_BASE_URL}/1613000/BldRgstHubService"
 
 # 오퍼레이션 목록
 OPERATIONS = {
@@ -33,59 +63,113 @@ OPERATIONS = {
 }
 
 
-def parse_xml_response(xml_text: str) -> dict:
-    """XML 응답을 파싱하여 딕셔너리로 반환"""
-    try:
-        root = ET.fromstring(xml_text)
+# 공공데이터포털 표준 결과 코드
+RESULT_CODE_MESSAGES = {
+    "01": "어플리케이션 에러",
+    "02": "DB 에러",
+    "03": "데이터 없음",
+    "04": "HTTP 에러",
+    "05": "서비스 연결 실패",
+    "10": "잘못된 요청 파라미터",
+    "11": "필수 파라미터 누락",
+    "12": "서비스키 인증 실패",
+    "20": "트래픽 초과",
+    "21": "일일 호출건수 초과",
+    "22": "서비스 시간 외",
+    "30": "등록되지 않은 서비스키",
+    "31": "기한만료된 서비스키",
+    "32": "등록되지 않은 IP",
+}
+
+PARSE_CHUNK_SIZE = 16384
 
-        result_code = root.findtext(".//resultCode", "")
-        result_msg = root.findtext(".//resultMsg", "")
-        total_count = int(root.findtext(".//totalCount", "0"))
-        num_of_rows = int(root.findtext(".//numOfRows", "10"))
-        page_no = int(root.findtext(".//pageNo", "1"))
+HEADER_FIELDS = ("resultCode", "resultMsg", "totalCount", "numOfRows", "pageNo")
 
+
+class StreamingXMLParser:
+    """data.go.kr XML 응답을 한 번의 패스로 파싱하는 스트리밍 파서
+
+    응답 본문을 받는 대로 feed() 로 넣으면 헤더 필드와 item 을 동시에 수집하고,
+    처리한 item 요소는 바로 비워서 페이지 크기와 상관없이 트리 메모리가 늘지 않습니다.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("end",))
+        self._header = {}
+        self._items = []
+        self._head = b""
+        self._error = None
+
+    def feed(self, chunk: bytes) -> None:
+        """응답 본문 일부를 파싱"""
+        if self._error is not None:
+            return
+        if len(self._head) < 1000:
+            self._head += chunk[:1000 - len(self._head)]
+        try:
+            self._parser.feed(chunk)
+            self._drain()
+        except ET.ParseError as e:
+            self._error = e
+
+    def _drain(self) -> None:
+        """완성된 요소를 꺼내 헤더/항목으로 변환"""
+        header = self._header
+        items = self._items
+        for _, elem in self._parser.read_events():
+            tag = elem.tag
+            if tag == "item":
+                item_dict = {child.tag: child.text.strip() for child in elem if child.text}
+                if item_dict:
+                    items.append(item_dict)
+                elem.clear()
+            elif tag == "items":
+                elem.clear()
+            elif tag in HEADER_FIELDS and tag not in header:
+                header[tag] = elem.text or ""
+
+    def close(self) -> dict:
+        """파싱을 마치고 parse_xml_response 와 같은 형태의 결과 반환"""
+        if self._error is None:
+            try:
+                self._parser.close()
+                self._drain()
+            except ET.ParseError as e:
+                self._error = e
+        if self._error is not None:
+            return {"error": f"XML 파싱 오류: {self._error}", "raw": self._head.decode("utf-8", errors="replace")}
+
+        header = self._header
+        result_code = header.get("resultCode", "")
+        result_msg = header.get("resultMsg", "")
         result = {
             "resultCode": result_code,
             "resultMsg": result_msg,
-            "totalCount": total_count,
-            "numOfRows": num_of_rows,
-            "pageNo": page_no,
-            "items": []
+            "totalCount": int(header.get("totalCount") or 0),
+            "numOfRows": int(header.get("numOfRows") or 10),
+            "pageNo": int(header.get("pageNo") or 1),
+            "items": [],
         }
 
         # 에러 체크
         if result_code and result_code != "00":
-            error_msgs = {
-                "01": "어플리케이션 에러",
-                "02": "DB 에러",
-                "03": "데이터 없음",
-                "04": "HTTP 에러",
-                "05": "서비스 연결 실패",
-                "10": "잘못된 요청 파라미터",
-                "11": "필수 파라미터 누락",
-                "12": "서비스키 인증 실패",
-                "20": "트래픽 초과",
-                "21": "일일 호출건수 초과",
-                "22": "서비스 시간 외",
-                "30": "등록되지 않은 서비스키",
-                "31": "기한만료된 서비스키",
-                "32": "등록되지 않은 IP",
-            }
-            result["error"] = error_msgs.get(result_code, f"알 수 없는 오류 (코드: {result_code}, 메시지: {result_msg})")
+            result["error"] = RESULT_CODE_MESSAGES.get(
+                result_code, f"알 수 없는 오류 (코드: {result_code}, 메시지: {result_msg})"
+            )
             return result
 
-        # 항목들 파싱
-        for item in root.iter("item"):
-            item_dict = {}
-            for child in item:
-                if child.text:
-                    item_dict[child.tag] = child.text.strip()
-            if item_dict:
-                result["items"].append(item_dict)
-
+        result["items"] = self._items
         return result
-    except ET.ParseError as e:
-        return {"error": f"XML 파싱 오류: {e}", "raw": xml_text[:1000]}
+
+
+def parse_xml_response(xml_data: str | bytes) -> dict:
+    """XML 응답을 파싱하여 딕셔너리로 반환"""
+    data = memoryview(xml_data.encode("utf-8") if isinstance(xml_data, str) else xml_data)
+    parser = StreamingXMLParser()
+    # 한 번에 넣으면 이벤트가 모두 쌓였다가 처리되므로 나눠서 feed (최대 메모리 유지)
+    for offset in range(0, len(data), PARSE_CHUNK_SIZE):
+        parser.feed(data[offset:offset + PARSE_CHUNK_SIZE])
+    return parser.close()
 
 
 def format_area(area_str: str) -> str:
@@ -517,45 +601,1370 @@ def format_jijugu_result(result: dict, sigungu_cd: str, bjdong_cd: str, bun: str
     return "\n".join(output)
 
 
+def format_generic_result(result: dict, title: str, sigungu_cd: str, bjdong_cd: str, bun: str, ji: str) -> str:
+    """전용 포맷터가 없는 오퍼레이션(부속지번, 전유공용면적, 오수정화시설) 결과 포맷팅"""
+    if "error" in result:
+        return f"오류: {result['error']}"
+
+    total = result["totalCount"]
+    page_no = result["pageNo"]
+    num_of_rows = result["numOfRows"]
+    total_pages = (total + num_of_rows - 1) // num_of_rows if total > 0 else 1
+
+    output = [f"## 건축물대장 {title} 조회 결과"]
+    output.append(f"- 시군구코드: {sigungu_cd}, 법정동코드: {bjdong_cd}")
+    if bun:
+        output.append(f"- 번: {bun}, 지: {ji or '0000'}")
+    output.append(f"- **총 {total}건 (page {page_no}/{total_pages})**\n")
+
+    if not result["items"]:
+        output.append("검색 결과가 없습니다.")
+        return "\n".join(output)
+
+    for i, item in enumerate(result["items"], 1):
+        output.append(f"### {i}. {item.get('bldNm') or item.get('platPlc', '-')}")
+        for key, value in item.items():
+            if key not in ("bldNm", "rnum"):
+                output.append(f"- {key}: {value}")
+        output.append("")
+
+    if page_no < total_pages:
+        output.append(f"\n※ 더 보려면 page_no={page_no + 1} 로 조회하세요.")
+
+    return "\n".join(output)
+
+
+# 오퍼레이션별 결과 포맷터 (전용 포맷터가 없으면 format_generic_result 사용)
+FORMATTERS = {
+    "기본개요": format_basis_result,
+    "총괄표제부": format_recap_title_result,
+    "표제부": format_title_result,
+    "층별개요": format_floor_result,
+    "전유부": format_expos_result,
+    "주택가격": format_hsprc_result,
+    "지역지구구역": format_jijugu_result,
+}
+
+
+def format_operation_result(op_name: str, result: dict, sigungu_cd: str, bjdong_cd: str, bun: str, ji: str) -> str:
+    """오퍼레이션 이름에 맞는 포맷터로 결과 포맷팅"""
+    formatter = FORMATTERS.get(op_name)
+    if formatter is None:
+        return format_generic_result(result, op_name, sigungu_cd, bjdong_cd, bun, ji)
+    return formatter(result, sigungu_cd, bjdong_cd, bun, ji)
+
+
+_api_url = urllib.parse.urlsplit(API_BASE_URL)
+API_HOST = _api_url.netloc
+API_PATH = _api_url.path
+API_USE_TLS = _api_url.scheme == "https"
+API_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; BuildingRegisterBot/1.0)",
+    "Accept": "*/*",
+}
+
+# 커넥션 풀 설정 (환경변수로 조정 가능)
+POOL_MAX_SIZE = int(os.environ.get("BUILDING_POOL_MAX_SIZE", "4"))
+POOL_IDLE_TIMEOUT = float(os.environ.get("BUILDING_POOL_IDLE_TIMEOUT", "60"))
+# 연결(TCP+TLS)과 소켓 읽기 시간 제한을 따로 적용 - BUILDING_POOL_TIMEOUT 은 예전 이름 (읽기 제한)
+CONNECT_TIMEOUT = float(os.environ.get("BUILDING_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.environ.get("BUILDING_READ_TIMEOUT", os.environ.get("BUILDING_POOL_TIMEOUT", "30")))
+
+# 비동기 호출 동시 요청 수 제한 (data.go.kr 트래픽 한도 보호)
+MAX_CONCURRENCY = int(os.environ.get("BUILDING_MAX_CONCURRENCY", "10"))
+
+# 전체 페이지 조회(fetch_all) 설정 - 호출 1건이 동시에 요청하는 페이지 수 / 최대 페이지 수
+PAGE_FETCH_CONCURRENCY = int(os.environ.get("BUILDING_PAGE_FETCH_CONCURRENCY", "5"))
+MAX_FETCH_ALL_PAGES = int(os.environ.get("BUILDING_MAX_FETCH_ALL_PAGES", "100"))
+
+# 응답 캐시 설정 - TTL 0 이면 캐시 사용 안 함
+CACHE_PATH = os.path.expanduser(
+    os.environ.get("BUILDING_CACHE_PATH", "~/.cache/building-register/responses.sqlite3")
+)
+CACHE_MAX_BYTES = int(os.environ.get("BUILDING_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
+CACHE_DEFAULT_TTL = float(os.environ.get("BUILDING_CACHE_TTL", str(7 * 24 * 3600)))
+
+# 오퍼레이션별 캐시 TTL(초) - 건축물대장은 거의 바뀌지 않지만 주택가격은 매년 공시됨
+CACHE_TTLS = {
+    "getBrHsprcInfo": 24 * 3600,
+}
+# BUILDING_CACHE_TTLS="getBrHsprcInfo=3600,getBrExposInfo=86400" 형식으로 덮어쓰기
+for _entry in filter(None, os.environ.get("BUILDING_CACHE_TTLS", "").split(",")):
+    _operation, _, _ttl = _entry.partition("=")
+    CACHE_TTLS[_operation.strip()] = float(_ttl)
+
+# 호출 속도/일일 호출건수 제한 (real-estate-transaction 서버와 같은 집계 파일 공유)
+RATE_LIMIT = float(os.environ.get("DATA_GO_KR_RATE_LIMIT", "10"))
+RATE_BURST = int(os.environ.get("DATA_GO_KR_BURST", "10"))
+DAILY_LIMIT = int(os.environ.get("DATA_GO_KR_DAILY_LIMIT", "10000"))
+QUOTA_PATH = os.path.expanduser(
+    os.environ.get("DATA_GO_KR_QUOTA_PATH", "~/.cache/data-go-kr/quota.sqlite3")
+)
+
+# 계측 - 경로를 지정하면 Prometheus 텍스트 파일로 주기적으로 저장
+METRICS_PATH = os.path.expanduser(os.environ.get("BUILDING_METRICS_PATH", ""))
+METRICS_DUMP_INTERVAL = float(os.environ.get("BUILDING_METRICS_DUMP_INTERVAL", "15"))
+
+# 법정동코드 색인 (build_bjdong_index.py 로 새로 만든 색인, 없으면 함께 배포한 전국 색인) 과
+# 색인에서 못 찾은 지명을 검색할 때 쓰는 법정동코드 API
+BJDONG_INDEX_PATH = os.path.expanduser(
+    os.environ.get("BUILDING_BJDONG_INDEX_PATH", "~/.cache/building-register/bjdong_codes.tsv")
+)
+BUNDLED_BJDONG_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bjdong_codes.tsv")
+REGION_CODE_SERVICE = "getStanReginCdList"
+REGION_CODE_PATH = urllib.parse.urlsplit(DATA_GO_KR_BASE_URL).path + "/1741000/StanReginCd/getStanReginCdList"
+
+# 오퍼레이션별 카운터 이름과 설명 (Prometheus HELP)
+METRIC_COUNTERS = {
+    "requests": "Upstream requests sent to data.go.kr",
+    "cache_hits": "Calls answered from the response cache",
+    "coalesced": "Calls that shared an identical in-flight upstream request",
+    "response_bytes": "Response body bytes received",
+    "items": "Items parsed from responses",
+}
+
+
+class HTTPSConnectionPool:
+    """apis.data.go.kr 용 keep-alive HTTPS 커넥션 풀 (thread-safe)
+
+    - 최대 max_size 개의 커넥션만 동시에 사용 (초과 요청은 반납될 때까지 대기)
+    - idle_timeout 초 이상 쉬고 있던 커넥션은 폐기
+    - 재사용 전 소켓 상태를 확인하고, 서버가 끊은 커넥션은 새로 연결
+      (확인과 close() 는 풀 잠금을 놓은 뒤 수행 - 느린 소켓 하나가 다른 스레드를 막지 않음)
+    - 시간 제한을 따로 적용: connect_timeout (TCP+TLS 연결), read_timeout (소켓 읽기 한 번)
+    - 오류/비정상 응답 시 커넥션을 닫고 풀에 반납하지 않음
+    """
+
+    def __init__(
+        self, host: str, max_size: int = 4, idle_timeout: float = 60.0,
+        connect_timeout: float = 5.0, read_timeout: float = 30.0, use_tls: bool = True,
+    ):
+        self.host = host
+        self.use_tls = use_tls
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._idle = []  # [(conn, last_used), ...] - 최근 반납한 커넥션이 뒤쪽
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._stats = {
+            "requests": 0,
+            "reused": 0,
+            "created": 0,
+            "evicted_idle": 0,
+            "evicted_unhealthy": 0,
+            "closed_on_error": 0,
+            "handshake_total_ms": 0.0,
+            "handshake_max_ms": 0.0,
+            "handshake_last_ms": 0.0,
+        }
+
+    @staticmethod
+    def _is_healthy(conn: http.client.HTTPSConnection) -> bool:
+        """소켓이 살아 있는지 확인 (읽을 데이터가 있으면 EOF/에러로 간주)"""
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def _connect(self) -> http.client.HTTPSConnection:
+        """새 커넥션 생성 후 TCP+TLS 핸드셰이크 시간 기록"""
+        connection_class = http.client.HTTPSConnection if self.use_tls else http.client.HTTPConnection
+        conn = connection_class(self.host, timeout=self.connect_timeout)
+        started = time.perf_counter()
+        conn.connect()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        conn.sock.settimeout(self.read_timeout)
+        with self._lock:
+            self._stats["created"] += 1
+            self._stats["handshake_total_ms"] += elapsed_ms
+            self._stats["handshake_last_ms"] = elapsed_ms
+            self._stats["handshake_max_ms"] = max(self._stats["handshake_max_ms"], elapsed_ms)
+        return conn
+
+    def _acquire(self) -> tuple:
+        """풀에서 커넥션을 꺼냄. 반환값: (conn, reused)"""
+        now = time.monotonic()
+        while True:
+            # 잠금은 목록에서 꺼낼 때만 잡고, 소켓 확인/close() 는 잠금 밖에서
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            if now - last_used > self.idle_timeout:
+                evicted = "evicted_idle"
+            elif not self._is_healthy(conn):
+                evicted = "evicted_unhealthy"
+            else:
+                with self._lock:
+                    self._stats["reused"] += 1
+                return conn, True
+            conn.close()
+            with self._lock:
+                self._stats[evicted] += 1
+        return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPSConnection) -> None:
+        """사용이 끝난 커넥션을 풀에 반납"""
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+    def _discard(self, conn: http.client.HTTPSConnection) -> None:
+        """오류가 난 커넥션을 닫고 폐기"""
+        conn.close()
+        with self._lock:
+            self._stats["closed_on_error"] += 1
+
+    def request(self, method: str, path: str, headers: dict | None = None, timings: dict | None = None) -> tuple:
+        """요청을 보내고 (status, reason, body bytes) 반환
+
+        재사용한 커넥션이 서버 측에서 이미 끊겨 있던 경우 새 커넥션으로 1회 재시도합니다.
+        timings 를 넘기면 queue/connect/wait/body 단계 시간(ms)과 bytes 를 채워 줍니다.
+        """
+        timings = {} if timings is None else timings
+        started = time.perf_counter()
+        self._slots.acquire()
+        timings["queue"] = timings.get("queue", 0.0) + (time.perf_counter() - started) * 1000
+        try:
+            with self._lock:
+                self._stats["requests"] += 1
+            for attempt in range(2):
+                started = time.perf_counter()
+                conn, reused = self._acquire()
+                if not reused:
+                    timings["connect"] = (time.perf_counter() - started) * 1000
+                try:
+                    started = time.perf_counter()
+                    conn.request(method, path, headers=headers or {})
+                    response = conn.getresponse()
+                    headers_at = time.perf_counter()
+                    body = response.read()
+                    timings["wait"] = (headers_at - started) * 1000
+                    timings["body"] = (time.perf_counter() - headers_at) * 1000
+                    timings["bytes"] = len(body)
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    self._discard(conn)
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except Exception:
+                    self._discard(conn)
+                    raise
+
+                if response.status != 200:
+                    self._discard(conn)
+                elif response.will_close:
+                    conn.close()
+                else:
+                    self._release(conn)
+                return response.status, response.reason, body
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """풀에 남은 커넥션을 모두 닫음"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def stats(self) -> dict:
+        """재사용률, 핸드셰이크 시간 등 풀 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = len(self._idle)
+        stats["max_size"] = self.max_size
+        stats["reuse_rate"] = stats["reused"] / stats["requests"] if stats["requests"] else 0.0
+        stats["handshake_avg_ms"] = (
+            stats["handshake_total_ms"] / stats["created"] if stats["created"] else 0.0
+        )
+        return stats
+
+
+# 모든 search_building_* 도구가 공유하는 커넥션 풀
+connection_pool = HTTPSConnectionPool(
+    API_HOST,
+    max_size=POOL_MAX_SIZE,
+    idle_timeout=POOL_IDLE_TIMEOUT,
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+    use_tls=API_USE_TLS,
+)
+
+
+class ResponseCache:
+    """SQLite 기반 영구 응답 캐시 (오퍼레이션별 TTL, 용량 초과 시 LRU 제거)
+
+    - 키: 오퍼레이션 + 정규화한 파라미터 (번/지 4자리 0 채움, 공백 제거, 키 정렬)
+    - 값: 파싱된 결과 dict (JSON)
+    - resultCode 가 "00" 이 아니거나 오류가 있는 결과는 저장하지 않음
+    """
+
+    def __init__(self, path: str, max_bytes: int, default_ttl: float, ttls: dict | None = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self._lock = threading.Lock()
+        self._db = None
+        self._total_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "stores": 0, "evictions": 0, "skipped_errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.default_ttl > 0 and self.max_bytes > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 파일은 첫 사용 시점에 열어 서버 시작을 늦추지 않음"""
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, operation TEXT NOT NULL, value TEXT NOT NULL,"
+                " size INTEGER NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+            db.commit()
+            self._total_bytes = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            self._db = db
+        return self._db
+
+    @staticmethod
+    def make_key(operation: str, params: dict) -> str:
+        """오퍼레이션과 정규화된 파라미터로 캐시 키 생성"""
+        normalized = {}
+        for key, value in params.items():
+            value = str(value).strip()
+            if key in ("bun", "ji") and value:
+                value = value.zfill(4)
+            if value:
+                normalized[key] = value
+        return operation + "?" + urllib.parse.urlencode(sorted(normalized.items()))
+
+    def ttl_for(self, operation: str) -> float:
+        return self.ttls.get(operation, self.default_ttl)
+
+    def get(self, operation: str, params: dict) -> dict | None:
+        """캐시 조회 - 없거나 만료되었으면 None"""
+        if not self.enabled:
+            return None
+        key = self.make_key(operation, params)
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            row = db.execute("SELECT value, size, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            value, size, expires_at = row
+            if expires_at <= now:
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                db.commit()
+                self._total_bytes -= size
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            db.commit()
+            self._stats["hits"] += 1
+        return json.loads(value)
+
+    def put(self, operation: str, params: dict, result: dict) -> None:
+        """정상 결과만 저장하고, 용량을 넘으면 가장 오래 안 쓴 항목부터 제거"""
+        if not self.enabled:
+            return
+        if "error" in result or result.get("resultCode") not in ("", "00"):
+            with self._lock:
+                self._stats["skipped_errors"] += 1
+            return
+        ttl = self.ttl_for(operation)
+        if ttl <= 0:
+            return
+
+        key = self.make_key(operation, params)
+        value = json.dumps(result, ensure_ascii=False)
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            old = db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if old:
+                self._total_bytes -= old[0]
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, operation, value, size, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, operation, value, size, now + ttl, now),
+            )
+            self._total_bytes += size
+            self._stats["stores"] += 1
+            self._evict(db)
+            db.commit()
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        """용량 예산을 넘으면 last_access 가 오래된 순으로 제거 (lock 보유 상태에서 호출)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, size in db.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+            db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= size
+            self._stats["evictions"] += 1
+            if self._total_bytes <= self.max_bytes:
+                break
+
+    def stats(self) -> dict:
+        """적중/미스 등 캐시 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] if self._db else 0
+            stats["bytes"] = self._total_bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["entries"] = entries
+        stats["max_bytes"] = self.max_bytes
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["enabled"] = self.enabled
+        stats["path"] = self.path
+        return stats
+
+
+# 동기/비동기 호출이 공유하는 응답 캐시
+response_cache = ResponseCache(CACHE_PATH, CACHE_MAX_BYTES, CACHE_DEFAULT_TTL, CACHE_TTLS)
+
+
+class RequestCoalescer:
+    """동일한 요청의 중복 전송 방지 (single-flight)
+
+    - 키: 오퍼레이션 + 정규화한 파라미터 (ResponseCache.make_key 와 동일)
+    - 같은 키의 요청이 이미 진행 중이면 새로 보내지 않고 그 결과를 기다렸다가 함께 받음
+    - 동기 호출(스레드)과 비동기 호출(이벤트 루프)은 각각 따로 병합
+    - 대기자에게는 결과 dict 와 items 목록을 복사해서 돌려주므로 호출자끼리 서로 영향을 주지 않음
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> {"done": threading.Event, "result": dict | None}
+        self._futures = {}  # (loop, key) -> asyncio.Future
+        self._stats = {"leaders": 0, "coalesced": 0, "max_waiters": 0}
+        self._waiters = collections.Counter()
+
+    @staticmethod
+    def _share(result: dict) -> dict:
+        if "items" in result:
+            return dict(result, items=list(result["items"]))
+        return dict(result)
+
+    def _joined(self, key) -> None:
+        """대기자 1명 추가 (lock 보유 상태에서 호출)"""
+        self._stats["coalesced"] += 1
+        self._waiters[key] += 1
+        self._stats["max_waiters"] = max(self._stats["max_waiters"], self._waiters[key])
+
+    def do(self, operation: str, params: dict, fn) -> tuple:
+        """fn() 을 키당 한 번만 실행. (결과, 병합 여부) 반환"""
+        key = ResponseCache.make_key(operation, params)
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = {"done": threading.Event(), "result": None}
+                self._calls[key] = call
+                self._stats["leaders"] += 1
+                leader = True
+            else:
+                self._joined(key)
+                leader = False
+
+        if not leader:
+            call["done"].wait()
+            return self._share(call["result"]), True
+
+        try:
+            call["result"] = fn()
+        except Exception as e:
+            call["result"] = {"error": f"오류: {e}"}
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                self._waiters.pop(key, None)
+            call["done"].set()
+        return call["result"], False
+
+    async def do_async(self, operation: str, params: dict, fn) -> tuple:
+        """await fn() 을 이벤트 루프·키당 한 번만 실행. (결과, 병합 여부) 반환"""
+        key = (asyncio.get_running_loop(), ResponseCache.make_key(operation, params))
+        future = self._futures.get(key)
+        if future is not None:
+            with self._lock:
+                self._joined(key)
+            # 먼저 요청한 쪽이 취소되어도 대기자에게 취소가 전파되지 않도록 shield
+            return self._share(await asyncio.shield(future)), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        with self._lock:
+            self._stats["leaders"] += 1
+        try:
+            result = await fn()
+        except BaseException as e:
+            if not future.done():
+                future.set_result({"error": f"오류: {e}" if isinstance(e, Exception) else "오류: 요청이 취소되었습니다."})
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._futures[key]
+            with self._lock:
+                self._waiters.pop(key, None)
+        return result, False
+
+    def stats(self) -> dict:
+        """병합 통계 - coalesced 가 절약한 업스트림 요청 수"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls) + len(self._futures)
+        calls = stats["leaders"] + stats["coalesced"]
+        stats["saved_rate"] = stats["coalesced"] / calls if calls else 0.0
+        return stats
+
+
+# 동기/비동기 호출이 공유하는 중복 요청 병합기
+request_coalescer = RequestCoalescer()
+
+
+class RateLimiter:
+    """API 키·서비스별 토큰 버킷 + 일일 호출건수 집계 (집계는 디스크에 저장되어 프로세스 간 공유)
+
+    - 초당 rate 건, 최대 burst 건까지 몰아서 요청 가능
+    - resultCode 20(트래픽 초과) 응답을 받으면 요청 속도를 절반으로 낮추고 잠시 멈춘 뒤,
+      정상 응답이 이어지면 조금씩 원래 속도로 회복
+    - 실제로 전송한 요청 수를 서비스별/일자별(KST)로 기록하고, daily_limit 에 도달하거나
+      resultCode 21(일일 호출건수 초과)을 받으면 그날은 더 요청하지 않음
+    - 한도 판정에는 응답을 기다리는 예약 건수도 포함 (동시 요청이 한도를 넘지 않도록)
+      예약은 record() 로 사용량에 반영되거나, 요청을 보내지 못했으면 release() 로 취소
+
+    building-register/server.py 와 real-estate-transaction/server.py 에 같은 코드가 있음 (서버를 파일 하나로
+    따로 배포하므로 모듈을 공유하지 않음) - 고칠 때는 두 파일을 똑같이 고칠 것, 같은지는 테스트에서 확인
+    """
+
+    MIN_RATE = 0.2
+    MAX_BACKOFF = 60.0
+
+    def __init__(self, api_key: str, path: str, rate: float, burst: int, daily_limit: int):
+        self.key_id = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+        self.path = path
+        self.base_rate = max(self.MIN_RATE, rate)
+        self.burst = max(1, burst)
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._buckets = {}  # service -> {"tokens", "updated", "rate", "paused_until", "backoff"}
+        self._in_flight = collections.Counter()  # service -> 예약했지만 아직 record/release 하지 않은 요청 수
+        self._db = None
+        self._stats = {"throttled": 0, "throttled_wait_s": 0.0, "traffic_errors": 0, "quota_rejections": 0}
+
+    @staticmethod
+    def today() -> str:
+        """data.go.kr 일일 호출건수는 한국 시간 자정에 초기화"""
+        return datetime.now(timezone(timedelta(hours=9))).strftime("%Y%m%d")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS daily_usage ("
+                " key_id TEXT NOT NULL, service TEXT NOT NULL, day TEXT NOT NULL, used INTEGER NOT NULL,"
+                " exhausted INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (key_id, service, day))"
+            )
+            db.commit()
+            self._db = db
+        return self._db
+
+    def _usage(self, service: str) -> tuple:
+        """(오늘 사용 건수, 소진 여부) - lock 보유 상태에서 호출"""
+        row = self._connect().execute(
+            "SELECT used, exhausted FROM daily_usage WHERE key_id = ? AND service = ? AND day = ?",
+            (self.key_id, service, self.today()),
+        ).fetchone()
+        return (row[0], bool(row[1])) if row else (0, False)
+
+    def reserve(self, service: str) -> tuple:
+        """요청 1건을 예약. (대기해야 할 초, 오류 메시지) 반환 - 오류가 있으면 요청하지 말 것"""
+        now = time.monotonic()
+        with self._lock:
+            used, exhausted = self._usage(service)
+            used += self._in_flight[service]
+            if exhausted or (self.daily_limit and used >= self.daily_limit):
+                self._stats["quota_rejections"] += 1
+                return 0.0, f"일일 호출건수 한도 소진 ({service}: {used}/{self.daily_limit}건, 한국시간 자정에 초기화)"
+
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                bucket = {"tokens": float(self.burst), "updated": now, "rate": self.base_rate, "paused_until": 0.0, "backoff": 0.0}
+                self._buckets[service] = bucket
+
+            bucket["tokens"] = min(self.burst, bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"])
+            bucket["updated"] = now
+            bucket["tokens"] -= 1
+            # 토큰이 모자라면 음수로 두고 그만큼 기다리게 함 (대기 순서대로 예약됨)
+            wait = max(0.0, -bucket["tokens"] / bucket["rate"], bucket["paused_until"] - now)
+            if wait > 0:
+                self._stats["throttled"] += 1
+                self._stats["throttled_wait_s"] += wait
+            self._in_flight[service] += 1
+            return wait, None
+
+    def release(self, service: str) -> None:
+        """요청을 보내지 못한 예약 취소 (취소, 네트워크 오류 등)"""
+        with self._lock:
+            self._settle(service)
+
+    def _settle(self, service: str) -> None:
+        """예약 1건 정리 - lock 보유 상태에서 호출"""
+        if self._in_flight[service] > 0:
+            self._in_flight[service] -= 1
+
+    def record(self, service: str, result_code: str) -> None:
+        """실제로 전송한 요청 결과 기록 (예약을 일일 사용량으로 옮기고, 트래픽 초과 시 속도 조절)"""
+        with self._lock:
+            self._settle(service)
+            db = self._connect()
+            db.execute(
+                "INSERT INTO daily_usage (key_id, service, day, used) VALUES (?, ?, ?, 1)"
+                " ON CONFLICT (key_id, service, day) DO UPDATE SET used = used + 1",
+                (self.key_id, service, self.today()),
+            )
+            if result_code == "21":
+                db.execute(
+                    "UPDATE daily_usage SET exhausted = 1 WHERE key_id = ? AND service = ? AND day = ?",
+                    (self.key_id, service, self.today()),
+                )
+            db.commit()
+
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                return
+            if result_code == "20":
+                # 트래픽 초과: 속도 절반 + 지수 백오프
+                self._stats["traffic_errors"] += 1
+                bucket["rate"] = max(self.MIN_RATE, bucket["rate"] / 2)
+                bucket["backoff"] = min(self.MAX_BACKOFF, bucket["backoff"] * 2 or 1.0)
+                bucket["paused_until"] = time.monotonic() + bucket["backoff"]
+                bucket["tokens"] = min(bucket["tokens"], 0.0)
+            elif result_code in ("", "00", "03"):
+                # 정상 응답: 원래 속도로 조금씩 회복
+                bucket["rate"] = min(self.base_rate, bucket["rate"] + self.base_rate * 0.1)
+                bucket["backoff"] = 0.0
+
+    def _headroom(self, used: int, exhausted: bool) -> int | None:
+        """남은 호출 가능 건수 - used 는 응답 대기 중인 예약 포함 (한도 미설정 시 None)"""
+        if exhausted:
+            return 0
+        if not self.daily_limit:
+            return None
+        return max(0, self.daily_limit - used)
+
+    def remaining(self, service: str) -> int | None:
+        """오늘 남은 호출 가능 건수 (예약 포함, 한도 미설정 시 None)"""
+        with self._lock:
+            used, exhausted = self._usage(service)
+            used += self._in_flight[service]
+        return self._headroom(used, exhausted)
+
+    def usage_today(self) -> dict:
+        """오늘 서비스별 사용 건수 {service: (used, remaining)} - remaining 은 reserve() 와 같이 예약도 뺀 값"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT service, used, exhausted FROM daily_usage WHERE key_id = ? AND day = ?",
+                (self.key_id, self.today()),
+            ).fetchall()
+            in_flight = {service: count for service, count in self._in_flight.items() if count}
+        usage = {}
+        for service, used, exhausted in rows:
+            usage[service] = (used, self._headroom(used + in_flight.pop(service, 0), bool(exhausted)))
+        for service, count in in_flight.items():
+            usage[service] = (0, self._headroom(count, False))
+        return dict(sorted(usage.items()))
+
+    def stats(self) -> dict:
+        """속도 제한 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["current_rates"] = {service: bucket["rate"] for service, bucket in self._buckets.items()}
+        stats["base_rate"] = self.base_rate
+        stats["burst"] = self.burst
+        stats["daily_limit"] = self.daily_limit
+        return stats
+
+
+_rate_limiters = {}
+
+
+def get_rate_limiter(api_key: str) -> RateLimiter:
+    """API 키별 속도 제한기 (서비스 = 오퍼레이션 단위로 집계)"""
+    limiter = _rate_limiters.get(api_key)
+    if limiter is None:
+        limiter = _rate_limiters[api_key] = RateLimiter(api_key, QUOTA_PATH, RATE_LIMIT, RATE_BURST, DAILY_LIMIT)
+    return limiter
+
+
+class Metrics:
+    """오퍼레이션별 단계 시간과 카운터 수집 (thread-safe)
+
+    단계(phase): queue(속도 제한/동시 요청 대기), connect(DNS+TCP+TLS, 새 커넥션일 때만),
+    wait(요청 전송 ~ 응답 헤더), body(본문 수신), parse(XML 파싱), format(응답 생성), total(업스트림 호출 전체)
+    단계마다 횟수/합계/최대값과 Prometheus 히스토그램 버킷, 백분위 계산용 최근 표본을 유지합니다.
+    """
+
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    SAMPLE_SIZE = 512
+
+    def __init__(self, dump_path: str = "", dump_interval: float = 15.0):
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self._lock = threading.Lock()
+        self._timings = {}  # (operation, phase) -> {"count", "sum", "max", "buckets", "samples"}
+        self._counters = {}  # (operation, name) -> 값
+        self._errors = {}  # (operation, code) -> 횟수
+        self._last_dump = 0.0
+
+    def observe(self, operation: str, phase: str, elapsed_ms: float) -> None:
+        with self._lock:
+            timing = self._timings.get((operation, phase))
+            if timing is None:
+                timing = self._timings[(operation, phase)] = {
+                    "count": 0, "sum": 0.0, "max": 0.0,
+                    "buckets": [0] * len(self.BUCKETS_MS),
+                    "samples": collections.deque(maxlen=self.SAMPLE_SIZE),
+                }
+            timing["count"] += 1
+            timing["sum"] += elapsed_ms
+            timing["max"] = max(timing["max"], elapsed_ms)
+            timing["samples"].append(elapsed_ms)
+            for i, upper in enumerate(self.BUCKETS_MS):
+                if elapsed_ms <= upper:
+                    timing["buckets"][i] += 1
+                    break
+
+    @contextlib.contextmanager
+    def timer(self, operation: str, phase: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(operation, phase, (time.perf_counter() - started) * 1000)
+
+    def add(self, operation: str, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[(operation, name)] = self._counters.get((operation, name), 0) + value
+
+    def error(self, operation: str, code: str) -> None:
+        with self._lock:
+            self._errors[(operation, code)] = self._errors.get((operation, code), 0) + 1
+
+    def snapshot(self) -> dict:
+        """{operation: {"phases": {phase: {...}}, "counters": {...}, "errors": {...}}}"""
+        with self._lock:
+            timings = {key: dict(value, samples=sorted(value["samples"])) for key, value in self._timings.items()}
+            counters = dict(self._counters)
+            errors = dict(self._errors)
+
+        operations = {}
+        for (operation, phase), timing in timings.items():
+            samples = timing["samples"]
+            operations.setdefault(operation, {"phases": {}, "counters": {}, "errors": {}})["phases"][phase] = {
+                "count": timing["count"],
+                "avg_ms": timing["sum"] / timing["count"],
+                "p50_ms": samples[len(samples) // 2],
+                "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+                "max_ms": timing["max"],
+            }
+        for (operation, name), value in counters.items():
+            operations.setdefault(operation, {"phases": {}, "counters": {}, "errors": {}})["counters"][name] = value
+        for (operation, code), count in errors.items():
+            operations.setdefault(operation, {"phases": {}, "counters": {}, "errors": {}})["errors"][code] = count
+        return dict(sorted(operations.items()))
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        with self._lock:
+            timings = {key: dict(value) for key, value in self._timings.items()}
+            counters = dict(self._counters)
+            errors = dict(self._errors)
+
+        lines = [
+            "# HELP building_register_phase_duration_seconds Time spent per phase of a building-register call",
+            "# TYPE building_register_phase_duration_seconds histogram",
+        ]
+        for (operation, phase), timing in sorted(timings.items()):
+            labels = f'operation="{operation}",phase="{phase}"'
+            cumulative = 0
+            for upper, count in zip(self.BUCKETS_MS, timing["buckets"]):
+                cumulative += count
+                lines.append(f'building_register_phase_duration_seconds_bucket{{{labels},le="{upper / 1000:g}"}} {cumulative}')
+            lines.append(f'building_register_phase_duration_seconds_bucket{{{labels},le="+Inf"}} {timing["count"]}')
+            lines.append(f"building_register_phase_duration_seconds_sum{{{labels}}} {timing['sum'] / 1000:.6f}")
+            lines.append(f"building_register_phase_duration_seconds_count{{{labels}}} {timing['count']}")
+
+        for name, help_text in METRIC_COUNTERS.items():
+            lines.append(f"# HELP building_register_{name}_total {help_text}")
+            lines.append(f"# TYPE building_register_{name}_total counter")
+            for (operation, counter), value in sorted(counters.items()):
+                if counter == name:
+                    lines.append(f'building_register_{name}_total{{operation="{operation}"}} {value}')
+
+        lines.append("# HELP building_register_errors_total Failed calls by result code (HTTP status, exception, quota)")
+        lines.append("# TYPE building_register_errors_total counter")
+        for (operation, code), count in sorted(errors.items()):
+            lines.append(f'building_register_errors_total{{operation="{operation}",code="{code}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def maybe_dump(self) -> None:
+        """dump_path 가 설정되어 있으면 dump_interval 초마다 Prometheus 텍스트 파일로 저장 (node_exporter textfile 용)"""
+        if not self.dump_path:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_dump < self.dump_interval:
+                return
+            self._last_dump = now
+        os.makedirs(os.path.dirname(self.dump_path) or ".", exist_ok=True)
+        tmp_path = f"{self.dump_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, self.dump_path)
+
+
+# 모든 호출/포맷터가 공유하는 계측기
+metrics = Metrics(METRICS_PATH, METRICS_DUMP_INTERVAL)
+
+
+def record_call_metrics(operation: str, timings: dict, status: int, result: dict | None) -> None:
+    """업스트림 호출 1건의 단계별 시간과 바이트/건수/오류 코드 기록"""
+    for phase in ("queue", "connect", "wait", "body", "parse", "total"):
+        if phase in timings:
+            metrics.observe(operation, phase, timings[phase])
+    metrics.add(operation, "requests")
+    metrics.add(operation, "response_bytes", timings.get("bytes", 0))
+    if status != 200:
+        metrics.error(operation, f"HTTP {status}")
+    else:
+        metrics.add(operation, "items", len(result.get("items", [])))
+        code = result.get("resultCode", "")
+        if code not in ("", "00"):
+            metrics.error(operation, code)
+        elif "error" in result:
+            metrics.error(operation, "parse")
+    try:
+        metrics.maybe_dump()
+    except OSError as e:
+        logging.getLogger(__name__).warning("metrics dump failed: %s", e)
+
+
 def call_api(operation: str, params: dict) -> dict:
     """건축물대장 API 호출"""
     api_key = os.environ.get("DATA_GO_KR_API_KEY")
     if not api_key:
         return {"error": "DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다."}
 
+    cached = response_cache.get(operation, params)
+    if cached is not None:
+        metrics.add(operation, "cache_hits")
+        return cached
+
+    # 같은 요청이 이미 진행 중이면 그 결과를 함께 받음
+    result, coalesced = request_coalescer.do(operation, params, lambda: _request_api(operation, params, api_key))
+    if coalesced:
+        metrics.add(operation, "coalesced")
+    return result
+
+
+def _request_api(operation: str, params: dict, api_key: str) -> dict:
+    """업스트림 요청 1건 (속도 제한, 계측, 캐시 저장 포함)"""
+    limiter = get_rate_limiter(api_key)
+    wait, quota_error = limiter.reserve(operation)
+    if quota_error:
+        metrics.error(operation, "quota")
+        return {"error": quota_error, "quotaExhausted": True}
+    if wait:
+        time.sleep(wait)
+
     # serviceKey는 별도로 처리 (인코딩하지 않음)
     encoded_params = urllib.parse.urlencode(params)
-    path = f"/1613000/BldRgstHubService/{operation}?serviceKey={api_key}&{encoded_params}"
+    path = f"{API_PATH}/{operation}?serviceKey={api_key}&{encoded_params}"
 
+    started = time.perf_counter()
+    timings = {"queue": wait * 1000}
+    received = None  # 응답을 받으면 결과 코드 (받지 못했으면 예약 취소)
     try:
-        conn = http.client.HTTPSConnection("apis.data.go.kr", timeout=30)
-        conn.request("GET", path, headers={
-            "User-Agent": "Mozilla/5.0 (compatible; BuildingRegisterBot/1.0)",
-            "Accept": "*/*"
-        })
-        response = conn.getresponse()
+        status, reason, body = connection_pool.request("GET", path, headers=API_HEADERS, timings=timings)
+        received = f"HTTP {status}"
+
+        if status != 200:
+            timings["total"] = (time.perf_counter() - started) * 1000
+            record_call_metrics(operation, timings, status, None)
+            return {"error": f"HTTP 오류: {status} - {reason}"}
+
+        with metrics.timer(operation, "parse"):
+            result = parse_xml_response(body)
+        received = result.get("resultCode", "")
+        timings["total"] = (time.perf_counter() - started) * 1000
+        record_call_metrics(operation, timings, status, result)
+        response_cache.put(operation, params, result)
+        return result
+    except http.client.HTTPException as e:
+        metrics.error(operation, type(e).__name__)
+        return {"error": f"HTTP 오류: {e}"}
+    except Exception as e:
+        metrics.error(operation, type(e).__name__)
+        return {"error": f"오류: {e}"}
+    finally:
+        if received is None:
+            limiter.release(operation)
+        else:
+            limiter.record(operation, received)
+
+
+class AsyncAPIExecutor:
+    """httpx.AsyncClient 기반 비동기 호출기 - 동시 요청 수를 max_concurrency 로 제한"""
+
+    def __init__(self, max_concurrency: int = 8, idle_timeout: float = 60.0, connect_timeout: float = 5.0, read_timeout: float = 30.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+        self._stats = {"requests": 0, "in_flight": 0, "max_in_flight": 0, "waiting": 0}
+
+    def _ensure_loop_state(self) -> None:
+        """클라이언트/세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면 이전 클라이언트를 닫고 새로 생성"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._client is not None:
+                self._close_previous(self._client, self._loop)
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._client = httpx.AsyncClient(
+                base_url=API_BASE_URL,
+                headers=API_HEADERS,
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=self.idle_timeout,
+                ),
+            )
+
+    async def get_xml(self, path: str, timings: dict | None = None) -> tuple:
+        """동시 요청 한도 안에서 GET 요청 후 본문을 받는 대로 스트리밍 파싱
+
+        timings 를 넘기면 queue/connect/wait/body/parse 단계 시간(ms)과 bytes 를 채워 줍니다.
+        connect 는 httpx trace 이벤트로 측정하며 새 커넥션을 만들었을 때만 기록합니다.
+
+        Returns:
+            (status, reason, result) - status 가 200 이 아니면 result 는 None
+        """
+        timings = {} if timings is None else timings
+        marks = {}
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.started":
+                marks["connect_started"] = time.perf_counter()
+            elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                marks["connected"] = time.perf_counter()
+
+        self._ensure_loop_state()
+        self._stats["waiting"] += 1
+        started = time.perf_counter()
+        async with self._semaphore:
+            timings["queue"] = timings.get("queue", 0.0) + (time.perf_counter() - started) * 1000
+            self._stats["waiting"] -= 1
+            self._stats["requests"] += 1
+            self._stats["in_flight"] += 1
+            self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+            try:
+                started = time.perf_counter()
+                async with self._client.stream("GET", path, extensions={"trace": trace}) as response:
+                    headers_at = time.perf_counter()
+                    connect_ms = 0.0
+                    if "connected" in marks:
+                        connect_ms = timings["connect"] = (marks["connected"] - marks["connect_started"]) * 1000
+                    timings["wait"] = (headers_at - started) * 1000 - connect_ms
+                    if response.status_code != 200:
+                        return response.status_code, response.reason_phrase, None
+
+                    parser = StreamingXMLParser()
+                    parse_seconds = 0.0
+                    received = 0
+                    async for chunk in response.aiter_bytes():
+                        received += len(chunk)
+                        feed_started = time.perf_counter()
+                        parser.feed(chunk)
+                        parse_seconds += time.perf_counter() - feed_started
+                    feed_started = time.perf_counter()
+                    result = parser.close()
+                    parse_seconds += time.perf_counter() - feed_started
+
+                    # 본문 수신과 파싱이 번갈아 일어나므로 파싱 시간을 뺀 나머지를 수신 시간으로 봄
+                    timings["parse"] = parse_seconds * 1000
+                    timings["body"] = (time.perf_counter() - headers_at - parse_seconds) * 1000
+                    timings["bytes"] = received
+                    return response.status_code, response.reason_phrase, result
+            finally:
+                self._stats["in_flight"] -= 1
+
+    @staticmethod
+    def _close_previous(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+        """이전 루프의 클라이언트 종료 - 소켓이 그 루프에 묶여 있으므로 aclose 도 그 루프에서 실행"""
+        if loop.is_closed():
+            # 루프가 이미 닫혀 aclose 를 실행할 수 없음 - 루프를 끝내기 전에 aclose() 를 부르지 않은 호출자
+            logging.getLogger(__name__).warning("이전 이벤트 루프가 닫혀 httpx 클라이언트를 정리하지 못했습니다")
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            # 멈춰 있는 루프는 현재 루프가 도는 스레드에서 돌릴 수 없으므로 별도 스레드에서 정리
+            threading.Thread(target=loop.run_until_complete, args=(client.aclose(),), daemon=True).start()
+
+    async def aclose(self) -> None:
+        """클라이언트 종료 (서버 lifespan 종료 시, 직접 루프를 돌린 호출자는 루프를 끝내기 전에 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    def stats(self) -> dict:
+        """비동기 호출 통계"""
+        stats = dict(self._stats)
+        stats["max_concurrency"] = self.max_concurrency
+        return stats
+
+
+# 모든 비동기 도구가 공유하는 호출기
+async_executor = AsyncAPIExecutor(
+    max_concurrency=MAX_CONCURRENCY,
+    idle_timeout=POOL_IDLE_TIMEOUT,
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+)
+
+
+async def call_api_async(operation: str, params: dict) -> dict:
+    """건축물대장 API 비동기 호출 (이벤트 루프를 막지 않음 - 캐시 조회/저장도 스레드에서 실행)"""
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        return {"error": "DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다."}
 
-        if response.status != 200:
-            return {"error": f"HTTP 오류: {response.status} - {response.reason}"}
+    cached = await asyncio.to_thread(response_cache.get, operation, params) if response_cache.enabled else None
+    if cached is not None:
+        metrics.add(operation, "cache_hits")
+        return cached
 
-        xml_text = response.read().decode("utf-8")
-        conn.close()
-        return parse_xml_response(xml_text)
-    except http.client.HTTPException as e:
+    # 같은 요청이 이미 진행 중이면 그 결과를 함께 받음
+    result, coalesced = await request_coalescer.do_async(
+        operation, params, lambda: _request_api_async(operation, params, api_key)
+    )
+    if coalesced:
+        metrics.add(operation, "coalesced")
+    return result
+
+
+async def _request_api_async(operation: str, params: dict, api_key: str) -> dict:
+    """업스트림 비동기 요청 1건 (속도 제한, 계측, 캐시 저장 포함)
+
+    속도 제한기와 응답 캐시는 SQLite(프로세스 간 공유, 잠금 대기 가능)를 쓰므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    """
+    limiter = get_rate_limiter(api_key)
+    wait, quota_error = await asyncio.to_thread(limiter.reserve, operation)
+    if quota_error:
+        metrics.error(operation, "quota")
+        return {"error": quota_error, "quotaExhausted": True}
+
+    # serviceKey는 별도로 처리 (인코딩하지 않음)
+    encoded_params = urllib.parse.urlencode(params)
+    path = f"/{operation}?serviceKey={api_key}&{encoded_params}"
+
+    timings = {"queue": wait * 1000}
+    received = None  # 응답을 받으면 결과 코드 (받지 못했거나 취소되면 예약 취소)
+    try:
+        if wait:
+            await asyncio.sleep(wait)
+        started = time.perf_counter()
+        status, reason, result = await async_executor.get_xml(path, timings=timings)
+        received = f"HTTP {status}"
+        timings["total"] = (time.perf_counter() - started) * 1000
+        record_call_metrics(operation, timings, status, result)
+
+        if status != 200:
+            return {"error": f"HTTP 오류: {status} - {reason}"}
+
+        received = result.get("resultCode", "")
+        if response_cache.enabled:
+            await asyncio.to_thread(response_cache.put, operation, params, result)
+        return result
+    except httpx.HTTPError as e:
+        metrics.error(operation, type(e).__name__)
         return {"error": f"HTTP 오류: {e}"}
     except Exception as e:
+        metrics.error(operation, type(e).__name__)
         return {"error": f"오류: {e}"}
+    finally:
+        if received is None:
+            await asyncio.to_thread(limiter.release, operation)
+        else:
+            await asyncio.to_thread(limiter.record, operation, received)
+
+
+def build_params(
+    sigungu_cd: str,
+    bjdong_cd: str,
+    bun: str = "",
+    ji: str = "",
+    plat_gb_cd: str = "0",
+    num_of_rows: int = 10,
+    page_no: int = 1,
+) -> dict:
+    """공통 요청 파라미터 생성 (번/지는 4자리로 0 채움)"""
+    params = {
+        "sigunguCd": sigungu_cd,
+        "bjdongCd": bjdong_cd,
+        "platGbCd": plat_gb_cd,
+        "numOfRows": str(min(100, max(1, num_of_rows))),
+        "pageNo": str(max(1, page_no)),
+    }
+    if bun:
+        params["bun"] = bun.zfill(4)
+    if ji:
+        params["ji"] = ji.zfill(4)
+    return params
+
+
+async def iter_all_pages(operation: str, params: dict, concurrency: int = 5, max_pages: int = 100):
+    """모든 페이지를 페이지 순서대로 yield 하는 async generator
+
+    첫 페이지(100건)로 totalCount 를 확인한 뒤 나머지 페이지를 concurrency 개씩 병렬 요청하고,
+    먼저 도착한 페이지가 있어도 순서를 지켜 (page_no, result) 를 내보냅니다.
+    """
+    first_params = dict(params, numOfRows="100", pageNo="1")
+    first = await call_api_async(operation, first_params)
+    yield 1, first
+    if "error" in first:
+        return
+
+    total_pages = min(max_pages, (first["totalCount"] + 99) // 100)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(page: int) -> dict:
+        async with semaphore:
+            return await call_api_async(operation, dict(first_params, pageNo=str(page)))
+
+    pages = range(2, total_pages + 1)
+    tasks = [asyncio.ensure_future(fetch(page)) for page in pages]
+    try:
+        for page, task in zip(pages, tasks):
+            yield page, await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_all_pages(operation: str, params: dict) -> dict:
+    """전체 페이지를 병렬로 조회하여 하나의 결과로 합침 (실패한 페이지는 failedPages 에 기록)"""
+    merged = None
+    failed_pages = []
+    async for page, result in iter_all_pages(
+        operation, params, concurrency=PAGE_FETCH_CONCURRENCY, max_pages=MAX_FETCH_ALL_PAGES
+    ):
+        if merged is None:
+            if "error" in result:
+                return result
+            merged = dict(result, items=list(result["items"]))
+            continue
+        if "error" in result:
+            failed_pages.append(page)
+        else:
+            merged["items"].extend(result["items"])
+
+    # 포맷터가 한 페이지로 인식하도록 numOfRows 를 전체 건수로 맞춤
+    merged["numOfRows"] = max(1, merged["totalCount"])
+    merged["failedPages"] = failed_pages
+    merged["truncated"] = merged["totalCount"] > MAX_FETCH_ALL_PAGES * 100
+    return merged
+
+
+def format_fetch_all_notice(result: dict) -> str:
+    """전체 페이지 조회 시 누락/생략된 페이지 안내 문구"""
+    notices = []
+    if result.get("failedPages"):
+        pages = ", ".join(str(page) for page in result["failedPages"])
+        notices.append(f"⚠️ 일부 페이지 조회 실패 (page_no={pages}, 100건 단위) - 개별 조회로 보완하세요.")
+    if result.get("truncated"):
+        notices.append(f"⚠️ 최대 {MAX_FETCH_ALL_PAGES * 100}건까지만 조회했습니다.")
+    return "\n".join(notices)
+
+
+# 간결 출력(output_format="json"/"table") 시 오퍼레이션별 기본 필드
+COMPACT_FIELDS = {
+    "기본개요": ["platPlc", "newPlatPlc", "bldNm", "regstrGbCdNm", "regstrKindCdNm", "jiyukCdNm", "jiguCdNm", "guyukCdNm"],
+    "총괄표제부": [
+        "platPlc", "bldNm", "useAprDay", "platArea", "archArea", "totArea", "bcRat", "vlRat",
+        "mainPurpsCdNm", "hhldCnt", "hoCnt", "mainBldCnt", "totPkngCnt",
+    ],
+    "표제부": [
+        "bldNm", "dongNm", "mainAtchGbCdNm", "useAprDay", "strctCdNm", "mainPurpsCdNm", "archArea", "totArea",
+        "grndFlrCnt", "ugrndFlrCnt", "heit", "rideUseElvtCnt", "emgenUseElvtCnt", "rserthqkDsgnApplyYn",
+    ],
+    "층별개요": ["dongNm", "flrGbCdNm", "flrNo", "flrNoNm", "mainPurpsCdNm", "etcPurps", "area", "strctCdNm", "mainAtchGbCdNm"],
+    "부속지번": ["platPlc", "bldNm", "atchBjdongCd", "atchBun", "atchJi", "atchRegstrGbCdNm"],
+    "전유공용면적": ["dongNm", "hoNm", "flrGbCdNm", "flrNo", "exposPubuseGbCdNm", "mainPurpsCdNm", "etcPurps", "area"],
+    "오수정화시설": ["platPlc", "bldNm", "modeCdNm", "unitGbCdNm", "capaPsper", "capaLube"],
+    "주택가격": ["bldNm", "dongNm", "hoNm", "newPlatPlc", "hsprc", "stdDay"],
+    "전유부": ["bldNm", "dongNm", "hoNm", "flrGbCdNm", "flrNo"],
+    "지역지구구역": ["jijiguGbCdNm", "jijiguCdNm", "reprYn", "etcJijigu"],
+}
+
+# 숫자로 변환할 필드 (면적 ㎡, 비율 %, 개수, 가격 원)
+NUMERIC_FIELDS = {
+    "platArea", "archArea", "totArea", "bcRat", "vlRat", "vlRatEstmTotArea", "atchBldArea", "atchBldCnt",
+    "bylotCnt", "hhldCnt", "hoCnt", "fmlyCnt", "mainBldCnt", "totPkngCnt", "grndFlrCnt", "ugrndFlrCnt",
+    "heit", "rideUseElvtCnt", "emgenUseElvtCnt", "area", "hsprc", "flrNo", "engrEpi", "engrRat",
+    "indrAutoArea", "indrAutoUtcnt", "indrMechArea", "indrMechUtcnt",
+    "oudrAutoArea", "oudrAutoUtcnt", "oudrMechArea", "oudrMechUtcnt", "capaPsper", "capaLube",
+}
+
+# YYYY-MM-DD 로 변환할 날짜 필드
+DATE_FIELDS = {"useAprDay", "pmsDay", "stcnsDay", "crtnDay", "stdDay"}
+
+# "1"/"0" → true/false 로 변환할 필드
+FLAG_FIELDS = {"reprYn", "rserthqkDsgnApplyYn"}
+
+OUTPUT_FORMATS = ("markdown", "json", "table")
+
+
+def check_output_format(output_format: str) -> str | None:
+    """output_format 값 검증 - 잘못된 값이면 오류 메시지 반환"""
+    if output_format not in OUTPUT_FORMATS:
+        return f"오류: 잘못된 output_format 입니다. 가능한 값: {', '.join(OUTPUT_FORMATS)}"
+    return None
+
+
+def typed_value(field: str, value: str | None):
+    """API 문자열 값을 필드 타입에 맞게 변환 (빈 값은 None)"""
+    if value is None:
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    if field in NUMERIC_FIELDS:
+        try:
+            return float(value) if "." in value else int(value)
+        except ValueError:
+            return value
+    if field in DATE_FIELDS and len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    if field in FLAG_FIELDS:
+        return value == "1"
+    return value
+
+
+def select_columns(op_name: str, items: list, fields: list[str] | None) -> list:
+    """출력할 컬럼 결정 - fields 미지정 시 오퍼레이션 기본 필드, ["*"] 이면 응답의 모든 필드"""
+    if fields and "*" in fields:
+        columns = {}
+        for item in items:
+            columns.update(dict.fromkeys(item))
+        columns.pop("rnum", None)
+        return list(columns)
+    if fields:
+        return list(fields)
+    return COMPACT_FIELDS.get(op_name) or select_columns(op_name, items, ["*"])
+
+
+def compact_result(op_name: str, result: dict, fields: list[str] | None = None) -> dict:
+    """간결 출력용 결과 - 선택한 컬럼만 타입 변환하여 열 목록 + 행 배열로 구성"""
+    if "error" in result:
+        return {"operation": op_name, "error": result["error"], "resultCode": result.get("resultCode", "")}
+
+    columns = select_columns(op_name, result["items"], fields)
+    compact = {
+        "operation": op_name,
+        "totalCount": result["totalCount"],
+        "pageNo": result["pageNo"],
+        "numOfRows": result["numOfRows"],
+        "columns": columns,
+        "rows": [[typed_value(column, item.get(column)) for column in columns] for item in result["items"]],
+    }
+    if "failedPages" in result:
+        compact["failedPages"] = result["failedPages"]
+        compact["truncated"] = result["truncated"]
+    return compact
+
+
+def format_compact_table(compact: dict) -> str:
+    """간결 결과를 탭 구분 표로 변환 (첫 줄 메타정보, 둘째 줄 컬럼명)"""
+    if "error" in compact:
+        return f"# {compact['operation']} error={compact['error']}"
+
+    meta = f"# {compact['operation']} totalCount={compact['totalCount']} pageNo={compact['pageNo']} numOfRows={compact['numOfRows']}"
+    if compact.get("failedPages"):
+        meta += f" failedPages={','.join(str(page) for page in compact['failedPages'])}"
+    if compact.get("truncated"):
+        meta += " truncated=true"
+
+    lines = [meta, "\t".join(compact["columns"])]
+    for row in compact["rows"]:
+        cells = []
+        for value in row:
+            if value is None:
+                cells.append("")
+            elif isinstance(value, bool):
+                cells.append("1" if value else "0")
+            else:
+                cells.append(str(value).replace("\t", " ").replace("\n", " "))
+        lines.append("\t".join(cells))
+    return "\n".join(lines)
+
+
+def render_result(
+    op_name: str,
+    result: dict,
+    sigungu_cd: str,
+    bjdong_cd: str,
+    bun: str,
+    ji: str,
+    output_format: str = "markdown",
+    fields: list[str] | None = None,
+) -> str:
+    """도구 응답 생성 - markdown 은 기존 포맷터, json/table 은 선택 필드만 담은 간결 출력"""
+    with metrics.timer(OPERATIONS[op_name], "format"):
+        if output_format == "json":
+            return json.dumps(compact_result(op_name, result, fields), ensure_ascii=False, separators=(",", ":"))
+        if output_format == "table":
+            return format_compact_table(compact_result(op_name, result, fields))
+
+        output = format_operation_result(op_name, result, sigungu_cd, bjdong_cd, bun, ji)
+        notice = format_fetch_all_notice(result)
+        return f"{output}\n\n{notice}" if notice else output
 
 
 @mcp.tool()
-def search_building_basic(
+async def search_building_basic(
     sigungu_cd: str,
     bjdong_cd: str,
     bun: str = "",
     ji: str = "",
     plat_gb_cd: str = "0",
     num_of_rows: int = 10,
-    page_no: int = 1
+    page_no: int = 1,
+    output_format: str = "markdown",
+    fields: list[str] | None = None
 ) -> str:
     """
     건축물대장 기본개요 조회 - 건축물 기본 정보 (대장구분, 지번/도로명주소, 지역지구구역)
@@ -569,35 +1978,35 @@ def search_building_basic(
         plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
         num_of_rows: 한 페이지에 표시할 건수 (기본: 10, 최대: 100)
         page_no: 페이지 번호 (기본: 1)
+        output_format: 출력 형식 (기본: "markdown")
+            - "json": 선택한 필드만 열 목록 + 행 배열로 담은 JSON (숫자/날짜 타입 변환)
+            - "table": 탭 구분 표 (첫 줄 메타정보, 둘째 줄 컬럼명)
+        fields: json/table 출력에 포함할 필드 목록 (기본: 오퍼레이션별 주요 필드, ["*"]: 전체 필드)
 
     Returns:
         건축물 기본개요 목록 (건물명, 주소, 대장구분, 지역지구구역 등)
     """
-    params = {
-        "sigunguCd": sigungu_cd,
-        "bjdongCd": bjdong_cd,
-        "platGbCd": plat_gb_cd,
-        "numOfRows": str(min(100, max(1, num_of_rows))),
-        "pageNo": str(max(1, page_no)),
-    }
-    if bun:
-        params["bun"] = bun.zfill(4)
-    if ji:
-        params["ji"] = ji.zfill(4)
+    format_error = check_output_format(output_format)
+    if format_error:
+        return format_error
 
-    result = call_api(OPERATIONS["기본개요"], params)
-    return format_basis_result(result, sigungu_cd, bjdong_cd, bun, ji)
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd, num_of_rows, page_no)
+
+    result = await call_api_async(OPERATIONS["기본개요"], params)
+    return render_result("기본개요", result, sigungu_cd, bjdong_cd, bun, ji, output_format, fields)
 
 
 @mcp.tool()
-def search_building_recap_title(
+async def search_building_recap_title(
     sigungu_cd: str,
     bjdong_cd: str,
     bun: str = "",
     ji: str = "",
     plat_gb_cd: str = "0",
     num_of_rows: int = 10,
-    page_no: int = 1
+    page_no: int = 1,
+    output_format: str = "markdown",
+    fields: list[str] | None = None
 ) -> str:
     """
     건축물대장 총괄표제부 조회 - 단지 전체 정보 (대지면적, 연면적, 세대수, 사용승인일 등)
@@ -614,35 +2023,35 @@ def search_building_recap_title(
         plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
         num_of_rows: 한 페이지에 표시할 건수 (기본: 10, 최대: 100)
         page_no: 페이지 번호 (기본: 1)
+        output_format: 출력 형식 (기본: "markdown")
+            - "json": 선택한 필드만 열 목록 + 행 배열로 담은 JSON (숫자/날짜 타입 변환)
+            - "table": 탭 구분 표 (첫 줄 메타정보, 둘째 줄 컬럼명)
+        fields: json/table 출력에 포함할 필드 목록 (기본: 오퍼레이션별 주요 필드, ["*"]: 전체 필드)
 
     Returns:
         총괄표제부 정보 (사용승인일, 대지면적, 건축면적, 연면적, 건폐율, 용적률, 세대수 등)
     """
-    params = {
-        "sigunguCd": sigungu_cd,
-        "bjdongCd": bjdong_cd,
-        "platGbCd": plat_gb_cd,
-        "numOfRows": str(min(100, max(1, num_of_rows))),
-        "pageNo": str(max(1, page_no)),
-    }
-    if bun:
-        params["bun"] = bun.zfill(4)
-    if ji:
-        params["ji"] = ji.zfill(4)
+    format_error = check_output_format(output_format)
+    if format_error:
+        return format_error
+
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd, num_of_rows, page_no)
 
-    result = call_api(OPERATIONS["총괄표제부"], params)
-    return format_recap_title_result(result, sigungu_cd, bjdong_cd, bun, ji)
+    result = await call_api_async(OPERATIONS["총괄표제부"], params)
+    return render_result("총괄표제부", result, sigungu_cd, bjdong_cd, bun, ji, output_format, fields)
 
 
 @mcp.tool()
-def search_building_title(
+async def search_building_title(
     sigungu_cd: str,
     bjdong_cd: str,
     bun: str = "",
     ji: str = "",
     plat_gb_cd: str = "0",
     num_of_rows: int = 10,
-    page_no: int = 1
+    page_no: int = 1,
+    output_format: str = "markdown",
+    fields: list[str] | None = None
 ) -> str:
     """
     건축물대장 표제부 조회 - 동별 상세 정보 (구조, 용도, 층수, 면적, 승강기, 내진설계 등)
@@ -655,35 +2064,36 @@ def search_building_title(
         plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
         num_of_rows: 한 페이지에 표시할 건수 (기본: 10, 최대: 100)
         page_no: 페이지 번호 (기본: 1)
+        output_format: 출력 형식 (기본: "markdown")
+            - "json": 선택한 필드만 열 목록 + 행 배열로 담은 JSON (숫자/날짜 타입 변환)
+            - "table": 탭 구분 표 (첫 줄 메타정보, 둘째 줄 컬럼명)
+        fields: json/table 출력에 포함할 필드 목록 (기본: 오퍼레이션별 주요 필드, ["*"]: 전체 필드)
 
     Returns:
         표제부 정보 (동명칭, 구조, 지붕, 용도, 면적, 층수, 높이, 승강기, 내진설계 등)
     """
-    params = {
-        "sigunguCd": sigungu_cd,
-        "bjdongCd": bjdong_cd,
-        "platGbCd": plat_gb_cd,
-        "numOfRows": str(min(100, max(1, num_of_rows))),
-        "pageNo": str(max(1, page_no)),
-    }
-    if bun:
-        params["bun"] = bun.zfill(4)
-    if ji:
-        params["ji"] = ji.zfill(4)
+    format_error = check_output_format(output_format)
+    if format_error:
+        return format_error
+
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd, num_of_rows, page_no)
 
-    result = call_api(OPERATIONS["표제부"], params)
-    return format_title_result(result, sigungu_cd, bjdong_cd, bun, ji)
+    result = await call_api_async(OPERATIONS["표제부"], params)
+    return render_result("표제부", result, sigungu_cd, bjdong_cd, bun, ji, output_format, fields)
 
 
 @mcp.tool()
-def search_building_floor(
+async def search_building_floor(
     sigungu_cd: str,
     bjdong_cd: str,
     bun: str = "",
     ji: str = "",
     plat_gb_cd: str = "0",
     num_of_rows: int = 50,
-    page_no: int = 1
+    page_no: int = 1,
+    fetch_all: bool = False,
+    output_format: str = "markdown",
+    fields: list[str] | None = None
 ) -> str:
     """
     건축물대장 층별개요 조회 - 층별 구조, 용도, 면적 정보
@@ -696,28 +2106,31 @@ def search_building_floor(
         plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
         num_of_rows: 한 페이지에 표시할 건수 (기본: 50, 최대: 100)
         page_no: 페이지 번호 (기본: 1)
+        fetch_all: True 이면 전체 페이지를 병렬로 조회하여 한 번에 반환 (num_of_rows, page_no 무시)
+            - 대단지처럼 결과가 많을 때 page_no 를 늘려가며 반복 호출하는 대신 사용
+        output_format: 출력 형식 (기본: "markdown")
+            - "json": 선택한 필드만 열 목록 + 행 배열로 담은 JSON (숫자/날짜 타입 변환)
+            - "table": 탭 구분 표 (첫 줄 메타정보, 둘째 줄 컬럼명)
+        fields: json/table 출력에 포함할 필드 목록 (기본: 오퍼레이션별 주요 필드, ["*"]: 전체 필드)
 
     Returns:
         층별개요 정보 (동명칭, 층구분, 층번호, 구조, 용도, 면적)
     """
-    params = {
-        "sigunguCd": sigungu_cd,
-        "bjdongCd": bjdong_cd,
-        "platGbCd": plat_gb_cd,
-        "numOfRows": str(min(100, max(1, num_of_rows))),
-        "pageNo": str(max(1, page_no)),
-    }
-    if bun:
-        params["bun"] = bun.zfill(4)
-    if ji:
-        params["ji"] = ji.zfill(4)
+    format_error = check_output_format(output_format)
+    if format_error:
+        return format_error
+
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd, num_of_rows, page_no)
 
-    result = call_api(OPERATIONS["층별개요"], params)
-    return format_floor_result(result, sigungu_cd, bjdong_cd, bun, ji)
+    if fetch_all:
+        result = await fetch_all_pages(OPERATIONS["층별개요"], params)
+    else:
+        result = await call_api_async(OPERATIONS["층별개요"], params)
+    return render_result("층별개요", result, sigungu_cd, bjdong_cd, bun, ji, output_format, fields)
 
 
 @mcp.tool()
-def search_building_expos(
+async def search_building_expos(
     sigungu_cd: str,
     bjdong_cd: str,
     bun: str = "",
@@ -726,7 +2139,10 @@ def search_building_expos(
     ho_nm: str = "",
     plat_gb_cd: str = "0",
     num_of_rows: int = 30,
-    page_no: int = 1
+    page_no: int = 1,
+    fetch_all: bool = False,
+    output_format: str = "markdown",
+    fields: list[str] | None = None
 ) -> str:
     """
     건축물대장 전유부 조회 - 집합건물(아파트 등)의 세대별 정보
@@ -741,39 +2157,44 @@ def search_building_expos(
         plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
         num_of_rows: 한 페이지에 표시할 건수 (기본: 30, 최대: 100)
         page_no: 페이지 번호 (기본: 1)
+        fetch_all: True 이면 전체 페이지를 병렬로 조회하여 한 번에 반환 (num_of_rows, page_no 무시)
+            - 대단지 전체 세대를 조회할 때 page_no 를 늘려가며 반복 호출하는 대신 사용
+        output_format: 출력 형식 (기본: "markdown")
+            - "json": 선택한 필드만 열 목록 + 행 배열로 담은 JSON (숫자/날짜 타입 변환)
+            - "table": 탭 구분 표 (첫 줄 메타정보, 둘째 줄 컬럼명)
+        fields: json/table 출력에 포함할 필드 목록 (기본: 오퍼레이션별 주요 필드, ["*"]: 전체 필드)
 
     Returns:
         전유부 정보 (건물명, 동명칭, 호명칭, 층정보)
     """
-    params = {
-        "sigunguCd": sigungu_cd,
-        "bjdongCd": bjdong_cd,
-        "platGbCd": plat_gb_cd,
-        "numOfRows": str(min(100, max(1, num_of_rows))),
-        "pageNo": str(max(1, page_no)),
-    }
-    if bun:
-        params["bun"] = bun.zfill(4)
-    if ji:
-        params["ji"] = ji.zfill(4)
+    format_error = check_output_format(output_format)
+    if format_error:
+        return format_error
+
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd, num_of_rows, page_no)
     if dong_nm:
         params["dongNm"] = dong_nm
     if ho_nm:
         params["hoNm"] = ho_nm
 
-    result = call_api(OPERATIONS["전유부"], params)
-    return format_expos_result(result, sigungu_cd, bjdong_cd, bun, ji)
+    if fetch_all:
+        result = await fetch_all_pages(OPERATIONS["전유부"], params)
+    else:
+        result = await call_api_async(OPERATIONS["전유부"], params)
+    return render_result("전유부", result, sigungu_cd, bjdong_cd, bun, ji, output_format, fields)
 
 
 @mcp.tool()
-def search_building_price(
+async def search_building_price(
     sigungu_cd: str,
     bjdong_cd: str,
     bun: str = "",
     ji: str = "",
     plat_gb_cd: str = "0",
     num_of_rows: int = 30,
-    page_no: int = 1
+    page_no: int = 1,
+    output_format: str = "markdown",
+    fields: list[str] | None = None
 ) -> str:
     """
     건축물대장 주택가격 조회 - 공시가격 정보
@@ -786,35 +2207,35 @@ def search_building_price(
         plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
         num_of_rows: 한 페이지에 표시할 건수 (기본: 30, 최대: 100)
         page_no: 페이지 번호 (기본: 1)
+        output_format: 출력 형식 (기본: "markdown")
+            - "json": 선택한 필드만 열 목록 + 행 배열로 담은 JSON (숫자/날짜 타입 변환)
+            - "table": 탭 구분 표 (첫 줄 메타정보, 둘째 줄 컬럼명)
+        fields: json/table 출력에 포함할 필드 목록 (기본: 오퍼레이션별 주요 필드, ["*"]: 전체 필드)
 
     Returns:
         주택가격 정보 (건물명, 주소, 주택가격, 기준일자)
     """
-    params = {
-        "sigunguCd": sigungu_cd,
-        "bjdongCd": bjdong_cd,
-        "platGbCd": plat_gb_cd,
-        "numOfRows": str(min(100, max(1, num_of_rows))),
-        "pageNo": str(max(1, page_no)),
-    }
-    if bun:
-        params["bun"] = bun.zfill(4)
-    if ji:
-        params["ji"] = ji.zfill(4)
+    format_error = check_output_format(output_format)
+    if format_error:
+        return format_error
 
-    result = call_api(OPERATIONS["주택가격"], params)
-    return format_hsprc_result(result, sigungu_cd, bjdong_cd, bun, ji)
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd, num_of_rows, page_no)
+
+    result = await call_api_async(OPERATIONS["주택가격"], params)
+    return render_result("주택가격", result, sigungu_cd, bjdong_cd, bun, ji, output_format, fields)
 
 
 @mcp.tool()
-def search_building_zone(
+async def search_building_zone(
     sigungu_cd: str,
     bjdong_cd: str,
     bun: str = "",
     ji: str = "",
     plat_gb_cd: str = "0",
     num_of_rows: int = 30,
-    page_no: int = 1
+    page_no: int = 1,
+    output_format: str = "markdown",
+    fields: list[str] | None = None
 ) -> str:
     """
     건축물대장 지역지구구역 조회 - 용도지역/지구/구역 정보
@@ -827,24 +2248,842 @@ def search_building_zone(
         plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
         num_of_rows: 한 페이지에 표시할 건수 (기본: 30, 최대: 100)
         page_no: 페이지 번호 (기본: 1)
+        output_format: 출력 형식 (기본: "markdown")
+            - "json": 선택한 필드만 열 목록 + 행 배열로 담은 JSON (숫자/날짜 타입 변환)
+            - "table": 탭 구분 표 (첫 줄 메타정보, 둘째 줄 컬럼명)
+        fields: json/table 출력에 포함할 필드 목록 (기본: 오퍼레이션별 주요 필드, ["*"]: 전체 필드)
 
     Returns:
         지역지구구역 정보 (용도지역, 용도지구, 용도구역 등)
     """
-    params = {
-        "sigunguCd": sigungu_cd,
-        "bjdongCd": bjdong_cd,
-        "platGbCd": plat_gb_cd,
-        "numOfRows": str(min(100, max(1, num_of_rows))),
-        "pageNo": str(max(1, page_no)),
+    format_error = check_output_format(output_format)
+    if format_error:
+        return format_error
+
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd, num_of_rows, page_no)
+
+    result = await call_api_async(OPERATIONS["지역지구구역"], params)
+    return render_result("지역지구구역", result, sigungu_cd, bjdong_cd, bun, ji, output_format, fields)
+
+
+async def _fetch_operation(op_name: str, params: dict) -> tuple:
+    """단일 오퍼레이션 조회 - (결과, 소요시간 ms) 반환, 예외도 오류 결과로 변환"""
+    started = time.perf_counter()
+    try:
+        result = await call_api_async(OPERATIONS[op_name], params)
+    except Exception as e:
+        result = {"error": f"오류: {e}"}
+    return result, (time.perf_counter() - started) * 1000
+
+
+@mcp.tool()
+async def get_parcel_dossier(
+    sigungu_cd: str,
+    bjdong_cd: str,
+    bun: str,
+    ji: str = "",
+    plat_gb_cd: str = "0",
+    num_of_rows: int = 10,
+    operations: list[str] | None = None,
+    output_format: str = "markdown",
+    fields: list[str] | None = None
+) -> str:
+    """
+    필지 종합 조회 - 한 필지에 대해 건축물대장 전체 오퍼레이션을 동시에 조회하여 하나의 보고서로 반환
+
+    ⭐ 재건축 후보 검토 시 search_building_* 도구를 하나씩 호출하는 대신 사용하세요.
+    - 10개 오퍼레이션(기본개요, 총괄표제부, 표제부, 층별개요, 부속지번, 전유공용면적,
+      오수정화시설, 주택가격, 전유부, 지역지구구역)을 병렬로 조회
+    - 일부 오퍼레이션이 실패해도 나머지 결과는 그대로 반환 (부분 결과)
+
+    Args:
+        sigungu_cd: 시군구코드 5자리 (예: "11680" 강남구)
+        bjdong_cd: 법정동코드 5자리 (예: "10300" 개포동)
+        bun: 번 4자리 (예: "0012")
+        ji: 지 4자리 (예: "0000") - 옵션
+        plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
+        num_of_rows: 오퍼레이션별 조회 건수 (기본: 10, 최대: 100)
+        operations: 조회할 오퍼레이션 이름 목록 (기본: 전체)
+        output_format: 출력 형식 (기본: "markdown")
+            - "json": 오퍼레이션별 {상태, 소요시간, 열 목록, 행 배열} JSON (숫자/날짜 타입 변환)
+            - "table": 오퍼레이션별 탭 구분 표
+        fields: json/table 출력에 포함할 필드 목록 (기본: 오퍼레이션별 주요 필드, ["*"]: 전체 필드)
+            - 모든 오퍼레이션에 같은 필드 목록이 적용되므로, 보통은 operations 로 하나만 고를 때 사용
+
+    Returns:
+        오퍼레이션별 조회 상태 요약표와 각 오퍼레이션 결과
+    """
+    format_error = check_output_format(output_format)
+    if format_error:
+        return format_error
+
+    op_names = operations or list(OPERATIONS.keys())
+    unknown = [name for name in op_names if name not in OPERATIONS]
+    if unknown:
+        return f"오류: 알 수 없는 오퍼레이션: {', '.join(unknown)}. 가능한 값: {', '.join(OPERATIONS.keys())}"
+
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd, num_of_rows)
+
+    started = time.perf_counter()
+    fetched = await asyncio.gather(*(_fetch_operation(name, params) for name in op_names))
+    total_ms = (time.perf_counter() - started) * 1000
+
+    failed = [name for name, (result, _) in zip(op_names, fetched) if "error" in result]
+
+    if output_format == "json":
+        dossier = {
+            "sigunguCd": sigungu_cd,
+            "bjdongCd": bjdong_cd,
+            "bun": bun.zfill(4),
+            "ji": (ji or "0").zfill(4),
+            "elapsedMs": round(total_ms),
+            "operations": [
+                dict(compact_result(name, result, fields), elapsedMs=round(elapsed_ms))
+                for name, (result, elapsed_ms) in zip(op_names, fetched)
+            ],
+        }
+        return json.dumps(dossier, ensure_ascii=False, separators=(",", ":"))
+    if output_format == "table":
+        return "\n\n".join(format_compact_table(compact_result(name, result, fields)) for name, (result, _) in zip(op_names, fetched))
+
+    output = ["# 필지 종합 조회 결과"]
+    output.append(f"- 시군구코드: {sigungu_cd}, 법정동코드: {bjdong_cd}, 번: {bun}, 지: {ji or '0000'}")
+    output.append(f"- 조회 오퍼레이션: {len(op_names)}개 (성공 {len(op_names) - len(failed)}, 실패 {len(failed)})")
+    output.append(f"- 소요시간: {total_ms:.0f}ms\n")
+
+    output.append("| 오퍼레이션 | 상태 | 건수 | 소요시간 |")
+    output.append("|-----------|------|------|----------|")
+    for name, (result, elapsed_ms) in zip(op_names, fetched):
+        if "error" in result:
+            output.append(f"| {name} | ❌ {result['error']} | - | {elapsed_ms:.0f}ms |")
+        else:
+            output.append(f"| {name} | ✅ | {result['totalCount']} | {elapsed_ms:.0f}ms |")
+    output.append("")
+
+    for name, (result, _) in zip(op_names, fetched):
+        if "error" in result:
+            continue
+        with metrics.timer(OPERATIONS[name], "format"):
+            output.append(format_operation_result(name, result, sigungu_cd, bjdong_cd, bun, ji))
+        output.append("")
+
+    if failed:
+        output.append(f"⚠️ 실패한 오퍼레이션({', '.join(failed)})은 개별 도구로 다시 조회하세요.")
+
+    return "\n".join(output)
+
+
+# 전용면적 규모 구간 (주택 규모 구분 기준, ㎡ 상한)
+AREA_BANDS = [
+    (40, "40㎡ 미만"),
+    (60, "40~60㎡"),
+    (85, "60~85㎡"),
+    (102, "85~102㎡"),
+    (135, "102~135㎡"),
+    (float("inf"), "135㎡ 이상"),
+]
+
+
+def area_band(area: float) -> str:
+    """전용면적이 속한 규모 구간 이름"""
+    for upper, label in AREA_BANDS:
+        if area < upper:
+            return label
+    return AREA_BANDS[-1][1]
+
+
+def aggregate_unit_areas(items: list) -> dict:
+    """전유공용면적 행들을 호(세대) 단위로 묶어 동별/평형별 합계와 분포 계산
+
+    한 호에는 전유 행과 여러 공용 행(계단실, 주차장 등)이 있으므로 (동, 호) 별로 합산한 뒤
+    전용면적 정수부를 평형(타입)으로 삼아 집계합니다. 호명칭이 없는 공용 행은 동 공용면적에만 더합니다.
+    """
+    units = {}  # (동, 호) -> [전용, 공용]
+    dong_common = {}  # 동 -> 호에 속하지 않는 공용면적
+    for item in items:
+        try:
+            area = float(item.get("area", "0"))
+        except ValueError:
+            continue
+        dong = item.get("dongNm") or "-"
+        ho = item.get("hoNm", "")
+        is_private = item.get("exposPubuseGbCd") == "1" or "전유" in item.get("exposPubuseGbCdNm", "")
+        if not ho:
+            if not is_private:
+                dong_common[dong] = dong_common.get(dong, 0.0) + area
+            continue
+        unit = units.setdefault((dong, ho), [0.0, 0.0])
+        unit[0 if is_private else 1] += area
+
+    dongs = {}
+    types = {}
+    bands = {label: 0 for _, label in AREA_BANDS}
+    for (dong, _), (private, common) in units.items():
+        if private <= 0:
+            continue
+        band = area_band(private)
+        bands[band] += 1
+
+        stats = dongs.setdefault(dong, {"units": 0, "private": 0.0, "common": 0.0, "types": set(), "bands": {}})
+        stats["units"] += 1
+        stats["private"] += private
+        stats["common"] += common
+        stats["types"].add(int(private))
+        stats["bands"][band] = stats["bands"].get(band, 0) + 1
+
+        unit_type = types.setdefault(int(private), {"units": 0, "private": 0.0, "common": 0.0, "min": private, "max": private})
+        unit_type["units"] += 1
+        unit_type["private"] += private
+        unit_type["common"] += common
+        unit_type["min"] = min(unit_type["min"], private)
+        unit_type["max"] = max(unit_type["max"], private)
+
+    for dong, common in dong_common.items():
+        stats = dongs.setdefault(dong, {"units": 0, "private": 0.0, "common": 0.0, "types": set(), "bands": {}})
+        stats["common"] += common
+
+    total_units = sum(stats["units"] for stats in dongs.values())
+    total_private = sum(stats["private"] for stats in dongs.values())
+    total_common = sum(stats["common"] for stats in dongs.values())
+    return {
+        "rows": len(items),
+        "units": total_units,
+        "private": total_private,
+        "common": total_common,
+        "dongs": dict(sorted(dongs.items())),
+        "types": dict(sorted(types.items())),
+        "bands": {label: count for label, count in bands.items() if count},
     }
-    if bun:
-        params["bun"] = bun.zfill(4)
-    if ji:
-        params["ji"] = ji.zfill(4)
 
-    result = call_api(OPERATIONS["지역지구구역"], params)
-    return format_jijugu_result(result, sigungu_cd, bjdong_cd, bun, ji)
+
+def format_unit_area_summary(summary: dict, sigungu_cd: str, bjdong_cd: str, bun: str, ji: str) -> str:
+    """전유공용면적 집계 결과 포맷팅 - 요약, 평형별, 규모별, 동별 표"""
+    output = ["## 전유공용면적 집계 결과"]
+    output.append(f"- 시군구코드: {sigungu_cd}, 법정동코드: {bjdong_cd}, 번: {bun}, 지: {ji or '0000'}")
+    output.append(f"- 조회 행: {summary['rows']:,}건 → 세대 {summary['units']:,}호, 동 {len(summary['dongs'])}개")
+    if not summary["units"]:
+        output.append("\n전유 면적 정보가 없습니다.")
+        return "\n".join(output)
+
+    supply = summary["private"] + summary["common"]
+    output.append(f"- 전용면적 합계: {format_area(summary['private'])}")
+    output.append(f"- 공용면적 합계: {format_area(summary['common'])}")
+    output.append(f"- 전용률: {summary['private'] / supply * 100:.1f}%\n")
+
+    output.append("### 평형(전용면적)별")
+    output.append("| 타입 | 세대수 | 비율 | 전용면적 | 평균 공용 | 평균 공급 |")
+    output.append("|------|--------|------|----------|-----------|-----------|")
+    for unit_type, stats in summary["types"].items():
+        count = stats["units"]
+        private_range = f"{stats['min']:.2f}" if stats["max"] - stats["min"] < 0.01 else f"{stats['min']:.2f}~{stats['max']:.2f}"
+        avg_supply = (stats["private"] + stats["common"]) / count
+        output.append(
+            f"| {unit_type}㎡형 | {count:,} | {count / summary['units'] * 100:.1f}% | {private_range}㎡ "
+            f"| {stats['common'] / count:.2f}㎡ | {avg_supply:.2f}㎡ ({avg_supply / 3.3058:.1f}평) |"
+        )
+    output.append("")
+
+    output.append("### 규모별 분포")
+    for label, count in summary["bands"].items():
+        output.append(f"- {label}: {count:,}호 ({count / summary['units'] * 100:.1f}%)")
+    output.append("")
+
+    band_labels = list(summary["bands"])
+    output.append("### 동별")
+    output.append("| 동 | 세대수 | 전용 합계 | 공용 합계 | 평균 전용 | 타입 | " + " | ".join(band_labels) + " |")
+    output.append("|----|--------|-----------|-----------|-----------|------|" + "|".join("---" for _ in band_labels) + "|")
+    for dong, stats in summary["dongs"].items():
+        avg_private = f"{stats['private'] / stats['units']:.2f}㎡" if stats["units"] else "-"
+        type_list = ", ".join(str(unit_type) for unit_type in sorted(stats["types"])) or "-"
+        band_counts = " | ".join(str(stats["bands"].get(label, 0)) for label in band_labels)
+        output.append(
+            f"| {dong} | {stats['units']:,} | {stats['private']:,.2f}㎡ | {stats['common']:,.2f}㎡ "
+            f"| {avg_private} | {type_list} | {band_counts} |"
+        )
+
+    return "\n".join(output)
+
+
+@mcp.tool()
+async def summarize_unit_areas(
+    sigungu_cd: str,
+    bjdong_cd: str,
+    bun: str,
+    ji: str = "",
+    plat_gb_cd: str = "0",
+    dong_nm: str = "",
+    output_format: str = "markdown"
+) -> str:
+    """
+    단지 전유/공용면적 집계 - 전유공용면적 전체 페이지를 병렬 조회하여 서버에서 집계한 표만 반환
+
+    대단지는 전유공용면적이 수천 행(세대마다 전유 1행 + 공용 여러 행)이므로
+    페이지를 반복 조회하는 대신 이 도구 한 번으로 동별/평형별 합계와 분포를 확인하세요.
+
+    Args:
+        sigungu_cd: 시군구코드 5자리 (예: "11680" 강남구)
+        bjdong_cd: 법정동코드 5자리 (예: "10300" 개포동)
+        bun: 번 4자리 (예: "0012")
+        ji: 지 4자리 (예: "0000") - 옵션
+        plat_gb_cd: 대지구분코드 (0: 대지, 1: 산, 2: 블록) - 기본값 "0"
+        dong_nm: 동명칭 (예: "101") - 옵션, 지정하면 해당 동만 집계
+        output_format: 출력 형식 ("markdown" 기본, "json": 집계 결과 JSON)
+
+    Returns:
+        세대수, 전용/공용면적 합계와 전용률, 평형별 세대수와 평균 공용/공급면적, 규모별 분포, 동별 합계
+    """
+    if output_format not in ("markdown", "json"):
+        return "오류: 잘못된 output_format 입니다. 가능한 값: markdown, json"
+
+    params = build_params(sigungu_cd, bjdong_cd, bun, ji, plat_gb_cd)
+    if dong_nm:
+        params["dongNm"] = dong_nm
+
+    result = await fetch_all_pages(OPERATIONS["전유공용면적"], params)
+    if "error" in result:
+        if output_format == "json":
+            return json.dumps({"error": result["error"]}, ensure_ascii=False)
+        return f"오류: {result['error']}"
+
+    summary = aggregate_unit_areas(result["items"])
+    if output_format == "json":
+        summary["dongs"] = {
+            dong: dict(stats, types=sorted(stats["types"])) for dong, stats in summary["dongs"].items()
+        }
+        summary["types"] = {str(unit_type): stats for unit_type, stats in summary["types"].items()}
+        summary = json.loads(json.dumps(summary), parse_float=lambda value: round(float(value), 2))
+        summary["failedPages"] = result["failedPages"]
+        summary["truncated"] = result["truncated"]
+        return json.dumps(summary, ensure_ascii=False, separators=(",", ":"))
+
+    output = format_unit_area_summary(summary, sigungu_cd, bjdong_cd, bun, ji)
+    notice = format_fetch_all_notice(result)
+    if result["failedPages"] or result["truncated"]:
+        notice += "\n⚠️ 누락된 페이지가 있어 합계가 실제보다 작을 수 있습니다."
+    return f"{output}\n\n{notice}" if notice else output
+
+
+# 재건축 후보 선별 기본 가중치 (점수 = Σ 가중치 × 0~1 로 정규화한 지표)
+SCREENING_WEIGHTS = {
+    "age": 0.4,  # 건축연수 (min_age 부터 +20년까지 선형)
+    "headroom": 0.35,  # 용적률 여유 (허용 용적률 대비)
+    "households": 0.15,  # 세대수 (로그 스케일, 후보 중 최대값 기준)
+    "plat_area": 0.1,  # 대지면적 (후보 중 최대값 기준)
+}
+
+
+def numeric_column(items: list, key: str) -> "np.ndarray":
+    """item 목록에서 숫자 열 추출 (빈 값/숫자가 아닌 값은 NaN)"""
+    def to_float(value) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return float("nan")
+    return np.fromiter((to_float(item.get(key)) for item in items), dtype=np.float64, count=len(items))
+
+
+def recap_columns(items: list) -> dict:
+    """총괄표제부 item 목록을 열 단위 NumPy 배열로 변환"""
+    columns = {
+        key: numeric_column(items, key)
+        for key in ("useAprDay", "platArea", "archArea", "totArea", "vlRatEstmTotArea", "bcRat", "vlRat", "hhldCnt", "hoCnt", "mainBldCnt")
+    }
+    columns["mainPurpsCdNm"] = np.array([item.get("mainPurpsCdNm", "") for item in items], dtype=str)
+    # API 용적률이 0/누락이면 용적률산정연면적 / 대지면적 으로 계산
+    estimated = np.divide(
+        columns["vlRatEstmTotArea"] * 100, columns["platArea"],
+        out=np.full(len(items), np.nan), where=columns["platArea"] > 0,
+    )
+    columns["vlRat"] = np.where(np.nan_to_num(columns["vlRat"]) > 0, columns["vlRat"], estimated)
+    columns["useAprYear"] = np.floor(columns["useAprDay"] / 10000)
+    return columns
+
+
+def screen_recap_records(
+    items: list,
+    min_age: int = 30,
+    allowed_vl_rat: float = 250.0,
+    min_headroom: float = 0.0,
+    min_households: int = 0,
+    min_plat_area: float = 0.0,
+    purpose: str = "",
+    weights: dict | None = None,
+    top_n: int = 20,
+) -> dict:
+    """총괄표제부 레코드 전체에 필터와 점수를 벡터 연산으로 적용하고 상위 top_n 개 선별
+
+    Returns:
+        {"loaded", "passed", "ranked": [(item, 지표 dict), ...], "elapsed_ms"}
+    """
+    started = time.perf_counter()
+    weights = dict(SCREENING_WEIGHTS, **(weights or {}))
+    if not items:
+        return {"loaded": 0, "passed": 0, "ranked": [], "elapsed_ms": 0.0}
+
+    columns = recap_columns(items)
+    age = datetime.now().year - columns["useAprYear"]
+    headroom = allowed_vl_rat - columns["vlRat"]
+    households = np.nan_to_num(columns["hhldCnt"])
+    plat_area = np.nan_to_num(columns["platArea"])
+
+    mask = (age >= min_age) & (headroom >= min_headroom) & (households >= min_households) & (plat_area >= min_plat_area)
+    if purpose:
+        mask &= np.char.find(columns["mainPurpsCdNm"], purpose) >= 0
+    candidates = np.flatnonzero(mask)
+
+    scores = np.zeros(len(items))
+    if candidates.size:
+        scores[candidates] = (
+            weights["age"] * np.clip((age[candidates] - min_age) / 20, 0, 1)
+            + weights["headroom"] * np.clip(headroom[candidates] / allowed_vl_rat, 0, 1)
+            + weights["households"] * np.log1p(households[candidates]) / max(np.log1p(households[candidates].max()), 1e-9)
+            + weights["plat_area"] * plat_area[candidates] / max(plat_area[candidates].max(), 1e-9)
+        )
+
+    # 상위 top_n 만 정렬 (후보가 많아도 전체 정렬하지 않음)
+    top_n = max(1, top_n)
+    if candidates.size > top_n:
+        top = candidates[np.argpartition(-scores[candidates], top_n - 1)[:top_n]]
+    else:
+        top = candidates
+    top = top[np.argsort(-scores[top], kind="stable")]
+
+    ranked = [
+        (items[i], {
+            "score": float(scores[i]),
+            "age": int(age[i]),
+            "vlRat": float(columns["vlRat"][i]),
+            "headroom": float(headroom[i]),
+            "households": int(households[i]),
+            "platArea": float(plat_area[i]),
+            "extraFloorArea": float(plat_area[i] * max(headroom[i], 0) / 100),
+        })
+        for i in top
+    ]
+    return {
+        "loaded": len(items),
+        "passed": int(candidates.size),
+        "ranked": ranked,
+        "elapsed_ms": (time.perf_counter() - started) * 1000,
+    }
+
+
+def load_recap_records(db_path: str, sigungu_cd: str, bjdong_cds: list[str]) -> list:
+    """crawl.py 로 수집한 SQLite 저장소에서 총괄표제부 레코드 로드"""
+    query = "SELECT data FROM records WHERE operation = '총괄표제부' AND sigungu_cd = ?"
+    args = [sigungu_cd]
+    if bjdong_cds:
+        query += f" AND bjdong_cd IN ({', '.join('?' for _ in bjdong_cds)})"
+        args += bjdong_cds
+    with contextlib.closing(sqlite3.connect(os.path.expanduser(db_path))) as db:
+        return [json.loads(row[0]) for row in db.execute(query, args)]
+
+
+@mcp.tool()
+async def screen_reconstruction_candidates(
+    sigungu_cd: str,
+    bjdong_cds: list[str] | None = None,
+    min_age: int = 30,
+    allowed_vl_rat: float = 250.0,
+    min_headroom: float = 0.0,
+    min_households: int = 0,
+    min_plat_area: float = 0.0,
+    purpose: str = "공동주택",
+    weights: dict[str, float] | None = None,
+    top_n: int = 20,
+    source_db: str = "",
+    output_format: str = "markdown"
+) -> str:
+    """
+    재건축 후보 선별 - 지역의 총괄표제부 전체를 배열로 불러와 조건 필터와 점수를 한 번에 계산하고 순위표 반환
+
+    ⭐ search_building_recap_title 결과를 한 건씩 비교하는 대신 사용하세요. 수백 개 단지도 수 ms 에 순위를 매깁니다.
+    - 필터: 건축연수 ≥ min_age, 용적률 여유(allowed_vl_rat - 현재 용적률) ≥ min_headroom, 세대수, 대지면적, 주용도
+    - 점수: 건축연수, 용적률 여유, 세대수(로그), 대지면적의 가중합 (0~1)
+
+    Args:
+        sigungu_cd: 시군구코드 5자리 (예: "11680" 강남구)
+        bjdong_cds: 법정동코드 5자리 목록 (예: ["10300", "10600"]) - API 조회 시 필수, source_db 사용 시 생략하면 시군구 전체
+        min_age: 최소 건축연수 (기본: 30)
+        allowed_vl_rat: 허용 용적률 % (기본: 250, 용도지역/조례에 맞게 조정)
+        min_headroom: 최소 용적률 여유 %p (기본: 0)
+        min_households: 최소 세대수 (기본: 0)
+        min_plat_area: 최소 대지면적 ㎡ (기본: 0)
+        purpose: 주용도에 포함되어야 할 문자열 (기본: "공동주택", 빈 문자열이면 전체)
+        weights: 점수 가중치 (키: age, headroom, households, plat_area) - 일부만 지정 가능
+        top_n: 반환할 후보 수 (기본: 20)
+        source_db: crawl.py 로 수집한 SQLite 파일 경로 - 지정하면 API 대신 저장소에서 로드
+        output_format: 출력 형식 ("markdown" 기본, "json")
+
+    Returns:
+        순위, 단지명, 주소, 사용승인일(건축연수), 용적률과 여유, 추가 가능 연면적, 세대수, 대지면적, 점수
+    """
+    if output_format not in ("markdown", "json"):
+        return "오류: 잘못된 output_format 입니다. 가능한 값: markdown, json"
+    unknown = set(weights or {}) - set(SCREENING_WEIGHTS)
+    if unknown:
+        return f"오류: 알 수 없는 가중치: {', '.join(sorted(unknown))}. 가능한 값: {', '.join(SCREENING_WEIGHTS)}"
+    if allowed_vl_rat <= 0:
+        return "오류: allowed_vl_rat (허용 용적률 %) 은 0 보다 커야 합니다. (예: 250)"
+
+    failed = []
+    if source_db:
+        try:
+            items = load_recap_records(source_db, sigungu_cd, bjdong_cds or [])
+        except sqlite3.Error as e:
+            return f"오류: 저장소를 읽을 수 없습니다 ({source_db}): {e}"
+    else:
+        if not bjdong_cds:
+            return "오류: API 로 조회할 때는 bjdong_cds 가 필요합니다. (crawl.py 로 수집한 저장소는 source_db 로 지정)"
+        operation = OPERATIONS["총괄표제부"]
+        results = await asyncio.gather(
+            *(fetch_all_pages(operation, build_params(sigungu_cd, bjdong_cd)) for bjdong_cd in bjdong_cds)
+        )
+        items = []
+        for bjdong_cd, result in zip(bjdong_cds, results):
+            if "error" in result or result.get("failedPages"):
+                failed.append(bjdong_cd)
+            items.extend(result.get("items", []))
+
+    screening = screen_recap_records(
+        items, min_age, allowed_vl_rat, min_headroom, min_households, min_plat_area, purpose, weights, top_n
+    )
+
+    if output_format == "json":
+        return json.dumps({
+            "loaded": screening["loaded"],
+            "passed": screening["passed"],
+            "elapsedMs": round(screening["elapsed_ms"], 2),
+            "failedBjdongCds": failed,
+            "candidates": [
+                dict(
+                    {key: item.get(key, "") for key in ("bldNm", "platPlc", "sigunguCd", "bjdongCd", "bun", "ji", "useAprDay")},
+                    **{key: round(value, 2) if isinstance(value, float) else value for key, value in stats.items()},
+                )
+                for item, stats in screening["ranked"]
+            ],
+        }, ensure_ascii=False, separators=(",", ":"))
+
+    output = ["## 재건축 후보 선별 결과"]
+    output.append(f"- 시군구코드: {sigungu_cd}, 법정동코드: {', '.join(bjdong_cds) if bjdong_cds else '전체'}")
+    output.append(
+        f"- 조건: 건축연수 ≥ {min_age}년, 용적률 여유 ≥ {min_headroom:g}%p (허용 {allowed_vl_rat:g}%), "
+        f"세대수 ≥ {min_households}, 대지면적 ≥ {min_plat_area:g}㎡" + (f", 주용도 '{purpose}'" if purpose else "")
+    )
+    output.append(
+        f"- 대상 {screening['loaded']:,}건 중 {screening['passed']:,}건 통과 → 상위 {len(screening['ranked'])}건 "
+        f"(선별 {screening['elapsed_ms']:.1f}ms)\n"
+    )
+    if failed:
+        output.append(f"⚠️ 일부 법정동 조회 실패 또는 누락 페이지 있음: {', '.join(failed)}\n")
+
+    if not screening["ranked"]:
+        output.append("조건을 만족하는 단지가 없습니다.")
+        return "\n".join(output)
+
+    output.append("| 순위 | 단지명 | 지번주소 | 사용승인일 (연수) | 용적률 | 여유 | 추가 가능 연면적 | 세대수 | 대지면적 | 점수 |")
+    output.append("|------|--------|----------|------------------|--------|------|------------------|--------|----------|------|")
+    for rank, (item, stats) in enumerate(screening["ranked"], 1):
+        output.append(
+            f"| {rank} | {item.get('bldNm', '-').strip() or '-'} | {item.get('platPlc', '-')} "
+            f"| {format_date(item.get('useAprDay', ''))} ({stats['age']}년) | {stats['vlRat']:.1f}% "
+            f"| {stats['headroom']:+.1f}%p | {stats['extraFloorArea']:,.0f}㎡ | {stats['households']:,} "
+            f"| {stats['platArea']:,.0f}㎡ | {stats['score']:.3f} |"
+        )
+    return "\n".join(output)
+
+
+def hangul_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (오타·받침 차이에도 비슷한 문자열이 되도록)"""
+    jamo = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            jamo.append(chr(0x1100 + code // 588))
+            jamo.append(chr(0x1161 + code % 588 // 28))
+            if code % 28:
+                jamo.append(chr(0x11A7 + code % 28))
+        else:
+            jamo.append(ch)
+    return "".join(jamo)
+
+
+def jamo_bigrams(text: str) -> set:
+    jamo = hangul_jamo(text)
+    return {jamo[i:i + 2] for i in range(len(jamo) - 1)} or {jamo}
+
+
+class BjdongIndex:
+    """법정동코드 색인 (paths 중 처음 존재하는 TSV 파일을 첫 조회 때 로드)
+
+    - build_bjdong_index.py 로 새로 만든 색인이 있으면 그것을, 없으면 함께 배포한 전국 bjdong_codes.tsv 사용
+    - 일부 지역만 담은 색인은 파일 머리글 "# coverage=" 로 범위 표시 (없으면 전국)
+
+    - codes/names: 10자리 법정동코드 순으로 정렬한 배열 (코드 접두사는 bisect)
+    - lowest: 최하위 지명(동/리) 정렬 배열 → 행 번호 목록 (이름 접두사는 bisect)
+    - areas: 상위 지명(시도/시군구/읍면) → 그 아래 행 번호 목록
+    - 자모 bigram 역색인은 접두사로 못 찾았을 때(오타 등) 처음 필요해지는 시점에 생성
+    """
+
+    def __init__(self, paths: list):
+        self.paths = paths
+        self.path = ""
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.codes = []
+        self.names = []
+        self.meta = {}
+        self._lowest_names = []
+        self._lowest_rows = []
+        self._areas = {}
+        self._bigrams = None
+        self._bigram_counts = None
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            rows = []
+            self.path = next((path for path in self.paths if path and os.path.exists(path)), "")
+            if self.path:
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.startswith("#"):
+                            key, _, value = line[1:].strip().partition("=")
+                            self.meta[key.strip()] = value.strip()
+                            continue
+                        code, _, name = line.rstrip("\n").partition("\t")
+                        # 시도/시군구 자체 행(법정동 부분이 00000)은 제외
+                        if len(code) == 10 and name and code[5:] != "00000":
+                            rows.append((code, name))
+            rows.sort()
+            self.codes = [code for code, _ in rows]
+            self.names = [name for _, name in rows]
+
+            by_lowest = collections.defaultdict(list)
+            areas = collections.defaultdict(list)
+            for row, name in enumerate(self.names):
+                *upper, lowest = name.split()
+                by_lowest[lowest].append(row)
+                for token in upper:
+                    areas[token].append(row)
+            self._areas = dict(areas)
+            self._lowest_names = sorted(by_lowest)
+            self._lowest_rows = [by_lowest[name] for name in self._lowest_names]
+            self._loaded = True
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self.codes)
+
+    def _fuzzy_index(self) -> tuple:
+        """(자모 bigram → 최하위 지명 번호 목록, 지명별 bigram 수) - 처음 필요할 때 생성"""
+        with self._lock:
+            if self._bigrams is None:
+                bigrams = collections.defaultdict(list)
+                counts = []
+                for i, name in enumerate(self._lowest_names):
+                    grams = jamo_bigrams(name)
+                    counts.append(len(grams))
+                    for gram in grams:
+                        bigrams[gram].append(i)
+                self._bigrams, self._bigram_counts = dict(bigrams), counts
+        return self._bigrams, self._bigram_counts
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """지명/코드로 검색 - [(법정동코드 10자리, 전체 지명, 일치 방식, 점수), ...]
+
+        - 숫자: 법정동코드 접두사 (예: "11680" → 강남구의 모든 동)
+        - 지명: 마지막 단어를 동/리 이름 접두사로 찾고, 앞 단어(시도/시군구/읍면)는 전체 지명에 포함되어야 함
+        - 접두사로 없으면 자모 bigram 유사도(Dice)로 오타·받침 차이를 보정
+        """
+        self._load()
+        tokens = query.split()
+        if not tokens:
+            return []
+
+        if query.replace(" ", "").isdigit():
+            prefix = query.replace(" ", "")
+            start = bisect.bisect_left(self.codes, prefix)
+            results = []
+            for row in range(start, len(self.codes)):
+                if not self.codes[row].startswith(prefix) or len(results) >= limit:
+                    break
+                results.append((self.codes[row], self.names[row], "code", 1.0))
+            return results
+
+        last, context = tokens[-1], tokens[:-1]
+
+        def matches_context(row: int) -> bool:
+            return all(token in self.names[row] for token in context)
+
+        results = []
+        start = bisect.bisect_left(self._lowest_names, last)
+        for i in range(start, len(self._lowest_names)):
+            name = self._lowest_names[i]
+            if not name.startswith(last):
+                break
+            kind, score = ("exact", 1.0) if name == last else ("prefix", len(last) / len(name))
+            results.extend((row, kind, score) for row in self._lowest_rows[i] if matches_context(row))
+
+        if not results:
+            # 마지막 단어가 시군구/읍면이면 ("강남구", "기장군 정관읍") 그 아래 동/리 전체
+            results = [(row, "area", 0.9) for row in self._areas.get(last, ()) if matches_context(row)]
+
+        if not results:
+            grams = jamo_bigrams(last)
+            overlap = collections.Counter()
+            index, counts = self._fuzzy_index()
+            for gram in grams:
+                overlap.update(index.get(gram, ()))
+            for i, shared in overlap.items():
+                score = 2 * shared / (len(grams) + counts[i])
+                if score >= 0.5:
+                    results.extend((row, "fuzzy", score) for row in self._lowest_rows[i] if matches_context(row))
+
+        results.sort(key=lambda r: (-r[2], self.codes[r[0]]))
+        return [(self.codes[row], self.names[row], kind, score) for row, kind, score in results[:limit]]
+
+    def resolve(self, name: str) -> tuple | None:
+        """지명이 법정동 하나로만 정확히 좁혀지면 (sigungu_cd, bjdong_cd), 아니면 None"""
+        exact = [code for code, _, kind, _ in self.search(name, limit=2) if kind in ("exact", "code")]
+        if len(exact) != 1:
+            return None
+        return exact[0][:5], exact[0][5:]
+
+    @property
+    def coverage(self) -> str:
+        """색인에 들어 있는 지역 범위 (예: "서울특별시", "전국")"""
+        self._load()
+        return self.meta.get("coverage", "전국")
+
+    def stats(self) -> dict:
+        self._load()
+        return {"path": self.path, "entries": len(self.codes), "coverage": self.coverage, **self.meta}
+
+
+# 법정동코드 색인 (색인에서 못 찾은 지명은 StanReginCd API 로 검색)
+bjdong_index = BjdongIndex([BJDONG_INDEX_PATH, BUNDLED_BJDONG_INDEX_PATH])
+
+
+def search_region_rows(locatadd_nm: str = "", page_no: int = 1, num_of_rows: int = 1000) -> dict:
+    """행정안전부 법정동코드(StanReginCd) API 한 페이지 조회
+
+    Returns:
+        {"totalCount": int, "rows": [{"region_cd", "locatadd_nm", ...}]} 또는 {"error": "..."}
+    """
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        return {"error": "DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다."}
+
+    limiter = get_rate_limiter(api_key)
+    wait, quota_error = limiter.reserve(REGION_CODE_SERVICE)
+    if quota_error:
+        return {"error": quota_error, "quotaExhausted": True}
+
+    params = {"type": "json", "pageNo": str(page_no), "numOfRows": str(num_of_rows), "flag": "Y"}
+    if locatadd_nm:
+        params["locatadd_nm"] = locatadd_nm
+    path = f"{REGION_CODE_PATH}?serviceKey={api_key}&{urllib.parse.urlencode(params, quote_via=urllib.parse.quote)}"
+    status = None
+    try:
+        if wait:
+            time.sleep(wait)
+        status, reason, body = connection_pool.request("GET", path, headers=API_HEADERS)
+        if status != 200:
+            return {"error": f"HTTP 오류: {status} - {reason}"}
+        data = json.loads(body)
+    except (http.client.HTTPException, OSError) as e:
+        return {"error": f"HTTP 오류: {e}"}
+    except json.JSONDecodeError:
+        return {"error": "법정동코드 API 응답을 해석할 수 없습니다. (결과 없음 또는 서비스 오류)"}
+    finally:
+        if status is None:
+            limiter.release(REGION_CODE_SERVICE)
+        else:
+            limiter.record(REGION_CODE_SERVICE, "" if status == 200 else f"HTTP {status}")
+
+    sections = data.get("StanReginCd", [])
+    if len(sections) < 2:
+        return {"totalCount": 0, "rows": []}
+    total = next((h["totalCount"] for h in sections[0].get("head", []) if "totalCount" in h), 0)
+    return {"totalCount": int(total), "rows": sections[1].get("row", [])}
+
+
+@mcp.tool()
+async def find_bjdong_code(query: str, limit: int = 10) -> str:
+    """
+    지명으로 시군구코드(sigungu_cd)와 법정동코드(bjdong_cd) 검색 - 모든 건축물대장 도구에 필요한 코드
+
+    ⭐ 코드를 추측하지 말고 먼저 이 도구로 찾으세요. 전국 법정동 로컬 색인(2024-01 행정구역 기준)에서 바로 찾으며
+    오타도 어느 정도 보정합니다. 색인 이후 신설된 법정동은 법정동코드 API 로 검색
+    (build_bjdong_index.py 로 최신 전체자료 색인을 만들 수 있음, 결과 하단에 색인 범위 표시)
+
+    Args:
+        query: 지명 또는 코드 접두사
+            - 동 이름: "개포동", "개포" (접두사)
+            - 시군구와 함께: "강남구 개포동", "서울 중구 신당동" (같은 동 이름이 여러 곳일 때)
+            - 시군구만: "강남구" (그 아래 법정동 전체)
+            - 코드 접두사: "11680" (강남구의 모든 법정동)
+        limit: 최대 결과 수 (기본: 10)
+
+    Returns:
+        전체 지명, sigungu_cd, bjdong_cd 목록
+    """
+    output = [f"## '{query}' 법정동코드 검색 결과\n"]
+
+    def search_local() -> tuple:
+        # 첫 조회 때 TSV 로드와 색인 생성(오타 보정용 bigram 포함)이 일어나므로 이벤트 루프 밖에서 실행
+        started = time.perf_counter()
+        found = bjdong_index.search(query, max(1, limit))
+        return found, bjdong_index.stats(), (time.perf_counter() - started) * 1000
+
+    results, index_stats, elapsed_ms = await asyncio.to_thread(search_local)
+    coverage = index_stats["coverage"]
+    source = f"로컬 색인 {index_stats['entries']:,}개 법정동 (범위: {coverage}), {elapsed_ms:.2f}ms"
+    if not results and query.split() and not query.replace(" ", "").isdigit():
+        # 색인에 없는 지역이면 API 로 검색 (지명 포함 검색만 가능) - 대기/요청이 이벤트 루프를 막지 않도록 스레드에서 실행
+        data = await asyncio.to_thread(search_region_rows, query, 1, max(1, limit) * 2)
+        if "error" in data:
+            output.append(f"오류: {data['error']}")
+            output.append("\n`python build_bjdong_index.py` 로 최신 전체자료 색인을 만들면 API 없이 검색할 수 있습니다.")
+            return "\n".join(output)
+        last = query.split()[-1] if query.split() else ""
+        results = [
+            (row["region_cd"], row.get("locatadd_nm", ""), "exact" if row.get("locallow_nm") == last else "api", 1.0)
+            for row in data["rows"]
+            if row.get("region_cd", "")[5:] != "00000"
+        ][:max(1, limit)]
+        source = f"법정동코드 API (로컬 색인 범위({coverage})에 없음 - build_bjdong_index.py 로 색인 갱신 가능)"
+
+    if not results:
+        output.append("검색 결과가 없습니다.\n")
+        output.append("### 검색 팁")
+        output.append("- 동/리 이름: `개포동`, `정관읍 용수리`")
+        output.append("- 시군구와 함께: `강남구 개포동`, `서울 중구 신당동`")
+        return "\n".join(output)
+
+    output.append("| 지명 | sigungu_cd | bjdong_cd | 일치 |")
+    output.append("|------|------------|-----------|------|")
+    match_names = {"exact": "정확", "prefix": "접두사", "area": "하위 법정동", "fuzzy": "유사", "code": "코드", "api": "포함"}
+    for code, name, kind, score in results:
+        match = match_names[kind] + (f" ({score:.2f})" if kind == "fuzzy" else "")
+        output.append(f"| {name} | `{code[:5]}` | `{code[5:]}` | {match} |")
+
+    exact = [r for r in results if r[2] in ("exact", "code")]
+    if len(results) == 1 or len(exact) == 1:
+        code = (exact or results)[0][0]
+        output.append(f"\n✅ 건축물대장 조회에 사용: sigungu_cd=`{code[:5]}`, bjdong_cd=`{code[5:]}`")
+    elif len(exact) > 1:
+        example = " ".join(exact[0][1].split()[-2:])
+        output.append(f"\n⚠️ 같은 이름의 법정동이 {len(exact)}곳 있습니다. 시군구와 함께 검색하세요. (예: `{example}`)")
+    if coverage != "전국" and any(kind in ("prefix", "fuzzy") for _, _, kind, _ in results):
+        output.append(
+            f"\n⚠️ 로컬 색인은 {coverage}만 포함합니다. 다른 시도의 지명이면 시도/시군구와 함께 검색하세요. "
+            "(예: `부산 해운대구 우동`)"
+        )
+    output.append(f"\n_{source}_")
+    return "\n".join(output)
 
 
 @mcp.tool()
@@ -863,7 +3102,7 @@ def get_building_operations() -> str:
         "표제부": "동별 상세 정보 (구조, 용도, 층수, 면적, 승강기, 내진설계)",
         "층별개요": "층별 구조, 용도, 면적 정보",
         "부속지번": "건축물 관련 부속지번 정보",
-        "전유공용면적": "전유/공용 면적 상세 정보",
+        "전유공용면적": "전유/공용 면적 상세 정보 (단지 집계는 summarize_unit_areas)",
         "오수정화시설": "오수정화시설 형식, 용량 정보",
         "주택가격": "공동주택 공시가격 정보",
         "전유부": "집합건물 세대별 정보 (동/호명칭, 층)",
@@ -887,11 +3126,155 @@ def get_building_operations() -> str:
     output.append("- **plat_gb_cd**: 대지구분코드 (0:대지, 1:산, 2:블록)")
     output.append("")
     output.append("### 코드 조회")
-    output.append("- 시군구코드/법정동코드: [행정표준코드관리시스템](https://www.code.go.kr)")
-    output.append("- 법정동코드목록조회 메뉴에서 확인 가능")
+    output.append("- **find_bjdong_code** 도구로 지명에서 sigungu_cd/bjdong_cd 를 바로 찾을 수 있음 (예: `강남구 개포동`)")
+    output.append("- 원본 목록: [행정표준코드관리시스템](https://www.code.go.kr) 법정동코드목록조회")
 
     return "\n".join(output)
 
 
+@mcp.tool()
+def get_api_stats() -> str:
+    """
+    건축물대장 API 호출 통계 조회 (커넥션 재사용률, 핸드셰이크 시간 등)
+
+    대량 조회 전에 오늘 남은 호출 가능 건수를 확인하세요.
+
+    Returns:
+        커넥션 풀, 비동기 호출, 응답 캐시, 중복 요청 병합, 호출 속도/일일 호출건수 통계
+    """
+    pool = connection_pool.stats()
+    executor = async_executor.stats()
+    cache = response_cache.stats()
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+
+    output = ["## 건축물대장 API 호출 통계\n"]
+    output.append("### 커넥션 풀")
+    output.append(f"- **요청 수**: {pool['requests']}건")
+    output.append(f"- **커넥션 재사용**: {pool['reused']}회 (재사용률 {pool['reuse_rate'] * 100:.1f}%)")
+    output.append(f"- **신규 커넥션**: {pool['created']}개")
+    output.append(
+        f"- **핸드셰이크(TCP+TLS)**: 평균 {pool['handshake_avg_ms']:.1f}ms, "
+        f"최대 {pool['handshake_max_ms']:.1f}ms, 최근 {pool['handshake_last_ms']:.1f}ms"
+    )
+    output.append(f"- **유휴 커넥션**: {pool['idle']}/{pool['max_size']}개")
+    output.append(
+        f"- **폐기**: 유휴만료 {pool['evicted_idle']}, 상태불량 {pool['evicted_unhealthy']}, "
+        f"오류 {pool['closed_on_error']}"
+    )
+    output.append("")
+    output.append("### 비동기 호출")
+    output.append(f"- **요청 수**: {executor['requests']}건")
+    output.append(f"- **동시 요청**: 현재 {executor['in_flight']}건, 최대 {executor['max_in_flight']}건 (한도 {executor['max_concurrency']})")
+    output.append(f"- **대기 중**: {executor['waiting']}건")
+    output.append("")
+    output.append("### 응답 캐시")
+    if cache["enabled"]:
+        output.append(f"- **적중/미스**: {cache['hits']}/{cache['misses']} (적중률 {cache['hit_rate'] * 100:.1f}%)")
+        output.append(f"- **저장 항목**: {cache['entries']}개, {cache['bytes'] / 1024:.1f}KB / {cache['max_bytes'] / 1024 / 1024:.0f}MB")
+        output.append(
+            f"- **폐기**: 만료 {cache['expired']}, LRU 제거 {cache['evictions']}, "
+            f"오류 응답 미저장 {cache['skipped_errors']}"
+        )
+        output.append(f"- **경로**: {cache['path']}")
+    else:
+        output.append("- 비활성화됨 (BUILDING_CACHE_TTL=0)")
+
+    coalescer = request_coalescer.stats()
+    output.append("")
+    output.append("### 중복 요청 병합")
+    output.append(
+        f"- **절약한 요청**: {coalescer['coalesced']}건 "
+        f"(업스트림 {coalescer['leaders']}건, 병합률 {coalescer['saved_rate'] * 100:.1f}%)"
+    )
+    output.append(f"- **진행 중**: {coalescer['in_flight']}건, 한 요청의 최대 대기자 {coalescer['max_waiters']}명")
+
+    if api_key:
+        limiter = get_rate_limiter(api_key)
+        limits = limiter.stats()
+        output.append("")
+        output.append("### 호출 속도 / 일일 호출건수")
+        output.append(f"- **속도 제한**: 초당 {limits['base_rate']:g}건 (버스트 {limits['burst']}건)")
+        output.append(
+            f"- **대기**: {limits['throttled']}회, 누적 {limits['throttled_wait_s']:.1f}초 "
+            f"(트래픽 초과 응답 {limits['traffic_errors']}회)"
+        )
+        slowed = {op: rate for op, rate in limits["current_rates"].items() if rate < limits["base_rate"]}
+        for op, rate in slowed.items():
+            output.append(f"  - {op}: 트래픽 초과로 초당 {rate:.2f}건으로 감속 중")
+        output.append(f"- **오늘 남은 호출 가능 건수** (오퍼레이션별 한도 {limits['daily_limit']:,}건)")
+        usage = limiter.usage_today()
+        for op_name, operation in OPERATIONS.items():
+            used, remaining = usage.get(operation, (0, limiter.remaining(operation)))
+            remaining_text = "제한 없음" if remaining is None else f"{remaining:,}건"
+            output.append(f"  - {op_name}: 사용 {used:,}건, 남음 {remaining_text}")
+
+    return "\n".join(output)
+
+
+@mcp.tool()
+def get_metrics(operation: str = "", output_format: str = "markdown") -> str:
+    """
+    건축물대장 API 단계별 소요시간과 오퍼레이션별 카운터 조회 - 느린 호출의 원인(연결, 서버 대기, 본문 수신, 파싱, 포맷팅) 확인용
+
+    Args:
+        operation: 오퍼레이션 이름 또는 API 이름 (예: "표제부", "getBrTitleInfo") - 옵션, 기본은 전체
+        output_format: 출력 형식
+            - "markdown": 오퍼레이션별 단계 시간표 (횟수, 평균, p50, p95, 최대)
+            - "json": 같은 내용을 JSON 으로
+            - "prometheus": Prometheus 텍스트 형식 (히스토그램/카운터)
+
+    Returns:
+        단계별(queue, connect, wait, body, parse, format, total) 시간과 요청/캐시 적중/수신 바이트/건수/오류 코드
+    """
+    if output_format == "prometheus":
+        return metrics.to_prometheus()
+    if output_format not in ("markdown", "json"):
+        return "오류: 잘못된 output_format 입니다. 가능한 값: markdown, json, prometheus"
+
+    snapshot = metrics.snapshot()
+    if operation:
+        api_name = OPERATIONS.get(operation, operation)
+        snapshot = {api_name: snapshot[api_name]} if api_name in snapshot else {}
+    if output_format == "json":
+        return json.dumps(snapshot, ensure_ascii=False, separators=(",", ":"))
+
+    if not snapshot:
+        return "아직 기록된 호출이 없습니다."
+
+    op_names = {api_name: op_name for op_name, api_name in OPERATIONS.items()}
+    output = ["## 건축물대장 API 계측\n"]
+    for api_name, data in snapshot.items():
+        counters = data["counters"]
+        output.append(f"### {op_names.get(api_name, api_name)} (`{api_name}`)")
+        output.append(
+            f"- 요청 {counters.get('requests', 0):,}건, 캐시 적중 {counters.get('cache_hits', 0):,}건, 병합 {counters.get('coalesced', 0):,}건, "
+            f"수신 {counters.get('response_bytes', 0) / 1024:,.1f}KB, 항목 {counters.get('items', 0):,}건"
+        )
+        if data["errors"]:
+            errors = ", ".join(f"{code}: {count}건" for code, count in sorted(data["errors"].items()))
+            output.append(f"- 오류: {errors}")
+        if data["phases"]:
+            output.append("")
+            output.append("| 단계 | 횟수 | 평균 | p50 | p95 | 최대 |")
+            output.append("|------|------|------|-----|-----|------|")
+            for phase in ("queue", "connect", "wait", "body", "parse", "format", "total"):
+                timing = data["phases"].get(phase)
+                if timing:
+                    output.append(
+                        f"| {phase} | {timing['count']:,} | {timing['avg_ms']:.1f}ms | {timing['p50_ms']:.1f}ms "
+                        f"| {timing['p95_ms']:.1f}ms | {timing['max_ms']:.1f}ms |"
+                    )
+        output.append("")
+
+    output.append("※ queue: 속도 제한/동시 요청 대기, connect: DNS+TCP+TLS (새 커넥션만), wait: 서버 응답 대기, body: 본문 수신")
+    return "\n".join(output)
+
+
+@mcp.resource("metrics://building-register/prometheus", mime_type="text/plain")
+def metrics_prometheus() -> str:
+    """건축물대장 API 계측 (Prometheus 텍스트 형식)"""
+    return metrics.to_prometheus()
+
+
 if __name__ == "__main__":
     mcp.run()
@@ -0,0 +1,62 @@
+"""HTTPSConnectionPool - 잠금 밖 소켓 확인, 연결/읽기 시간 제한 분리"""
+
+import socket
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def server(load_test_server):
+    return load_test_server("building-register")
+
+
+@pytest.fixture
+def listener():
+    """연결만 받아 주는 로컬 소켓 (accept 는 backlog 가 대신함)"""
+    sock = socket.create_server(("127.0.0.1", 0))
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def pool(server, listener):
+    host, port = listener.getsockname()
+    pool = server.HTTPSConnectionPool(f"{host}:{port}", connect_timeout=2.5, read_timeout=12.0, use_tls=False)
+    yield pool
+    pool.close()
+
+
+def test_new_connection_uses_separate_timeouts(pool):
+    conn, reused = pool._acquire()
+    assert not reused
+    assert conn.timeout == 2.5
+    assert conn.sock.gettimeout() == 12.0
+    conn.close()
+
+
+def test_socket_checks_run_outside_pool_lock(server, pool, monkeypatch):
+    held = []
+
+    def is_healthy(conn):
+        held.append(pool._lock.locked())
+        return len(held) > 1
+
+    def close(conn):
+        held.append(pool._lock.locked())
+
+    monkeypatch.setattr(server.HTTPSConnectionPool, "_is_healthy", staticmethod(is_healthy))
+    first, _ = pool._acquire()
+    second, _ = pool._acquire()
+    pool._release(first)
+    pool._release(second)
+    monkeypatch.setattr(type(second), "close", close)
+
+    # 뒤쪽(second) 은 확인 실패로 폐기, first 는 재사용
+    conn, reused = pool._acquire()
+    assert reused and conn is first
+    assert held == [False, False, False]
+    stats = pool.stats()
+    assert (stats["evicted_unhealthy"], stats["reused"], stats["idle"]) == (1, 1, 0)
+    monkeypatch.undo()
+    first.close()
+    second.close()
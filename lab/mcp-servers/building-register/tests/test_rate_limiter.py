@@ -0,0 +1,161 @@
+"""RateLimiter - 일일 호출건수 집계 (예약 포함, 한국 시간 자정 초기화)"""
+
+import ast
+from datetime import datetime, timezone
+
+import pytest
+
+SERVICE = "getBrTitleInfo"
+
+
+@pytest.fixture(scope="module")
+def server(load_test_server):
+    return load_test_server("building-register")
+
+
+@pytest.fixture
+def day(server, monkeypatch):
+    """RateLimiter.today() 를 바꿔 가며 날짜 경계를 재현"""
+    current = {"value": "20240101"}
+    monkeypatch.setattr(server.RateLimiter, "today", staticmethod(lambda: current["value"]))
+    return current
+
+
+@pytest.fixture
+def limiter(server, tmp_path, day):
+    return server.RateLimiter("test-key", str(tmp_path / "quota.sqlite3"), rate=1000, burst=100, daily_limit=3)
+
+
+def granted(limiter, count: int) -> int:
+    return sum(limiter.reserve(SERVICE)[1] is None for _ in range(count))
+
+
+@pytest.mark.parametrize(
+    "utc, expected",
+    [
+        (datetime(2024, 1, 1, 14, 59, 59, tzinfo=timezone.utc), "20240101"),
+        (datetime(2024, 1, 1, 15, 0, 0, tzinfo=timezone.utc), "20240102"),
+    ],
+)
+def test_today_is_kst(server, monkeypatch, utc, expected):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return utc.astimezone(tz)
+
+    monkeypatch.setattr(server, "datetime", FrozenDatetime)
+    assert server.RateLimiter.today() == expected
+
+
+def test_in_flight_reservations_count_against_limit(limiter):
+    assert granted(limiter, 10) == 3
+    assert limiter.remaining(SERVICE) == 0
+    assert limiter.stats()["quota_rejections"] == 7
+    # 응답을 아직 받지 않았으므로 사용 건수는 그대로, 남은 건수는 예약만큼 줄어듦
+    assert limiter.usage_today() == {SERVICE: (0, 0)}
+
+
+def test_usage_today_matches_remaining(limiter):
+    limiter.reserve(SERVICE)
+    limiter.record(SERVICE, "00")
+    limiter.reserve(SERVICE)
+    used, remaining = limiter.usage_today()[SERVICE]
+    assert (used, remaining) == (1, 1)
+    assert remaining == limiter.remaining(SERVICE)
+    limiter.release(SERVICE)
+    assert limiter.usage_today() == {SERVICE: (1, 2)}
+
+
+def test_release_returns_reservation(limiter):
+    assert granted(limiter, 3) == 3
+    limiter.release(SERVICE)
+    assert limiter.remaining(SERVICE) == 1
+    assert granted(limiter, 2) == 1
+
+
+def test_record_moves_reservation_to_usage(limiter):
+    assert granted(limiter, 2) == 2
+    limiter.record(SERVICE, "00")
+    limiter.record(SERVICE, "00")
+    assert limiter.usage_today() == {SERVICE: (2, 1)}
+    assert limiter.remaining(SERVICE) == 1
+    assert granted(limiter, 3) == 1
+
+
+def test_usage_resets_at_kst_midnight(limiter, day):
+    for _ in range(3):
+        limiter.reserve(SERVICE)
+        limiter.record(SERVICE, "00")
+    assert granted(limiter, 1) == 0
+
+    day["value"] = "20240102"
+    assert limiter.usage_today() == {}
+    assert limiter.remaining(SERVICE) == 3
+    assert granted(limiter, 1) == 1
+    limiter.record(SERVICE, "00")
+    assert limiter.usage_today() == {SERVICE: (1, 2)}
+
+    # 전날 집계는 그대로 남음
+    day["value"] = "20240101"
+    assert limiter.usage_today() == {SERVICE: (3, 0)}
+
+
+def test_reservation_recorded_after_midnight_counts_for_new_day(limiter, day):
+    assert granted(limiter, 1) == 1
+    day["value"] = "20240102"
+    limiter.record(SERVICE, "00")
+    assert limiter.usage_today() == {SERVICE: (1, 2)}
+    day["value"] = "20240101"
+    assert limiter.usage_today() == {}
+
+
+def test_result_code_21_exhausts_until_next_day(limiter, day):
+    limiter.reserve(SERVICE)
+    limiter.record(SERVICE, "21")
+    assert limiter.remaining(SERVICE) == 0
+    assert granted(limiter, 1) == 0
+
+    day["value"] = "20240102"
+    assert limiter.remaining(SERVICE) == 3
+    assert granted(limiter, 1) == 1
+
+
+def test_usage_shared_between_processes(server, limiter, tmp_path):
+    other = server.RateLimiter("test-key", str(tmp_path / "quota.sqlite3"), rate=1000, burst=100, daily_limit=3)
+    other.reserve(SERVICE)
+    other.record(SERVICE, "00")
+    other.reserve(SERVICE)
+    other.record(SERVICE, "00")
+    assert limiter.remaining(SERVICE) == 1
+    assert granted(limiter, 2) == 1
+
+    # 다른 API 키는 따로 집계
+    third = server.RateLimiter("other-key", str(tmp_path / "quota.sqlite3"), rate=1000, burst=100, daily_limit=3)
+    assert third.remaining(SERVICE) == 3
+
+
+def test_services_are_counted_separately(limiter):
+    assert granted(limiter, 3) == 3
+    assert limiter.reserve("getBrRecapTitleInfo")[1] is None
+
+
+def test_traffic_error_pauses_service(limiter):
+    limiter.reserve(SERVICE)
+    limiter.record(SERVICE, "20")
+    wait, error = limiter.reserve(SERVICE)
+    assert error is None
+    assert wait >= 0.9
+    assert limiter.stats()["current_rates"][SERVICE] == 500
+
+
+def class_source(module, name: str) -> str:
+    with open(module.__file__, encoding="utf-8") as f:
+        source = f.read()
+    node = next(n for n in ast.parse(source).body if isinstance(n, ast.ClassDef) and n.name == name)
+    return ast.get_source_segment(source, node)
+
+
+def test_copies_in_both_servers_are_identical(server, load_test_server):
+    """real-estate-transaction 의 RateLimiter 는 이 파일의 복사본 - 한쪽만 고치지 않도록"""
+    other = load_test_server("real-estate-transaction")
+    assert class_source(other, "RateLimiter") == class_source(server, "RateLimiter")
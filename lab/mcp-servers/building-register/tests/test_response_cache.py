@@ -0,0 +1,140 @@
+"""ResponseCache - 오퍼레이션별 TTL, 용량 초과 시 LRU 제거, 오류 응답 미저장"""
+
+import json
+
+import pytest
+
+PARAMS = {"sigunguCd": "11680", "bjdongCd": "10300", "bun": "12", "ji": "3"}
+
+
+@pytest.fixture(scope="module")
+def server(load_test_server):
+    return load_test_server("building-register")
+
+
+@pytest.fixture(scope="module")
+def title_response(server, read_fixture):
+    """표제부 픽스처 응답 (resultCode 00)"""
+    return server.parse_xml_response(read_fixture("building-register", "getBrTitleInfo.xml"))
+
+
+@pytest.fixture
+def clock(server, monkeypatch):
+    """캐시가 쓰는 time.time() 을 고정 시계로 교체"""
+    now = {"value": 1_000_000.0}
+    monkeypatch.setattr(server.time, "time", lambda: now["value"])
+    return now
+
+
+@pytest.fixture
+def make_cache(server, tmp_path, clock):
+    def make(max_bytes=10 * 1024 * 1024, default_ttl=60.0, ttls=None):
+        return server.ResponseCache(str(tmp_path / "responses.sqlite3"), max_bytes, default_ttl, ttls)
+
+    return make
+
+
+def params_for(bun: int) -> dict:
+    return dict(PARAMS, bun=str(bun))
+
+
+def test_hit_returns_stored_result(make_cache, title_response):
+    cache = make_cache()
+    cache.put("getBrTitleInfo", PARAMS, title_response)
+    assert cache.get("getBrTitleInfo", PARAMS) == title_response
+    # 번/지 0 채움, 공백, 키 순서가 달라도 같은 키
+    assert cache.get("getBrTitleInfo", {"ji": "0003", "bun": " 0012", "bjdongCd": "10300", "sigunguCd": "11680"}) == title_response
+    assert cache.get("getBrRecapTitleInfo", PARAMS) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"], stats["entries"]) == (2, 1, 1, 1)
+
+
+def test_entry_expires_after_ttl(make_cache, clock, title_response):
+    cache = make_cache(default_ttl=60)
+    cache.put("getBrTitleInfo", PARAMS, title_response)
+
+    clock["value"] += 59
+    assert cache.get("getBrTitleInfo", PARAMS) is not None
+    clock["value"] += 1
+    assert cache.get("getBrTitleInfo", PARAMS) is None
+
+    stats = cache.stats()
+    assert stats["expired"] == 1
+    assert stats["entries"] == 0
+    assert stats["bytes"] == 0
+
+
+def test_per_operation_ttl(make_cache, clock, title_response):
+    cache = make_cache(default_ttl=60, ttls={"getBrTitleInfo": 3600, "getBrExposInfo": 0})
+    cache.put("getBrTitleInfo", PARAMS, title_response)
+    cache.put("getBrRecapTitleInfo", PARAMS, title_response)
+    cache.put("getBrExposInfo", PARAMS, title_response)
+
+    clock["value"] += 600
+    assert cache.get("getBrTitleInfo", PARAMS) is not None
+    assert cache.get("getBrRecapTitleInfo", PARAMS) is None
+    assert cache.get("getBrExposInfo", PARAMS) is None
+    assert cache.stats()["stores"] == 2
+
+
+def test_lru_eviction_keeps_recently_used(make_cache, clock, title_response):
+    size = len(json.dumps(title_response, ensure_ascii=False).encode("utf-8"))
+    cache = make_cache(max_bytes=size * 2)
+
+    cache.put("getBrTitleInfo", params_for(1), title_response)
+    clock["value"] += 1
+    cache.put("getBrTitleInfo", params_for(2), title_response)
+    clock["value"] += 1
+    # 1번을 조회해 최근 사용으로 만들면 세 번째 저장 시 2번이 제거됨
+    assert cache.get("getBrTitleInfo", params_for(1)) is not None
+    clock["value"] += 1
+    cache.put("getBrTitleInfo", params_for(3), title_response)
+
+    assert cache.get("getBrTitleInfo", params_for(2)) is None
+    assert cache.get("getBrTitleInfo", params_for(1)) is not None
+    assert cache.get("getBrTitleInfo", params_for(3)) is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= size * 2
+
+
+def test_oversized_result_is_not_stored(make_cache, title_response):
+    cache = make_cache(max_bytes=1024)
+    cache.put("getBrTitleInfo", PARAMS, title_response)
+    assert cache.get("getBrTitleInfo", PARAMS) is None
+    assert cache.stats()["bytes"] == 0
+
+
+@pytest.mark.parametrize("result_code", ["20", "21", "22"])
+def test_quota_and_traffic_errors_are_never_cached(make_cache, title_response, result_code):
+    cache = make_cache()
+    cache.put("getBrTitleInfo", PARAMS, dict(title_response, resultCode=result_code, items=[]))
+    assert cache.get("getBrTitleInfo", PARAMS) is None
+    stats = cache.stats()
+    assert stats["skipped_errors"] == 1
+    assert stats["stores"] == 0
+    assert stats["entries"] == 0
+
+
+def test_error_result_is_not_cached_and_does_not_replace_entry(make_cache, title_response):
+    cache = make_cache()
+    cache.put("getBrTitleInfo", PARAMS, title_response)
+    cache.put("getBrTitleInfo", PARAMS, {"error": "오류: 요청 시간 초과"})
+    cache.put("getBrTitleInfo", PARAMS, dict(title_response, resultCode="22"))
+    assert cache.get("getBrTitleInfo", PARAMS) == title_response
+    assert cache.stats()["skipped_errors"] == 2
+
+
+def test_entries_persist_across_instances(make_cache, title_response):
+    make_cache().put("getBrTitleInfo", PARAMS, title_response)
+    reopened = make_cache()
+    assert reopened.get("getBrTitleInfo", PARAMS) == title_response
+    assert reopened.stats()["bytes"] > 0
+
+
+def test_disabled_cache_stores_nothing(make_cache, title_response):
+    cache = make_cache(default_ttl=0)
+    assert not cache.enabled
+    cache.put("getBrTitleInfo", PARAMS, title_response)
+    assert cache.get("getBrTitleInfo", PARAMS) is None
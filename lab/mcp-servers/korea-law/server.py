@@ -5,7 +5,12 @@
 """
 
 import os
-import urllib.request
+import gzip
+import zlib
+import time
+import select
+import threading
+import http.client
 import urllib.parse
 import xml.etree.ElementTree as ET
 from dotenv import load_dotenv
@@ -16,7 +21,20 @@ load_dotenv()
 
 mcp = FastMCP("korea-law")
 
-API_BASE_URL = "https://apis.data.go.kr/1170000/law"
+# data.go.kr 주소 - 로컬 대역 서버(bench/standin.py)로 테스트할 때 DATA_GO_KR_BASE_URL 로 변경
+DATA_GO_KR_BASE_URL = os.environ.get("DATA_GO_KR_BASE_URL", "https://apis.data.go.kr").rstrip("/")
+_api_url = urllib.parse.urlsplit(DATA_GO_KR_BASE_URL)
+API_HOST = _api_url.netloc
+API_USE_TLS = _api_url.scheme == "https"
+API_PATH = f"{_api_url.path}/1170000/law"
+API_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; KoreaLawBot/1.0)", "Accept": "*/*"}
+
+# 커넥션 풀 - 최대 커넥션 수, 쉬는 커넥션 유지 시간, 연결/읽기 한 번/요청 전체 시간 제한(초)
+POOL_MAX_SIZE = int(os.environ.get("KOREA_LAW_POOL_MAX_SIZE", "4"))
+POOL_IDLE_TIMEOUT = float(os.environ.get("KOREA_LAW_POOL_IDLE_TIMEOUT", "60"))
+CONNECT_TIMEOUT = float(os.environ.get("KOREA_LAW_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.environ.get("KOREA_LAW_READ_TIMEOUT", "30"))
+TOTAL_TIMEOUT = float(os.environ.get("KOREA_LAW_TOTAL_TIMEOUT", "60"))
 
 # 각 서비스별 엔드포인트 (.do 확장자 필수)
 ENDPOINTS = {
@@ -54,6 +72,184 @@ TITLE_FIELDS = {
 }
 
 
+class HTTPConnectionPool:
+    """keep-alive HTTP(S) 커넥션 풀 (thread-safe, 호스트 하나)
+
+    - 최대 max_size 개의 커넥션만 동시에 사용 (초과 요청은 반납될 때까지 대기)
+    - idle_timeout 초 이상 쉬고 있던 커넥션과 서버가 끊은 커넥션은 버리고 새로 연결
+    - Accept-Encoding: gzip 으로 요청하고 압축된 응답은 풀어서 반환
+    - 시간 제한을 따로 적용: connect_timeout (TCP+TLS 연결), read_timeout (소켓 읽기 한 번),
+      total_timeout (풀 대기부터 본문을 다 받을 때까지 전체) - 넘으면 TimeoutError
+    """
+
+    READ_CHUNK_SIZE = 65536
+
+    def __init__(
+        self, host: str, use_tls: bool = True, max_size: int = 8, idle_timeout: float = 60.0,
+        connect_timeout: float = 5.0, read_timeout: float = 30.0, total_timeout: float = 60.0,
+    ):
+        self.host = host
+        self.use_tls = use_tls
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self._idle = []  # [(conn, last_used), ...] - 최근 반납한 커넥션이 뒤쪽
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._stats = {
+            "requests": 0, "reused": 0, "created": 0, "evicted": 0, "closed_on_error": 0, "timeouts": 0,
+            "compressed": 0, "wire_bytes": 0, "body_bytes": 0, "connect_total_ms": 0.0,
+        }
+
+    @staticmethod
+    def _is_healthy(conn: http.client.HTTPConnection) -> bool:
+        """소켓이 살아 있는지 확인 (읽을 데이터가 있으면 EOF/에러로 간주)"""
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def _acquire(self, deadline: float) -> tuple:
+        """풀에서 커넥션을 꺼내거나 새로 연결. 반환값: (conn, reused)"""
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used <= self.idle_timeout and self._is_healthy(conn):
+                    self._stats["reused"] += 1
+                    return conn, True
+                self._stats["evicted"] += 1
+                conn.close()
+
+        connection_class = http.client.HTTPSConnection if self.use_tls else http.client.HTTPConnection
+        conn = connection_class(self.host, timeout=min(self.connect_timeout, max(0.001, deadline - now)))
+        started = time.perf_counter()
+        conn.connect()
+        with self._lock:
+            self._stats["created"] += 1
+            self._stats["connect_total_ms"] += (time.perf_counter() - started) * 1000
+        return conn, False
+
+    def _remaining(self, deadline: float) -> float:
+        """남은 전체 시간 - 다 썼으면 TimeoutError"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"{self.total_timeout:g}초 안에 응답을 다 받지 못했습니다")
+        return remaining
+
+    def _exchange(self, conn: http.client.HTTPConnection, method: str, path: str, headers: dict, deadline: float) -> tuple:
+        """요청을 보내고 본문을 조각으로 읽음 (읽을 때마다 남은 전체 시간으로 소켓 제한을 줄임)"""
+        conn.sock.settimeout(min(self.read_timeout, self._remaining(deadline)))
+        conn.request(method, path, headers=headers)
+        response = conn.getresponse()
+        chunks = []
+        while True:
+            conn.sock.settimeout(min(self.read_timeout, self._remaining(deadline)))
+            chunk = response.read(self.READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return response, b"".join(chunks)
+
+    def request(self, method: str, path: str, headers: dict | None = None) -> tuple:
+        """요청을 보내고 (status, reason, 압축을 푼 본문 bytes) 반환
+
+        재사용한 커넥션이 서버 측에서 이미 끊겨 있던 경우 새 커넥션으로 1회 재시도합니다.
+        """
+        deadline = time.monotonic() + self.total_timeout
+        headers = {**(headers or {}), "Accept-Encoding": "gzip"}
+        if not self._slots.acquire(timeout=self.total_timeout):
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise TimeoutError(f"{self.total_timeout:g}초 동안 사용 가능한 커넥션이 없습니다")
+        try:
+            with self._lock:
+                self._stats["requests"] += 1
+            for attempt in range(2):
+                try:
+                    conn, reused = self._acquire(deadline)
+                except TimeoutError:
+                    with self._lock:
+                        self._stats["timeouts"] += 1
+                    raise
+                try:
+                    response, body = self._exchange(conn, method, path, headers, deadline)
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    self._discard(conn)
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except TimeoutError:
+                    self._discard(conn)
+                    with self._lock:
+                        self._stats["timeouts"] += 1
+                    raise
+                except Exception:
+                    self._discard(conn)
+                    raise
+
+                if response.status != 200 or response.will_close:
+                    conn.close()
+                else:
+                    with self._lock:
+                        self._idle.append((conn, time.monotonic()))
+
+                wire_bytes = len(body)
+                encoding = (response.getheader("Content-Encoding") or "").lower()
+                if encoding == "gzip":
+                    body = gzip.decompress(body)
+                elif encoding == "deflate":
+                    body = zlib.decompress(body)
+                with self._lock:
+                    self._stats["compressed"] += encoding in ("gzip", "deflate")
+                    self._stats["wire_bytes"] += wire_bytes
+                    self._stats["body_bytes"] += len(body)
+                return response.status, response.reason, body
+        finally:
+            self._slots.release()
+
+    def _discard(self, conn: http.client.HTTPConnection) -> None:
+        """오류가 난 커넥션을 닫고 폐기"""
+        conn.close()
+        with self._lock:
+            self._stats["closed_on_error"] += 1
+
+    def close(self) -> None:
+        """풀에 남은 커넥션을 모두 닫음"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def stats(self) -> dict:
+        """재사용률, 압축 응답 비율, 전송량 등 풀 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = len(self._idle)
+        stats["max_size"] = self.max_size
+        stats["reuse_rate"] = stats["reused"] / stats["requests"] if stats["requests"] else 0.0
+        stats["connect_avg_ms"] = stats["connect_total_ms"] / stats["created"] if stats["created"] else 0.0
+        return stats
+
+
+# search_law 호출이 공유하는 커넥션 풀
+connection_pool = HTTPConnectionPool(
+    API_HOST,
+    use_tls=API_USE_TLS,
+    max_size=POOL_MAX_SIZE,
+    idle_timeout=POOL_IDLE_TIMEOUT,
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+    total_timeout=TOTAL_TIMEOUT,
+)
+
+
 def parse_xml_response(xml_text: str, target: str) -> dict:
     """XML 응답을 파싱하여 딕셔너리로 반환"""
     try:
@@ -176,19 +372,19 @@ def search_law(
         "pageNo": page_no,
     }, quote_via=urllib.parse.quote)
 
-    url = f"{API_BASE_URL}{endpoint}?{params}"
+    path = f"{API_PATH}{endpoint}?{params}"
 
     try:
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=30) as response:
-            xml_text = response.read().decode("utf-8")
-            result = parse_xml_response(xml_text, target)
-            return format_result(result, target, query)
-
-    except urllib.error.HTTPError as e:
-        return f"HTTP 오류: {e.code} - {e.reason}"
-    except urllib.error.URLError as e:
-        return f"네트워크 오류: {e.reason}"
+        status, reason, body = connection_pool.request("GET", path, headers=API_HEADERS)
+        if status != 200:
+            return f"HTTP 오류: {status} - {reason}"
+        result = parse_xml_response(body.decode("utf-8"), target)
+        return format_result(result, target, query)
+
+    except TimeoutError as e:
+        return f"네트워크 오류: 응답 시간 초과 ({e})"
+    except (http.client.HTTPException, OSError) as e:
+        return f"네트워크 오류: {e}"
     except Exception as e:
         return f"오류 발생: {e}"
 
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+시군구 코드표 갱신 (find_region_code, list_all_regions, search_multi_region_transaction 에서 사용)
+전국 시도/시군구 코드를 "5자리 코드<TAB>전체 지명" TSV 로 저장 - 폐지된 코드는 제외
+저장한 파일이 있으면 서버는 함께 배포한 sigungu_codes.tsv 대신 그 파일을 사용
+
+원본 (둘 중 하나):
+- 행정표준코드관리시스템(code.go.kr) 법정동코드 전체자료 파일 (법정동코드/법정동명/폐지여부, CP949 또는 UTF-8)
+- 행정안전부 법정동코드 API (StanReginCd, DATA_GO_KR_API_KEY 필요) - 전체 페이지 조회
+
+사용법:
+    python build_sigungu_table.py --source 법정동코드_전체자료.txt
+    python build_sigungu_table.py                      # API 로 전체 조회
+    python build_sigungu_table.py --output ./sigungu_codes.tsv
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+from server import SIGUNGU_TABLE_PATH, SigunguIndex, fetch_region_code_page
+
+ROWS_PER_PAGE = 1000
+
+
+def read_code_file(path: str) -> dict:
+    """code.go.kr 전체자료 파일에서 존재하는 시도/시군구 코드만 {5자리 코드: 지명} 으로 읽기"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        text = raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = raw.decode("cp949")
+
+    codes = {}
+    for line in text.splitlines():
+        fields = line.split("\t")
+        if len(fields) < 3 or not fields[0].strip().isdigit():
+            continue  # 머리글 등
+        code, name, status = (field.strip() for field in fields[:3])
+        if status == "존재" and len(code) == 10 and code.endswith("00000"):
+            codes[code[:5]] = " ".join(name.split())
+    return codes
+
+
+def fetch_all_codes() -> dict:
+    """법정동코드 API 전체 페이지를 조회하여 시도/시군구 행(읍면동 코드 000)만 추림"""
+    codes = {}
+    page_no, total_pages = 1, None
+    while total_pages is None or page_no <= total_pages:
+        data = fetch_region_code_page(page_no, ROWS_PER_PAGE)
+        if "error" in data:
+            sys.exit(f"오류: {data['error']} (page {page_no})")
+        if total_pages is None:
+            total_pages = max(1, (data["totalCount"] + ROWS_PER_PAGE - 1) // ROWS_PER_PAGE)
+        for row in data["rows"]:
+            region_cd = row.get("region_cd") or ""
+            if len(region_cd) == 10 and region_cd.endswith("00000") and row.get("locatadd_nm"):
+                codes[region_cd[:5]] = " ".join(row["locatadd_nm"].split())
+        print(f"  page {page_no}/{total_pages} ({len(data['rows'])}건)", file=sys.stderr)
+        page_no += 1
+    return codes
+
+
+def write_table(path: str, codes: dict, source: str) -> None:
+    """코드 순으로 정렬하여 임시 파일에 쓴 뒤 교체 (서버가 읽는 도중 깨진 파일을 보지 않도록)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(f"# source={source} ({datetime.now().strftime('%Y-%m-%d')} 갱신)\n")
+        for code in sorted(codes):
+            f.write(f"{code}\t{codes[code]}\n")
+    os.replace(tmp_path, path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", help="code.go.kr 법정동코드 전체자료 파일 (생략하면 API 로 조회)")
+    parser.add_argument("--output", default=SIGUNGU_TABLE_PATH, help=f"저장할 코드표 파일 (기본: {SIGUNGU_TABLE_PATH})")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.source:
+        codes = read_code_file(args.source)
+        source = os.path.basename(args.source)
+    else:
+        codes = fetch_all_codes()
+        source = "StanReginCd API"
+    if not codes:
+        sys.exit("오류: 읽은 시군구 코드가 없습니다.")
+
+    write_table(args.output, codes, source)
+    index = SigunguIndex([args.output])
+    print(f"시군구 {len(index):,}개 (시도 포함 {len(codes):,}개) → {args.output} ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,23 @@
 
 import os
 import json
-import urllib.request
+import bisect
+import collections
+import time
+import sqlite3
+import hashlib
+import threading
+import gzip
+import zlib
+import heapq
+import select
+import http.client
 import urllib.parse
+import statistics
 import xml.etree.ElementTree as ET
+import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait as wait_futures
+from datetime import date, datetime, timedelta, timezone
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
@@ -17,8 +31,53 @@ load_dotenv()
 
 mcp = FastMCP("real-estate-transaction")
 
-API_BASE_URL = "https://apis.data.go.kr/1613000"
-REGION_CODE_API_URL = "https://apis.data.go.kr/1741000/StanReginCd/getStanReginCdList"
+# data.go.kr 주소 - 로컬 대역 서버(bench/standin.py)로 테스트할 때 DATA_GO_KR_BASE_URL 로 변경
+DATA_GO_KR_BASE_URL = os.environ.get("DATA_GO_KR_BASE_URL", "https://apis.data.go.kr").rstrip("/")
+_api_url = urllib.parse.urlsplit(DATA_GO_KR_BASE_URL)
+API_HOST = _api_url.netloc
+API_USE_TLS = _api_url.scheme == "https"
+API_PATH = f"{_api_url.path}/1613000"
+REGION_CODE_PATH = f"{_api_url.path}/1741000/StanReginCd/getStanReginCdList"
+REGION_CODE_SERVICE = "getStanReginCdList"
+API_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; RealEstateBot/1.0)", "Accept": "*/*"}
+
+# 커넥션 풀 - 최대 커넥션 수, 쉬는 커넥션 유지 시간, 연결/읽기 한 번/요청 전체 시간 제한(초)
+POOL_MAX_SIZE = int(os.environ.get("REAL_ESTATE_POOL_MAX_SIZE", "8"))
+POOL_IDLE_TIMEOUT = float(os.environ.get("REAL_ESTATE_POOL_IDLE_TIMEOUT", "60"))
+CONNECT_TIMEOUT = float(os.environ.get("REAL_ESTATE_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.environ.get("REAL_ESTATE_READ_TIMEOUT", "30"))
+TOTAL_TIMEOUT = float(os.environ.get("REAL_ESTATE_TOTAL_TIMEOUT", "60"))
+
+# 호출 속도/일일 호출건수 제한 (building-register 서버와 같은 집계 파일 공유)
+RATE_LIMIT = float(os.environ.get("DATA_GO_KR_RATE_LIMIT", "10"))
+RATE_BURST = int(os.environ.get("DATA_GO_KR_BURST", "10"))
+DAILY_LIMIT = int(os.environ.get("DATA_GO_KR_DAILY_LIMIT", "10000"))
+QUOTA_PATH = os.path.expanduser(
+    os.environ.get("DATA_GO_KR_QUOTA_PATH", "~/.cache/data-go-kr/quota.sqlite3")
+)
+
+# 기간 조회(end_year_month) 설정 - 동시 요청 수 (달·페이지 합계), 최대 기간, 전체 페이지 조회 시 페이지 크기
+MONTH_FETCH_CONCURRENCY = int(os.environ.get("REAL_ESTATE_MONTH_CONCURRENCY", "4"))
+MAX_RANGE_MONTHS = int(os.environ.get("REAL_ESTATE_MAX_RANGE_MONTHS", "60"))
+FETCH_ROWS_PER_PAGE = 1000
+
+# 여러 지역 동시 조회 - 동시 요청 수 ((지역, 월)·페이지 합계)와 한 번에 조회할 수 있는 최대 (지역 × 월) 수
+REGION_FETCH_CONCURRENCY = int(os.environ.get("REAL_ESTATE_REGION_CONCURRENCY", "8"))
+MAX_FANOUT_PARTITIONS = int(os.environ.get("REAL_ESTATE_MAX_PARTITIONS", "300"))
+
+# 실거래 로컬 저장소 - 빈 문자열이면 사용 안 함
+STORE_PATH = os.path.expanduser(
+    os.environ.get("REAL_ESTATE_STORE_PATH", "~/.cache/real-estate-transaction/transactions.sqlite3")
+)
+# 신고가 계속 들어오는 최근 개월 수와, 그 기간의 데이터를 다시 조회하기까지의 시간(초)
+SETTLING_MONTHS = int(os.environ.get("REAL_ESTATE_SETTLING_MONTHS", "3"))
+SETTLING_TTL = float(os.environ.get("REAL_ESTATE_SETTLING_TTL", str(12 * 3600)))
+
+# 시군구 코드표 - API 로 갱신한 파일(build_sigungu_table.py)이 없으면 서버와 함께 배포한 코드표 사용
+SIGUNGU_TABLE_PATH = os.path.expanduser(
+    os.environ.get("REAL_ESTATE_SIGUNGU_TABLE_PATH", "~/.cache/real-estate-transaction/sigungu_codes.tsv")
+)
+BUNDLED_SIGUNGU_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sigungu_codes.tsv")
 
 # 부동산 유형별 API 엔드포인트
 ENDPOINTS = {
@@ -59,263 +118,1152 @@ TRADE_TYPES = {
     "공장창고": ["매매"],
 }
 
-# 주요 시군구 코드 (서울 중심)
-SIGUNGU_CODES = {
-    # 서울
-    "서울_종로구": "11110",
-    "서울_중구": "11140",
-    "서울_용산구": "11170",
-    "서울_성동구": "11200",
-    "서울_광진구": "11215",
-    "서울_동대문구": "11230",
-    "서울_중랑구": "11260",
-    "서울_성북구": "11290",
-    "서울_강북구": "11305",
-    "서울_도봉구": "11320",
-    "서울_노원구": "11350",
-    "서울_은평구": "11380",
-    "서울_서대문구": "11410",
-    "서울_마포구": "11440",
-    "서울_양천구": "11470",
-    "서울_강서구": "11500",
-    "서울_구로구": "11530",
-    "서울_금천구": "11545",
-    "서울_영등포구": "11560",
-    "서울_동작구": "11590",
-    "서울_관악구": "11620",
-    "서울_서초구": "11650",
-    "서울_강남구": "11680",
-    "서울_송파구": "11710",
-    "서울_강동구": "11740",
-    # 경기 주요 지역
-    "경기_수원_장안구": "41111",
-    "경기_수원_권선구": "41113",
-    "경기_수원_팔달구": "41115",
-    "경기_수원_영통구": "41117",
-    "경기_성남_수정구": "41131",
-    "경기_성남_중원구": "41133",
-    "경기_성남_분당구": "41135",
-    "경기_고양_덕양구": "41281",
-    "경기_고양_일산동구": "41285",
-    "경기_고양_일산서구": "41287",
-    "경기_용인_처인구": "41461",
-    "경기_용인_기흥구": "41463",
-    "경기_용인_수지구": "41465",
-    "경기_부천시": "41190",
-    "경기_안양_만안구": "41171",
-    "경기_안양_동안구": "41173",
-    "경기_안산_상록구": "41271",
-    "경기_안산_단원구": "41273",
-    "경기_화성시": "41590",
-    "경기_평택시": "41220",
-    "경기_파주시": "41480",
-    "경기_김포시": "41570",
-    "경기_광명시": "41210",
-    "경기_하남시": "41450",
-    # 부산
-    "부산_중구": "26110",
-    "부산_서구": "26140",
-    "부산_동구": "26170",
-    "부산_영도구": "26200",
-    "부산_부산진구": "26230",
-    "부산_동래구": "26260",
-    "부산_남구": "26290",
-    "부산_북구": "26320",
-    "부산_해운대구": "26350",
-    "부산_사하구": "26380",
-    "부산_금정구": "26410",
-    "부산_강서구": "26440",
-    "부산_연제구": "26470",
-    "부산_수영구": "26500",
-    "부산_사상구": "26530",
-    "부산_기장군": "26710",
-    # 인천
-    "인천_중구": "28110",
-    "인천_동구": "28140",
-    "인천_미추홀구": "28177",
-    "인천_연수구": "28185",
-    "인천_남동구": "28200",
-    "인천_부평구": "28237",
-    "인천_계양구": "28245",
-    "인천_서구": "28260",
-    "인천_강화군": "28710",
-    "인천_옹진군": "28720",
-    # 대구
-    "대구_중구": "27110",
-    "대구_동구": "27140",
-    "대구_서구": "27170",
-    "대구_남구": "27200",
-    "대구_북구": "27230",
-    "대구_수성구": "27260",
-    "대구_달서구": "27290",
-    "대구_달성군": "27710",
-    # 대전
-    "대전_동구": "30110",
-    "대전_중구": "30140",
-    "대전_서구": "30170",
-    "대전_유성구": "30200",
-    "대전_대덕구": "30230",
-    # 광주
-    "광주_동구": "29110",
-    "광주_서구": "29140",
-    "광주_남구": "29155",
-    "광주_북구": "29170",
-    "광주_광산구": "29200",
-    # 울산
-    "울산_중구": "31110",
-    "울산_남구": "31140",
-    "울산_동구": "31170",
-    "울산_북구": "31200",
-    "울산_울주군": "31710",
-    # 세종
-    "세종특별자치시": "36110",
+# 시도 이름 → 줄임말 (옛 이름은 개편 전 이름으로 검색해도 찾도록)
+SIDO_SHORT_NAMES = {
+    "서울특별시": "서울", "부산광역시": "부산", "대구광역시": "대구", "인천광역시": "인천", "광주광역시": "광주",
+    "대전광역시": "대전", "울산광역시": "울산", "세종특별자치시": "세종", "경기도": "경기", "충청북도": "충북",
+    "충청남도": "충남", "전라남도": "전남", "경상북도": "경북", "경상남도": "경남", "제주특별자치도": "제주",
+    "강원특별자치도": "강원", "전북특별자치도": "전북",
 }
+SIDO_OLD_NAMES = {"강원특별자치도": ("강원도",), "전북특별자치도": ("전라북도",), "제주특별자치도": ("제주도",)}
+
+
+def hangul_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (오타·받침 차이에도 비슷한 문자열이 되도록)"""
+    jamo = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            jamo.append(chr(0x1100 + code // 588))
+            jamo.append(chr(0x1161 + code % 588 // 28))
+            if code % 28:
+                jamo.append(chr(0x11A7 + code % 28))
+        else:
+            jamo.append(ch)
+    return "".join(jamo)
+
+
+def jamo_bigrams(text: str) -> set:
+    jamo = hangul_jamo(text)
+    return {jamo[i:i + 2] for i in range(len(jamo) - 1)} or {jamo}
+
+
+def strip_admin_suffix(name: str) -> str:
+    """끝의 시/군/구 제거 ("영등포구" → "영등포") - 한 글자만 남으면 ("중구") 그대로"""
+    return name[:-1] if len(name) > 2 and name[-1] in "시군구" else name
+
+
+class SigunguIndex:
+    """전국 시군구 코드표 색인 (sigungu_codes.tsv - 첫 조회 때 로드하여 모든 검색 키를 미리 계산)
+
+    - keys: 공백을 뺀 검색 키 → 코드 목록. 전체 이름, 시군구 이름, 시/군/구를 뗀 이름,
+      시도 이름·줄임말을 붙인 이름 ("서울특별시강남구", "서울강남구", "강남구", "강남", "성남분당" 등)
+    - sorted_keys: 키 접두사 검색용 정렬 배열 (bisect)
+    - 자모 bigram 역색인: 정확/접두사로 못 찾았을 때(오타 등) 유사도(Dice)로 보정
+    - 일반구가 있는 시("수원시")는 실거래가 API 가 구 코드로 조회하므로 구 목록으로 펼침
+    """
+
+    def __init__(self, paths: list):
+        self.paths = paths
+        self.path = ""
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.names = {}  # 코드 → 전체 이름 (시도 행 제외)
+        self.meta = {}
+        self.sido_codes = {}  # 시도 이름/줄임말 → 그 아래 시군구 코드 (일반구가 있는 시 제외)
+        self.children = {}  # 일반구가 있는 시 코드 → 구 코드 목록
+        self.keys = {}
+        self.sorted_keys = []
+        self._bigrams = {}
+        self._fuzzy_keys = []
+        self._fuzzy_counts = []
+        self._fuzzy_codes = []
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            self.path = next((path for path in self.paths if path and os.path.exists(path)), "")
+            sido_names = {}
+            if self.path:
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.startswith("#"):
+                            key, _, value = line[1:].strip().partition("=")
+                            self.meta[key.strip()] = value.strip()
+                            continue
+                        code, _, name = line.rstrip("\n").partition("\t")
+                        if len(code) != 5 or not name:
+                            continue
+                        if code.endswith("000"):
+                            sido_names[code[:2]] = name
+                        else:
+                            self.names[code] = name
+
+            by_city = collections.defaultdict(list)
+            for code, name in self.names.items():
+                tokens = name.split()
+                if len(tokens) == 3:
+                    by_city[tuple(tokens[:2])].append(code)
+            for code, name in self.names.items():
+                children = by_city.get(tuple(name.split()))
+                if children:
+                    self.children[code] = sorted(children)
+
+            keys = collections.defaultdict(set)
+            fuzzy = collections.defaultdict(set)
+            sido_codes = collections.defaultdict(list)
+            for code, name in sorted(self.names.items()):
+                sido = sido_names.get(code[:2], name.split()[0])
+                prefixes = {"", sido, SIDO_SHORT_NAMES.get(sido, sido), *SIDO_OLD_NAMES.get(sido, ())}
+                if code not in self.children:
+                    # "서울시", "세종시" 처럼 줄임말에 시를 붙여 부르는 경우도 시도로
+                    aliases = {SIDO_SHORT_NAMES.get(sido, sido) + "시"} if sido.endswith("시") else set()
+                    for prefix in (prefixes - {""}) | aliases:
+                        sido_codes[prefix].append(code)
+
+                parts = name.split()[1:] if name.split()[0] == sido else name.split()
+                parts = parts or [sido]
+                forms = {"".join(parts), parts[-1], strip_admin_suffix(parts[-1])}
+                if len(parts) == 2:
+                    city, district = strip_admin_suffix(parts[0]), strip_admin_suffix(parts[1])
+                    forms |= {parts[0] + district, city + parts[1], city + district}
+                for form in forms:
+                    fuzzy[form].add(code)
+                    for prefix in prefixes:
+                        keys[prefix + form].add(code)
+
+            self.keys = {key: sorted(codes) for key, codes in keys.items()}
+            self.sorted_keys = sorted(self.keys)
+            self.sido_codes = dict(sido_codes)
+
+            bigrams = collections.defaultdict(list)
+            self._fuzzy_keys = sorted(fuzzy)
+            for i, form in enumerate(self._fuzzy_keys):
+                grams = jamo_bigrams(form)
+                self._fuzzy_counts.append(len(grams))
+                for gram in grams:
+                    bigrams[gram].append(i)
+            self._bigrams = dict(bigrams)
+            self._fuzzy_codes = [sorted(fuzzy[form]) for form in self._fuzzy_keys]
+            self._loaded = True
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self.names)
+
+    def _expand(self, codes: list, kind: str, score: float) -> list:
+        """일반구가 있는 시는 구 코드로 펼침"""
+        results = []
+        for code in codes:
+            if code in self.children:
+                results.extend((child, "area", score) for child in self.children[code])
+            else:
+                results.append((code, kind, score))
+        return results
+
+    def search(self, query: str, limit: int = 30) -> list:
+        """지역명/코드로 검색 - [(시군구코드, 전체 이름, 일치 방식, 점수), ...]
+
+        일치 방식: code (코드), exact (이름 일치), area (시도/시 아래 전체), prefix (이름 접두사), fuzzy (유사)
+        """
+        self._load()
+        key = "".join(query.replace("_", " ").split())
+        if not key:
+            return []
+
+        if key.isdigit():
+            results = [(code, "code", 1.0) for code in sorted(self.names) if code.startswith(key)]
+        elif key in self.sido_codes:
+            results = [(code, "area", 1.0) for code in self.sido_codes[key]]
+        elif key in self.keys:
+            results = self._expand(self.keys[key], "exact", 1.0)
+        else:
+            results = []
+            seen = set()
+            start = bisect.bisect_left(self.sorted_keys, key)
+            for i in range(start, len(self.sorted_keys)):
+                name = self.sorted_keys[i]
+                if not name.startswith(key):
+                    break
+                for code in self.keys[name]:
+                    if code not in seen:
+                        seen.add(code)
+                        results.extend(self._expand([code], "prefix", len(key) / len(name)))
+
+            if not results:
+                grams = jamo_bigrams(key)
+                overlap = collections.Counter()
+                for gram in grams:
+                    overlap.update(self._bigrams.get(gram, ()))
+                best = {}
+                for i, shared in overlap.items():
+                    score = 2 * shared / (len(grams) + self._fuzzy_counts[i])
+                    if score >= 0.5:
+                        for code in self._fuzzy_codes[i]:
+                            best[code] = max(score, best.get(code, 0.0))
+                for code, score in best.items():
+                    results.extend(self._expand([code], "fuzzy", score))
+
+        results.sort(key=lambda r: (-r[2], r[0]))
+        unique, seen = [], set()
+        for code, kind, score in results:
+            if code not in seen:
+                seen.add(code)
+                unique.append((code, self.names[code], kind, score))
+        return unique[:limit]
+
+    def short_name(self, code: str) -> str:
+        """"서울 강남구", "경기 성남시 분당구" 처럼 시도 줄임말을 붙인 이름"""
+        self._load()
+        name = self.names.get(code)
+        if not name:
+            return code
+        sido, _, rest = name.partition(" ")
+        return f"{SIDO_SHORT_NAMES.get(sido, sido)} {rest}".strip()
+
+    def by_sido(self) -> dict:
+        """시도 이름 → [(코드, 시도 다음 이름)] (일반구가 있는 시 제외, 코드 순)"""
+        self._load()
+        groups = collections.defaultdict(list)
+        for code, name in sorted(self.names.items()):
+            if code not in self.children:
+                sido, _, rest = name.partition(" ")
+                groups[sido].append((code, rest or sido))
+        return dict(groups)
+
+    def stats(self) -> dict:
+        self._load()
+        return {"path": self.path, "entries": len(self.names), **self.meta}
+
+
+# 시군구 코드표 - build_sigungu_table.py 로 갱신한 파일이 있으면 그것을, 없으면 함께 배포한 코드표를 사용
+sigungu_index = SigunguIndex([SIGUNGU_TABLE_PATH, BUNDLED_SIGUNGU_TABLE_PATH])
 
 
 def find_sigungu_code_local(query: str) -> list:
     """
-    지역명으로 시군구 코드 검색 (로컬 캐시)
-    예: "영등포" -> [("서울_영등포구", "11560")]
+    지역명으로 시군구 코드 검색 (로컬 코드표, API 호출 없음)
+    예: "영등포" -> [("서울특별시 영등포구", "11560")]
     """
-    query = query.strip().replace(" ", "")
-    results = []
+    return [(name, code) for code, name, _, _ in sigungu_index.search(query)]
 
-    for name, code in SIGUNGU_CODES.items():
-        # 정확히 일치하는 경우 (구 이름만)
-        district = name.split("_")[-1]  # "영등포구"
-        if query == district or query == district.replace("구", "") or query == district.replace("시", "") or query == district.replace("군", ""):
-            results.append((name, code))
-        # 부분 일치
-        elif query in name.replace("_", ""):
-            results.append((name, code))
 
-    return results
+def resolve_regions(regions: list) -> tuple:
+    """LAWD_CD, 시도/시 접두사("서울", "경기_", "경기_수원"), 지역명 목록 → 중복 없는 [(시군구코드, 지역 이름)]
+
+    Returns:
+        ([(시군구코드, 이름)], 오류 메시지 또는 None)
+    """
+    resolved = {}
+    for region in regions:
+        query = region.strip()
+        if not query:
+            continue
+        if query.isdigit() and len(query) != 5:
+            return [], f"오류: 시군구코드는 5자리 숫자여야 합니다: {query}"
+        if query.isdigit():
+            resolved.setdefault(query, sigungu_index.short_name(query))
+            continue
+        matches = sigungu_index.search(query, limit=MAX_FANOUT_PARTITIONS)
+        if not matches:
+            return [], f"오류: '{query}' 에 해당하는 지역이 없습니다. find_region_code() 또는 list_all_regions() 로 확인하세요."
+        # 시도/시 전체(area)는 모두, 이름은 한 곳으로 좁혀질 때만 사용 (예: "중구" 는 여러 곳)
+        if any(kind != "area" for _, _, kind, _ in matches) and len(matches) > 1:
+            candidates = ", ".join(f"{sigungu_index.short_name(code)}({code})" for code, _, _, _ in matches[:10])
+            return [], f"오류: '{query}' 에 해당하는 지역이 여러 곳입니다: {candidates}"
+        for code, _, _, _ in matches:
+            resolved.setdefault(code, sigungu_index.short_name(code))
+    return list(resolved.items()), None
+
+
+def fetch_region_code_page(page_no: int = 1, num_of_rows: int = 100, locatadd_nm: str = "") -> dict:
+    """행정안전부 법정동코드(StanReginCd) API 한 페이지 조회 (호출 속도/일일 호출건수 제한 적용)
+
+    Returns:
+        {"totalCount": int, "rows": [{"region_cd", "sido_cd", "sgg_cd", "locatadd_nm", ...}]} 또는 {"error": "..."}
+    """
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        return {"error": "DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다."}
+
+    query = {"serviceKey": api_key, "type": "json", "pageNo": str(page_no), "numOfRows": str(num_of_rows), "flag": "Y"}
+    if locatadd_nm:
+        query["locatadd_nm"] = locatadd_nm
+    path = f"{REGION_CODE_PATH}?{urllib.parse.urlencode(query, quote_via=urllib.parse.quote)}"
+
+    limiter = get_rate_limiter(api_key)
+    wait, quota_error = limiter.reserve(REGION_CODE_SERVICE)
+    if quota_error:
+        return {"error": quota_error}
+
+    status = None
+    try:
+        if wait:
+            time.sleep(wait)
+        status, reason, body = connection_pool.request("GET", path, headers=API_HEADERS)
+        if status != 200:
+            return {"error": f"HTTP 오류: {status}"}
+        data = json.loads(body.decode("utf-8"))
+    except TimeoutError as e:
+        return {"error": f"네트워크 오류: 응답 시간 초과 ({e})"}
+    except (http.client.HTTPException, OSError) as e:
+        return {"error": f"네트워크 오류: {e}"}
+    except json.JSONDecodeError as e:
+        return {"error": f"JSON 파싱 오류: {e}"}
+    except Exception as e:
+        return {"error": f"오류: {e}"}
+    finally:
+        # 응답을 받았으면 사용량으로 기록, 보내지 못했으면 예약 취소
+        if status is None:
+            limiter.release(REGION_CODE_SERVICE)
+        else:
+            limiter.record(REGION_CODE_SERVICE, "" if status == 200 else f"HTTP {status}")
+
+    sections = data.get("StanReginCd", [])
+    if len(sections) < 2:
+        return {"totalCount": 0, "rows": []}
+    total = next((h["totalCount"] for h in sections[0].get("head", []) if "totalCount" in h), 0)
+    return {"totalCount": int(total), "rows": sections[1].get("row", [])}
 
 
 def search_region_code_api(region_name: str) -> dict:
     """
-    행정안전부 법정동코드 API를 통해 지역 코드 검색
+    행정안전부 법정동코드 API를 통해 지역 코드 검색 (읍면동 이름 등 로컬 코드표에 없는 이름용)
 
     Args:
-        region_name: 검색할 지역명 (예: "서울특별시 영등포구", "영등포구", "강남")
+        region_name: 검색할 지역명 (예: "개포동", "서울특별시 강남구 개포동")
 
     Returns:
         {"success": True, "results": [...]} 또는 {"success": False, "error": "..."}
     """
-    api_key = os.environ.get("DATA_GO_KR_API_KEY")
-    if not api_key:
-        return {"success": False, "error": "DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다."}
+    page = fetch_region_code_page(1, 100, region_name)
+    if "error" in page:
+        return {"success": False, "error": page["error"]}
 
-    params = urllib.parse.urlencode({
-        "serviceKey": api_key,
-        "type": "json",
-        "pageNo": "1",
-        "numOfRows": "100",
-        "flag": "Y",
-        "locatadd_nm": region_name,
-    }, quote_via=urllib.parse.quote)
+    results = []
+    seen_codes = set()  # 중복 제거용
+    for row in page["rows"]:
+        sido_cd = row.get("sido_cd", "")
+        sgg_cd = row.get("sgg_cd", "")
+
+        # 시군구 코드 생성 (시도코드 + 시군구코드 = 5자리)
+        if sido_cd and sgg_cd and sgg_cd != "000":
+            lawd_cd = sido_cd + sgg_cd
+            if lawd_cd not in seen_codes:
+                seen_codes.add(lawd_cd)
+                results.append({
+                    "lawd_cd": lawd_cd,
+                    "full_address": row.get("locatadd_nm", ""),
+                    "lowest_name": row.get("locallow_nm", ""),
+                    "region_cd": row.get("region_cd", ""),
+                })
+    return {"success": True, "results": results}
+
+
+# 공공데이터포털 표준 결과 코드
+RESULT_CODE_MESSAGES = {
+    "01": "어플리케이션 에러",
+    "02": "DB 에러",
+    "03": "데이터 없음",
+    "04": "HTTP 에러",
+    "05": "서비스 연결 실패",
+    "10": "잘못된 요청 파라미터",
+    "11": "필수 파라미터 누락",
+    "12": "서비스키 인증 실패",
+    "20": "트래픽 초과",
+    "21": "일일 호출건수 초과",
+    "22": "서비스 시간 외",
+    "30": "등록되지 않은 서비스키",
+    "31": "기한만료된 서비스키",
+    "32": "등록되지 않은 IP",
+}
 
-    url = f"{REGION_CODE_API_URL}?{params}"
+PARSE_CHUNK_SIZE = 16384
 
+HEADER_FIELDS = ("resultCode", "resultMsg", "totalCount")
+
+
+def to_int(text: str) -> int | None:
+    """ "277,280" → 277280, 빈 값 → None"""
     try:
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "Mozilla/5.0 (compatible; RealEstateBot/1.0)")
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        return int(text.replace(",", ""))
+    except ValueError:
+        return None
 
-            # 응답 파싱
-            stan_regin = data.get("StanReginCd", [])
-            if len(stan_regin) < 2:
-                return {"success": True, "results": []}
 
-            rows = stan_regin[1].get("row", [])
+def to_float(text: str) -> float | None:
+    try:
+        return float(text.replace(",", ""))
+    except ValueError:
+        return None
 
-            results = []
-            seen_codes = set()  # 중복 제거용
-
-            for row in rows:
-                sido_cd = row.get("sido_cd", "")
-                sgg_cd = row.get("sgg_cd", "")
-
-                # 시군구 코드 생성 (시도코드 + 시군구코드 = 5자리)
-                if sido_cd and sgg_cd and sgg_cd != "000":
-                    lawd_cd = sido_cd + sgg_cd
-                    if lawd_cd not in seen_codes:
-                        seen_codes.add(lawd_cd)
-                        results.append({
-                            "lawd_cd": lawd_cd,
-                            "full_address": row.get("locatadd_nm", ""),
-                            "lowest_name": row.get("locallow_nm", ""),
-                            "region_cd": row.get("region_cd", ""),
-                        })
-
-            return {"success": True, "results": results}
-
-    except urllib.error.HTTPError as e:
-        return {"success": False, "error": f"HTTP 오류: {e.code}"}
-    except urllib.error.URLError as e:
-        return {"success": False, "error": f"네트워크 오류: {e.reason}"}
-    except json.JSONDecodeError as e:
-        return {"success": False, "error": f"JSON 파싱 오류: {e}"}
-    except Exception as e:
-        return {"success": False, "error": f"오류: {e}"}
 
+class Transaction:
+    """실거래 1건 - 금액은 만원 단위 int, 면적은 ㎡ float, 계약일은 date
 
-def parse_xml_response(xml_text: str) -> dict:
-    """XML 응답을 파싱하여 딕셔너리로 반환"""
-    try:
-        root = ET.fromstring(xml_text)
+    item 요소의 자식 태그를 TRANSACTION_FIELDS 로 바로 변환하므로 중간 dict 를 만들지 않고,
+    __slots__ 로 인스턴스 dict 를 없애 문자열 dict 대비 메모리를 줄임.
+    영문 필드명(2024년 개편 API)과 한글 필드명(이전 API)을 모두 같은 속성으로 읽음.
+    """
 
-        # 결과 코드 확인 (공공데이터포털 표준 응답)
-        result_code = root.findtext(".//resultCode", "")
-        result_msg = root.findtext(".//resultMsg", "")
+    __slots__ = (
+        "name", "apt_seq", "sgg_cd", "umd_cd", "dong", "jibun", "deal_date", "amount", "monthly_rent",
+        "area", "floor", "build_year", "dealing_type", "registered", "contract_type", "contract_term", "cancelled",
+    )
+
+    def __init__(self):
+        self.name = self.apt_seq = self.sgg_cd = self.umd_cd = self.dong = self.jibun = ""
+        self.dealing_type = self.registered = self.contract_type = self.contract_term = ""
+        self.deal_date = self.amount = self.monthly_rent = self.area = self.floor = self.build_year = None
+        self.cancelled = False
+
+    @classmethod
+    def from_element(cls, elem: ET.Element) -> "Transaction":
+        """<item> 요소에서 생성 (값이 있는 필드만, 같은 속성의 첫 값 우선)"""
+        record = cls()
+        year = month = day = None
+        fields = TRANSACTION_FIELDS
+        for child in elem:
+            text = child.text
+            if not text or not (text := text.strip()):
+                continue
+            field = fields.get(child.tag)
+            if field is None:
+                continue
+            slot, convert = field
+            if slot == "year":
+                year = year or to_int(text)
+            elif slot == "month":
+                month = month or to_int(text)
+            elif slot == "day":
+                day = day or to_int(text)
+            elif slot == "cancelled":
+                record.cancelled = text == "O"
+            elif not getattr(record, slot):
+                setattr(record, slot, convert(text) if convert else text)
+        if year and month:
+            try:
+                record.deal_date = date(year, month, day or 1)
+            except ValueError:
+                pass
+        return record
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Transaction":
+        """TransactionStore 행(as_row 순서)에서 복원"""
+        record = cls.__new__(cls)
+        for slot, value in zip(cls.__slots__, row):
+            setattr(record, slot, value)
+        if record.deal_date:
+            record.deal_date = date.fromisoformat(record.deal_date)
+        record.cancelled = bool(record.cancelled)
+        return record
+
+    def as_row(self) -> tuple:
+        """__slots__ 순서의 값 (계약일은 ISO 문자열)"""
+        return tuple(
+            getattr(self, slot).isoformat() if slot == "deal_date" and self.deal_date else getattr(self, slot)
+            for slot in self.__slots__
+        )
+
+    @property
+    def is_jeonse(self) -> bool:
+        """월세가 없으면 전세"""
+        return not self.monthly_rent
+
+    def __repr__(self) -> str:
+        return f"Transaction({self.name!r}, {self.deal_date}, {self.amount}만원, {self.area}㎡)"
+
+
+# TransactionStore 열 타입
+TRANSACTION_COLUMN_TYPES = {
+    slot: "INTEGER" if slot in ("amount", "monthly_rent", "floor", "build_year", "cancelled")
+    else "REAL" if slot == "area" else "TEXT"
+    for slot in Transaction.__slots__
+}
+
+# item 자식 태그 → (속성, 변환 함수) - 영문/한글 필드명 모두
+TRANSACTION_FIELDS = {}
+for _slot, _convert, _tags in (
+    ("name", None, ("aptNm", "offiNm", "mhouseNm", "아파트", "단지", "연립다세대")),
+    ("apt_seq", None, ("aptSeq",)),
+    ("sgg_cd", None, ("sggCd", "지역코드")),
+    ("umd_cd", None, ("umdCd",)),
+    ("dong", None, ("umdNm", "법정동")),
+    ("jibun", None, ("jibun", "지번")),
+    ("year", None, ("dealYear", "년")),
+    ("month", None, ("dealMonth", "월")),
+    ("day", None, ("dealDay", "일")),
+    ("amount", to_int, ("dealAmount", "거래금액", "deposit", "보증금액", "보증금")),
+    ("monthly_rent", to_int, ("monthlyRent", "월세금액", "월세")),
+    ("area", to_float, ("excluUseAr", "전용면적", "계약면적", "totalFloorAr", "연면적", "dealArea", "거래면적")),
+    ("floor", to_int, ("floor", "층")),
+    ("build_year", to_int, ("buildYear", "건축년도")),
+    ("dealing_type", None, ("dealingGbn", "거래유형")),
+    ("registered", None, ("rgstDate", "등기일자")),
+    ("contract_type", None, ("contractType", "계약구분")),
+    ("contract_term", None, ("contractTerm", "계약기간")),
+    ("cancelled", None, ("cdealType", "해제여부")),
+):
+    for _tag in _tags:
+        TRANSACTION_FIELDS[_tag] = (_slot, _convert)
+
+
+class StreamingXMLParser:
+    """data.go.kr XML 응답을 한 번의 패스로 파싱하는 스트리밍 파서
+
+    응답 본문을 받는 대로 feed() 로 넣으면 헤더 필드(totalCount 포함)와 item(Transaction)을 동시에 수집하고,
+    처리한 item 요소는 바로 비워서 페이지 크기와 상관없이 트리 메모리가 늘지 않습니다.
+    """
 
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("end",))
+        self._header = {}
+        self._items = []
+        self._head = b""
+        self._error = None
+
+    def feed(self, chunk: bytes) -> None:
+        """응답 본문 일부를 파싱"""
+        if self._error is not None:
+            return
+        if len(self._head) < 1000:
+            self._head += chunk[:1000 - len(self._head)]
+        try:
+            self._parser.feed(chunk)
+            self._drain()
+        except ET.ParseError as e:
+            self._error = e
+
+    def _drain(self) -> None:
+        """완성된 요소를 꺼내 헤더/항목으로 변환"""
+        header = self._header
+        items = self._items
+        for _, elem in self._parser.read_events():
+            tag = elem.tag
+            if tag == "item":
+                if len(elem):
+                    items.append(Transaction.from_element(elem))
+                elem.clear()
+            elif tag == "items":
+                elem.clear()
+            elif tag in HEADER_FIELDS and tag not in header:
+                header[tag] = elem.text or ""
+
+    def close(self) -> dict:
+        """파싱을 마치고 parse_xml_response 와 같은 형태의 결과 반환"""
+        if self._error is None:
+            try:
+                self._parser.close()
+                self._drain()
+            except ET.ParseError as e:
+                self._error = e
+        if self._error is not None:
+            return {"error": f"XML 파싱 오류: {self._error}", "raw": self._head.decode("utf-8", errors="replace")}
+
+        # 결과 코드 확인 (공공데이터포털 표준 응답)
+        result_code = self._header.get("resultCode", "")
+        result_msg = self._header.get("resultMsg", "")
         result = {
             "resultCode": result_code,
             "resultMsg": result_msg,
-            "items": []
+            "totalCount": int(self._header.get("totalCount") or 0),
+            "items": [],
         }
 
         # 에러 체크
         if result_code and result_code != "00":
-            error_msgs = {
-                "01": "어플리케이션 에러",
-                "02": "DB 에러",
-                "03": "데이터 없음",
-                "04": "HTTP 에러",
-                "05": "서비스 연결 실패",
-                "10": "잘못된 요청 파라미터",
-                "11": "필수 파라미터 누락",
-                "12": "서비스키 인증 실패",
-                "20": "트래픽 초과",
-                "21": "일일 호출건수 초과",
-                "22": "서비스 시간 외",
-                "30": "등록되지 않은 서비스키",
-                "31": "기한만료된 서비스키",
-                "32": "등록되지 않은 IP",
-            }
-            result["error"] = error_msgs.get(result_code, f"알 수 없는 오류 (코드: {result_code}, 메시지: {result_msg})")
+            result["error"] = RESULT_CODE_MESSAGES.get(
+                result_code, f"알 수 없는 오류 (코드: {result_code}, 메시지: {result_msg})"
+            )
             return result
 
-        # 항목들 파싱 (item 태그)
-        for item in root.iter("item"):
-            item_dict = {}
-            for child in item:
-                if child.text:
-                    item_dict[child.tag] = child.text.strip()
-            if item_dict:
-                result["items"].append(item_dict)
-
+        result["items"] = self._items
         return result
-    except ET.ParseError as e:
-        return {"error": f"XML 파싱 오류: {e}", "raw": xml_text[:1000]}
 
 
-def format_price(price_str: str) -> str:
+def parse_xml_response(xml_data: str | bytes) -> dict:
+    """XML 응답을 파싱하여 딕셔너리로 반환"""
+    data = memoryview(xml_data.encode("utf-8") if isinstance(xml_data, str) else xml_data)
+    parser = StreamingXMLParser()
+    # 한 번에 넣으면 이벤트가 모두 쌓였다가 처리되므로 나눠서 feed (최대 메모리 유지)
+    for offset in range(0, len(data), PARSE_CHUNK_SIZE):
+        parser.feed(data[offset:offset + PARSE_CHUNK_SIZE])
+    return parser.close()
+
+
+class RateLimiter:
+    """API 키·서비스별 토큰 버킷 + 일일 호출건수 집계 (집계는 디스크에 저장되어 프로세스 간 공유)
+
+    - 초당 rate 건, 최대 burst 건까지 몰아서 요청 가능
+    - resultCode 20(트래픽 초과) 응답을 받으면 요청 속도를 절반으로 낮추고 잠시 멈춘 뒤,
+      정상 응답이 이어지면 조금씩 원래 속도로 회복
+    - 실제로 전송한 요청 수를 서비스별/일자별(KST)로 기록하고, daily_limit 에 도달하거나
+      resultCode 21(일일 호출건수 초과)을 받으면 그날은 더 요청하지 않음
+    - 한도 판정에는 응답을 기다리는 예약 건수도 포함 (동시 요청이 한도를 넘지 않도록)
+      예약은 record() 로 사용량에 반영되거나, 요청을 보내지 못했으면 release() 로 취소
+
+    building-register/server.py 와 real-estate-transaction/server.py 에 같은 코드가 있음 (서버를 파일 하나로
+    따로 배포하므로 모듈을 공유하지 않음) - 고칠 때는 두 파일을 똑같이 고칠 것, 같은지는 테스트에서 확인
+    """
+
+    MIN_RATE = 0.2
+    MAX_BACKOFF = 60.0
+
+    def __init__(self, api_key: str, path: str, rate: float, burst: int, daily_limit: int):
+        self.key_id = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+        self.path = path
+        self.base_rate = max(self.MIN_RATE, rate)
+        self.burst = max(1, burst)
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._buckets = {}  # service -> {"tokens", "updated", "rate", "paused_until", "backoff"}
+        self._in_flight = collections.Counter()  # service -> 예약했지만 아직 record/release 하지 않은 요청 수
+        self._db = None
+        self._stats = {"throttled": 0, "throttled_wait_s": 0.0, "traffic_errors": 0, "quota_rejections": 0}
+
+    @staticmethod
+    def today() -> str:
+        """data.go.kr 일일 호출건수는 한국 시간 자정에 초기화"""
+        return datetime.now(timezone(timedelta(hours=9))).strftime("%Y%m%d")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS daily_usage ("
+                " key_id TEXT NOT NULL, service TEXT NOT NULL, day TEXT NOT NULL, used INTEGER NOT NULL,"
+                " exhausted INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (key_id, service, day))"
+            )
+            db.commit()
+            self._db = db
+        return self._db
+
+    def _usage(self, service: str) -> tuple:
+        """(오늘 사용 건수, 소진 여부) - lock 보유 상태에서 호출"""
+        row = self._connect().execute(
+            "SELECT used, exhausted FROM daily_usage WHERE key_id = ? AND service = ? AND day = ?",
+            (self.key_id, service, self.today()),
+        ).fetchone()
+        return (row[0], bool(row[1])) if row else (0, False)
+
+    def reserve(self, service: str) -> tuple:
+        """요청 1건을 예약. (대기해야 할 초, 오류 메시지) 반환 - 오류가 있으면 요청하지 말 것"""
+        now = time.monotonic()
+        with self._lock:
+            used, exhausted = self._usage(service)
+            used += self._in_flight[service]
+            if exhausted or (self.daily_limit and used >= self.daily_limit):
+                self._stats["quota_rejections"] += 1
+                return 0.0, f"일일 호출건수 한도 소진 ({service}: {used}/{self.daily_limit}건, 한국시간 자정에 초기화)"
+
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                bucket = {"tokens": float(self.burst), "updated": now, "rate": self.base_rate, "paused_until": 0.0, "backoff": 0.0}
+                self._buckets[service] = bucket
+
+            bucket["tokens"] = min(self.burst, bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"])
+            bucket["updated"] = now
+            bucket["tokens"] -= 1
+            # 토큰이 모자라면 음수로 두고 그만큼 기다리게 함 (대기 순서대로 예약됨)
+            wait = max(0.0, -bucket["tokens"] / bucket["rate"], bucket["paused_until"] - now)
+            if wait > 0:
+                self._stats["throttled"] += 1
+                self._stats["throttled_wait_s"] += wait
+            self._in_flight[service] += 1
+            return wait, None
+
+    def release(self, service: str) -> None:
+        """요청을 보내지 못한 예약 취소 (취소, 네트워크 오류 등)"""
+        with self._lock:
+            self._settle(service)
+
+    def _settle(self, service: str) -> None:
+        """예약 1건 정리 - lock 보유 상태에서 호출"""
+        if self._in_flight[service] > 0:
+            self._in_flight[service] -= 1
+
+    def record(self, service: str, result_code: str) -> None:
+        """실제로 전송한 요청 결과 기록 (예약을 일일 사용량으로 옮기고, 트래픽 초과 시 속도 조절)"""
+        with self._lock:
+            self._settle(service)
+            db = self._connect()
+            db.execute(
+                "INSERT INTO daily_usage (key_id, service, day, used) VALUES (?, ?, ?, 1)"
+                " ON CONFLICT (key_id, service, day) DO UPDATE SET used = used + 1",
+                (self.key_id, service, self.today()),
+            )
+            if result_code == "21":
+                db.execute(
+                    "UPDATE daily_usage SET exhausted = 1 WHERE key_id = ? AND service = ? AND day = ?",
+                    (self.key_id, service, self.today()),
+                )
+            db.commit()
+
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                return
+            if result_code == "20":
+                # 트래픽 초과: 속도 절반 + 지수 백오프
+                self._stats["traffic_errors"] += 1
+                bucket["rate"] = max(self.MIN_RATE, bucket["rate"] / 2)
+                bucket["backoff"] = min(self.MAX_BACKOFF, bucket["backoff"] * 2 or 1.0)
+                bucket["paused_until"] = time.monotonic() + bucket["backoff"]
+                bucket["tokens"] = min(bucket["tokens"], 0.0)
+            elif result_code in ("", "00", "03"):
+                # 정상 응답: 원래 속도로 조금씩 회복
+                bucket["rate"] = min(self.base_rate, bucket["rate"] + self.base_rate * 0.1)
+                bucket["backoff"] = 0.0
+
+    def _headroom(self, used: int, exhausted: bool) -> int | None:
+        """남은 호출 가능 건수 - used 는 응답 대기 중인 예약 포함 (한도 미설정 시 None)"""
+        if exhausted:
+            return 0
+        if not self.daily_limit:
+            return None
+        return max(0, self.daily_limit - used)
+
+    def remaining(self, service: str) -> int | None:
+        """오늘 남은 호출 가능 건수 (예약 포함, 한도 미설정 시 None)"""
+        with self._lock:
+            used, exhausted = self._usage(service)
+            used += self._in_flight[service]
+        return self._headroom(used, exhausted)
+
+    def usage_today(self) -> dict:
+        """오늘 서비스별 사용 건수 {service: (used, remaining)} - remaining 은 reserve() 와 같이 예약도 뺀 값"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT service, used, exhausted FROM daily_usage WHERE key_id = ? AND day = ?",
+                (self.key_id, self.today()),
+            ).fetchall()
+            in_flight = {service: count for service, count in self._in_flight.items() if count}
+        usage = {}
+        for service, used, exhausted in rows:
+            usage[service] = (used, self._headroom(used + in_flight.pop(service, 0), bool(exhausted)))
+        for service, count in in_flight.items():
+            usage[service] = (0, self._headroom(count, False))
+        return dict(sorted(usage.items()))
+
+    def stats(self) -> dict:
+        """속도 제한 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["current_rates"] = {service: bucket["rate"] for service, bucket in self._buckets.items()}
+        stats["base_rate"] = self.base_rate
+        stats["burst"] = self.burst
+        stats["daily_limit"] = self.daily_limit
+        return stats
+
+
+_rate_limiters = {}
+
+
+def get_rate_limiter(api_key: str) -> RateLimiter:
+    """API 키별 속도 제한기 (서비스 = 부동산유형_거래유형 단위로 집계)"""
+    limiter = _rate_limiters.get(api_key)
+    if limiter is None:
+        limiter = _rate_limiters[api_key] = RateLimiter(api_key, QUOTA_PATH, RATE_LIMIT, RATE_BURST, DAILY_LIMIT)
+    return limiter
+
+
+class HTTPConnectionPool:
+    """keep-alive HTTP(S) 커넥션 풀 (thread-safe, 호스트 하나)
+
+    - 최대 max_size 개의 커넥션만 동시에 사용 (초과 요청은 반납될 때까지 대기)
+    - idle_timeout 초 이상 쉬고 있던 커넥션과 서버가 끊은 커넥션은 버리고 새로 연결
+    - Accept-Encoding: gzip 으로 요청하고 압축된 응답은 풀어서 반환
+    - 시간 제한을 따로 적용: connect_timeout (TCP+TLS 연결), read_timeout (소켓 읽기 한 번),
+      total_timeout (풀 대기부터 본문을 다 받을 때까지 전체) - 넘으면 TimeoutError
+    """
+
+    READ_CHUNK_SIZE = 65536
+
+    def __init__(
+        self, host: str, use_tls: bool = True, max_size: int = 8, idle_timeout: float = 60.0,
+        connect_timeout: float = 5.0, read_timeout: float = 30.0, total_timeout: float = 60.0,
+    ):
+        self.host = host
+        self.use_tls = use_tls
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self._idle = []  # [(conn, last_used), ...] - 최근 반납한 커넥션이 뒤쪽
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._stats = {
+            "requests": 0, "reused": 0, "created": 0, "evicted": 0, "closed_on_error": 0, "timeouts": 0,
+            "compressed": 0, "wire_bytes": 0, "body_bytes": 0, "connect_total_ms": 0.0,
+        }
+
+    @staticmethod
+    def _is_healthy(conn: http.client.HTTPConnection) -> bool:
+        """소켓이 살아 있는지 확인 (읽을 데이터가 있으면 EOF/에러로 간주)"""
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def _acquire(self, deadline: float) -> tuple:
+        """풀에서 커넥션을 꺼내거나 새로 연결. 반환값: (conn, reused)"""
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used <= self.idle_timeout and self._is_healthy(conn):
+                    self._stats["reused"] += 1
+                    return conn, True
+                self._stats["evicted"] += 1
+                conn.close()
+
+        connection_class = http.client.HTTPSConnection if self.use_tls else http.client.HTTPConnection
+        conn = connection_class(self.host, timeout=min(self.connect_timeout, max(0.001, deadline - now)))
+        started = time.perf_counter()
+        conn.connect()
+        with self._lock:
+            self._stats["created"] += 1
+            self._stats["connect_total_ms"] += (time.perf_counter() - started) * 1000
+        return conn, False
+
+    def _remaining(self, deadline: float) -> float:
+        """남은 전체 시간 - 다 썼으면 TimeoutError"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"{self.total_timeout:g}초 안에 응답을 다 받지 못했습니다")
+        return remaining
+
+    def _exchange(self, conn: http.client.HTTPConnection, method: str, path: str, headers: dict, deadline: float) -> tuple:
+        """요청을 보내고 본문을 조각으로 읽음 (읽을 때마다 남은 전체 시간으로 소켓 제한을 줄임)"""
+        conn.sock.settimeout(min(self.read_timeout, self._remaining(deadline)))
+        conn.request(method, path, headers=headers)
+        response = conn.getresponse()
+        chunks = []
+        while True:
+            conn.sock.settimeout(min(self.read_timeout, self._remaining(deadline)))
+            chunk = response.read(self.READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return response, b"".join(chunks)
+
+    def request(self, method: str, path: str, headers: dict | None = None) -> tuple:
+        """요청을 보내고 (status, reason, 압축을 푼 본문 bytes) 반환
+
+        재사용한 커넥션이 서버 측에서 이미 끊겨 있던 경우 새 커넥션으로 1회 재시도합니다.
+        """
+        deadline = time.monotonic() + self.total_timeout
+        headers = {**(headers or {}), "Accept-Encoding": "gzip"}
+        if not self._slots.acquire(timeout=self.total_timeout):
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise TimeoutError(f"{self.total_timeout:g}초 동안 사용 가능한 커넥션이 없습니다")
+        try:
+            with self._lock:
+                self._stats["requests"] += 1
+            for attempt in range(2):
+                try:
+                    conn, reused = self._acquire(deadline)
+                except TimeoutError:
+                    with self._lock:
+                        self._stats["timeouts"] += 1
+                    raise
+                try:
+                    response, body = self._exchange(conn, method, path, headers, deadline)
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    self._discard(conn)
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except TimeoutError:
+                    self._discard(conn)
+                    with self._lock:
+                        self._stats["timeouts"] += 1
+                    raise
+                except Exception:
+                    self._discard(conn)
+                    raise
+
+                if response.status != 200 or response.will_close:
+                    conn.close()
+                else:
+                    with self._lock:
+                        self._idle.append((conn, time.monotonic()))
+
+                wire_bytes = len(body)
+                encoding = (response.getheader("Content-Encoding") or "").lower()
+                if encoding == "gzip":
+                    body = gzip.decompress(body)
+                elif encoding == "deflate":
+                    body = zlib.decompress(body)
+                with self._lock:
+                    self._stats["compressed"] += encoding in ("gzip", "deflate")
+                    self._stats["wire_bytes"] += wire_bytes
+                    self._stats["body_bytes"] += len(body)
+                return response.status, response.reason, body
+        finally:
+            self._slots.release()
+
+    def _discard(self, conn: http.client.HTTPConnection) -> None:
+        """오류가 난 커넥션을 닫고 폐기"""
+        conn.close()
+        with self._lock:
+            self._stats["closed_on_error"] += 1
+
+    def close(self) -> None:
+        """풀에 남은 커넥션을 모두 닫음"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def stats(self) -> dict:
+        """재사용률, 압축 응답 비율, 전송량 등 풀 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = len(self._idle)
+        stats["max_size"] = self.max_size
+        stats["reuse_rate"] = stats["reused"] / stats["requests"] if stats["requests"] else 0.0
+        stats["connect_avg_ms"] = stats["connect_total_ms"] / stats["created"] if stats["created"] else 0.0
+        return stats
+
+
+# 모든 API 호출(실거래가, 법정동코드)이 공유하는 커넥션 풀
+connection_pool = HTTPConnectionPool(
+    API_HOST,
+    use_tls=API_USE_TLS,
+    max_size=POOL_MAX_SIZE,
+    idle_timeout=POOL_IDLE_TIMEOUT,
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+    total_timeout=TOTAL_TIMEOUT,
+)
+
+
+def current_year_month() -> str:
+    """한국 시간 기준 이번 달 (YYYYMM)"""
+    return datetime.now(timezone(timedelta(hours=9))).strftime("%Y%m")
+
+
+def shift_month(year_month: str, months: int) -> str:
+    """YYYYMM 에서 months 개월 이동"""
+    index = int(year_month[:4]) * 12 + int(year_month[4:]) - 1 + months
+    return f"{index // 12:04d}{index % 12 + 1:02d}"
+
+
+class TransactionStore:
+    """실거래 로컬 저장소 (SQLite) - 부동산유형_거래유형/LAWD_CD/DEAL_YMD 파티션 단위로 저장
+
+    - 한 달치 전체 페이지를 받았을 때만 파티션을 통째로 교체하여 저장 (일부 페이지 실패 시 저장 안 함)
+    - 신고 기한(계약 후 30일) 때문에 최근 settling_months 개월은 계속 늘어나므로 settling_ttl 초가 지나면 다시 조회,
+      그보다 오래된 달은 한 번 저장하면 API 를 호출하지 않음
+    """
+
+    COLUMNS = Transaction.__slots__
+
+    def __init__(self, path: str, settling_months: int, settling_ttl: float):
+        self.path = path
+        self.settling_months = max(1, settling_months)
+        self.settling_ttl = settling_ttl
+        self._lock = threading.Lock()
+        self._db = None
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "stores": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 파일은 첫 사용 시점에 열어 서버 시작을 늦추지 않음"""
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            db.executescript(
+                "CREATE TABLE IF NOT EXISTS partitions ("
+                " endpoint_key TEXT NOT NULL, lawd_cd TEXT NOT NULL, deal_ymd TEXT NOT NULL,"
+                " total_count INTEGER NOT NULL, synced_at REAL NOT NULL,"
+                " PRIMARY KEY (endpoint_key, lawd_cd, deal_ymd));"
+                "CREATE TABLE IF NOT EXISTS transactions ("
+                " endpoint_key TEXT NOT NULL, lawd_cd TEXT NOT NULL, deal_ymd TEXT NOT NULL, seq INTEGER NOT NULL, "
+                + ", ".join(f"{column} {TRANSACTION_COLUMN_TYPES[column]}" for column in self.COLUMNS)
+                + ", PRIMARY KEY (endpoint_key, lawd_cd, deal_ymd, seq));"
+                # 단지 색인: 단지 이름 목록 + 단지(법정동·지번·이름)별 거래를 바로 찾는 인덱스 - 파티션을 저장할 때 함께 갱신
+                "CREATE INDEX IF NOT EXISTS transactions_complex"
+                " ON transactions (lawd_cd, dong, jibun, name, endpoint_key, deal_ymd);"
+            )
+            has_complexes = db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'complexes'").fetchone()
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS complexes ("
+                " property_type TEXT NOT NULL, lawd_cd TEXT NOT NULL, dong TEXT NOT NULL, jibun TEXT NOT NULL,"
+                " name TEXT NOT NULL, apt_seq TEXT, build_year INTEGER,"
+                " PRIMARY KEY (property_type, lawd_cd, dong, jibun, name)) WITHOUT ROWID"
+            )
+            if not has_complexes:
+                # 단지 색인 도입 전에 저장한 거래로 채움
+                db.execute(
+                    "INSERT OR IGNORE INTO complexes"
+                    " SELECT substr(endpoint_key, 1, instr(endpoint_key, '_') - 1), lawd_cd, IFNULL(dong, ''), IFNULL(jibun, ''),"
+                    " name, MAX(apt_seq), MAX(build_year) FROM transactions WHERE name IS NOT NULL AND name != ''"
+                    " GROUP BY 1, lawd_cd, dong, jibun, name"
+                )
+            db.commit()
+            self._db = db
+        return self._db
+
+    def is_settling(self, deal_ymd: str) -> bool:
+        """아직 신고가 늘어나는 달인지 (최근 settling_months 개월 또는 미래)"""
+        return deal_ymd > shift_month(current_year_month(), -self.settling_months)
+
+    def is_fresh(self, deal_ymd: str, synced_at: float) -> bool:
+        return not self.is_settling(deal_ymd) or time.time() - synced_at < self.settling_ttl
+
+    def partition(self, endpoint_key: str, lawd_cd: str, deal_ymd: str) -> tuple | None:
+        """(total_count, synced_at) - 저장된 적 없으면 None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._connect().execute(
+                "SELECT total_count, synced_at FROM partitions WHERE endpoint_key = ? AND lawd_cd = ? AND deal_ymd = ?",
+                (endpoint_key, lawd_cd, deal_ymd),
+            ).fetchone()
+
+    def get(self, endpoint_key: str, lawd_cd: str, deal_ymd: str) -> tuple | None:
+        """최신 파티션이면 (거래 목록, total_count), 없거나 다시 조회할 때가 되었으면 None"""
+        if not self.enabled:
+            return None
+        key = (endpoint_key, lawd_cd, deal_ymd)
+        with self._lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT total_count, synced_at FROM partitions WHERE endpoint_key = ? AND lawd_cd = ? AND deal_ymd = ?", key
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            if not self.is_fresh(deal_ymd, row[1]):
+                self._stats["stale"] += 1
+                return None
+            rows = db.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM transactions"
+                " WHERE endpoint_key = ? AND lawd_cd = ? AND deal_ymd = ? ORDER BY seq", key
+            ).fetchall()
+            self._stats["hits"] += 1
+        return [Transaction.from_row(r) for r in rows], row[0]
+
+    def put(self, endpoint_key: str, lawd_cd: str, deal_ymd: str, items: list, total_count: int) -> None:
+        """한 달치 전체를 파티션 단위로 교체"""
+        if not self.enabled:
+            return
+        key = (endpoint_key, lawd_cd, deal_ymd)
+        placeholders = ", ".join("?" for _ in range(4 + len(self.COLUMNS)))
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.execute("DELETE FROM transactions WHERE endpoint_key = ? AND lawd_cd = ? AND deal_ymd = ?", key)
+                db.executemany(
+                    f"INSERT INTO transactions (endpoint_key, lawd_cd, deal_ymd, seq, {', '.join(self.COLUMNS)})"
+                    f" VALUES ({placeholders})",
+                    [key + (seq,) + item.as_row() for seq, item in enumerate(items)],
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO partitions (endpoint_key, lawd_cd, deal_ymd, total_count, synced_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    key + (total_count, time.time()),
+                )
+                property_type = endpoint_key.split("_")[0]
+                complexes = {(item.dong or "", item.jibun or "", item.name): item for item in items if item.name}
+                db.executemany(
+                    "INSERT OR IGNORE INTO complexes (property_type, lawd_cd, dong, jibun, name, apt_seq, build_year)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(property_type, lawd_cd) + complex_key + (item.apt_seq, item.build_year) for complex_key, item in complexes.items()],
+                )
+            self._stats["stores"] += 1
+
+    def missing_months(self, endpoint_key: str, lawd_cd: str, months: list) -> list:
+        """저장되지 않았거나 다시 조회할 때가 된 달"""
+        if not self.enabled or not months:
+            return list(months)
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT deal_ymd, synced_at FROM partitions WHERE endpoint_key = ? AND lawd_cd = ? AND deal_ymd BETWEEN ? AND ?",
+                (endpoint_key, lawd_cd, min(months), max(months)),
+            ).fetchall()
+        fresh = {deal_ymd for deal_ymd, synced_at in rows if self.is_fresh(deal_ymd, synced_at)}
+        return [ym for ym in months if ym not in fresh]
+
+    def find_complexes(self, property_type: str, lawd_cd: str, name: str, dong: str = "", jibun: str = "") -> list:
+        """이름(공백 무시 부분 일치)으로 단지 검색 - [(법정동, 지번, 단지명, 건축년도)]"""
+        if not self.enabled:
+            return []
+        query = (
+            "SELECT dong, jibun, name, build_year FROM complexes WHERE property_type = ? AND lawd_cd = ?"
+            " AND replace(name, ' ', '') LIKE ?"
+        )
+        params = [property_type, lawd_cd, f"%{''.join(name.split())}%"]
+        if dong:
+            query += " AND dong = ?"
+            params.append(dong)
+        if jibun:
+            query += " AND jibun = ?"
+            params.append(jibun)
+        with self._lock:
+            return self._connect().execute(query + " ORDER BY name, dong, jibun", params).fetchall()
+
+    def complex_transactions(self, endpoint_key: str, lawd_cd: str, dong: str, jibun: str, name: str, start: str, end: str) -> list:
+        """단지 하나의 기간 내 거래 (단지 색인 사용 - 지역 전체 파티션을 읽지 않음)"""
+        if not self.enabled:
+            return []
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM transactions INDEXED BY transactions_complex"
+                " WHERE lawd_cd = ? AND dong = ? AND jibun = ? AND name = ?"
+                " AND endpoint_key = ? AND deal_ymd BETWEEN ? AND ? ORDER BY deal_ymd, seq",
+                (lawd_cd, dong, jibun, name, endpoint_key, start, end),
+            ).fetchall()
+        return [Transaction.from_row(r) for r in rows]
+
+    def complex_count(self) -> int:
+        if not self.enabled or not os.path.exists(self.path):
+            return 0
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM complexes").fetchone()[0]
+
+    def summary(self) -> list:
+        """[(endpoint_key, lawd_cd, 파티션 수, 거래 건수, 처음 달, 마지막 달, 마지막 동기화 시각)]"""
+        if not self.enabled or not os.path.exists(self.path):
+            return []
+        with self._lock:
+            return self._connect().execute(
+                "SELECT endpoint_key, lawd_cd, COUNT(*), SUM(total_count), MIN(deal_ymd), MAX(deal_ymd), MAX(synced_at)"
+                " FROM partitions GROUP BY endpoint_key, lawd_cd ORDER BY lawd_cd, endpoint_key"
+            ).fetchall()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["path"] = self.path
+        stats["enabled"] = self.enabled
+        stats["bytes"] = os.path.getsize(self.path) if self.enabled and os.path.exists(self.path) else 0
+        return stats
+
+
+# 모든 도구와 sync.py 가 공유하는 실거래 저장소
+transaction_store = TransactionStore(STORE_PATH, SETTLING_MONTHS, SETTLING_TTL)
+
+
+def format_price(price: int | str | None) -> str:
     """가격을 읽기 쉬운 형식으로 변환 (만원 단위)"""
     try:
         # 쉼표 제거 후 숫자 변환
-        price = int(price_str.replace(",", "").replace(" ", ""))
+        if isinstance(price, str):
+            price = int(price.replace(",", "").replace(" ", ""))
         if price >= 10000:
             억 = price // 10000
             만 = price % 10000
@@ -323,11 +1271,21 @@ def format_price(price_str: str) -> str:
                 return f"{억}억 {만:,}만원"
             return f"{억}억원"
         return f"{price:,}만원"
-    except (ValueError, AttributeError):
-        return price_str
+    except (ValueError, TypeError):
+        return str(price or "")
+
 
+def format_area(area: float | None) -> str:
+    """84.43 → "84.43" (값이 없으면 빈 문자열)"""
+    return "" if area is None else f"{area:g}"
 
-def format_apt_trade_result(result: dict, sigungu_code: str, year_month: str, total_count: int, page_no: int, num_of_rows: int) -> str:
+
+def format_deal_date(deal_date: date | None) -> str:
+    """계약일 (API 표기와 같은 2024.1.7 형식)"""
+    return f"{deal_date.year}.{deal_date.month}.{deal_date.day}" if deal_date else ""
+
+
+def format_apt_trade_result(result: dict, sigungu_code: str, year_month: str, total_count: int, page_no: int, num_of_rows: int, summary: list | None = None) -> str:
     """아파트 매매 결과를 마크다운 형식으로 포맷팅"""
     if "error" in result:
         return f"오류: {result['error']}"
@@ -337,6 +1295,7 @@ def format_apt_trade_result(result: dict, sigungu_code: str, year_month: str, to
     end_idx = min(page_no * num_of_rows, total_count)
 
     output = ["## 아파트 매매 실거래가 조회 결과"]
+    output.extend(summary or ())
     output.append(f"- 지역코드: {sigungu_code}")
     output.append(f"- 계약년월: {year_month}")
     output.append(f"- **총 {total_count}건 중 {start_idx}~{end_idx}건 표시 (page {page_no}/{total_pages})**\n")
@@ -346,29 +1305,19 @@ def format_apt_trade_result(result: dict, sigungu_code: str, year_month: str, to
         return "\n".join(output)
 
     for i, item in enumerate(result["items"], start_idx):
-        apt_name = item.get("aptNm", item.get("아파트", "정보없음"))
-        price = format_price(item.get("dealAmount", item.get("거래금액", "0")))
-        area = item.get("excluUseAr", item.get("전용면적", ""))
-        floor = item.get("floor", item.get("층", ""))
-        dong = item.get("umdNm", item.get("법정동", ""))
-        year = item.get("dealYear", item.get("년", ""))
-        month = item.get("dealMonth", item.get("월", ""))
-        day = item.get("dealDay", item.get("일", ""))
-        build_year = item.get("buildYear", item.get("건축년도", ""))
-
-        output.append(f"### {i}. {apt_name}")
-        output.append(f"- **거래금액**: {price}")
-        output.append(f"- **전용면적**: {area}㎡")
-        output.append(f"- **층**: {floor}층")
-        output.append(f"- **법정동**: {dong}")
-        output.append(f"- **계약일**: {year}.{month}.{day}")
-        output.append(f"- **건축년도**: {build_year}년")
+        output.append(f"### {i}. {item.name or '정보없음'}" + (" (해제)" if item.cancelled else ""))
+        output.append(f"- **거래금액**: {format_price(item.amount)}")
+        output.append(f"- **전용면적**: {format_area(item.area)}㎡")
+        output.append(f"- **층**: {'' if item.floor is None else item.floor}층")
+        output.append(f"- **법정동**: {item.dong}")
+        output.append(f"- **계약일**: {format_deal_date(item.deal_date)}")
+        output.append(f"- **건축년도**: {item.build_year or ''}년")
 
         # 추가 정보
-        if item.get("dealingGbn", item.get("거래유형")):
-            output.append(f"- **거래유형**: {item.get('dealingGbn', item.get('거래유형'))}")
-        if item.get("rgstDate", item.get("등기일자")):
-            output.append(f"- **등기일자**: {item.get('rgstDate', item.get('등기일자'))}")
+        if item.dealing_type:
+            output.append(f"- **거래유형**: {item.dealing_type}")
+        if item.registered:
+            output.append(f"- **등기일자**: {item.registered}")
         output.append("")
 
     if page_no < total_pages:
@@ -377,7 +1326,7 @@ def format_apt_trade_result(result: dict, sigungu_code: str, year_month: str, to
     return "\n".join(output)
 
 
-def format_apt_rent_result(result: dict, sigungu_code: str, year_month: str, total_count: int, page_no: int, num_of_rows: int) -> str:
+def format_apt_rent_result(result: dict, sigungu_code: str, year_month: str, total_count: int, page_no: int, num_of_rows: int, summary: list | None = None) -> str:
     """아파트 전월세 결과를 마크다운 형식으로 포맷팅"""
     if "error" in result:
         return f"오류: {result['error']}"
@@ -387,6 +1336,7 @@ def format_apt_rent_result(result: dict, sigungu_code: str, year_month: str, tot
     end_idx = min(page_no * num_of_rows, total_count)
 
     output = ["## 아파트 전월세 실거래가 조회 결과"]
+    output.extend(summary or ())
     output.append(f"- 지역코드: {sigungu_code}")
     output.append(f"- 계약년월: {year_month}")
     output.append(f"- **총 {total_count}건 중 {start_idx}~{end_idx}건 표시 (page {page_no}/{total_pages})**\n")
@@ -396,30 +1346,21 @@ def format_apt_rent_result(result: dict, sigungu_code: str, year_month: str, tot
         return "\n".join(output)
 
     for i, item in enumerate(result["items"], start_idx):
-        apt_name = item.get("aptNm", item.get("아파트", "정보없음"))
-        deposit = format_price(item.get("deposit", item.get("보증금액", "0")))
-        monthly = item.get("monthlyRent", item.get("월세금액", "0"))
-        area = item.get("excluUseAr", item.get("전용면적", ""))
-        floor = item.get("floor", item.get("층", ""))
-        dong = item.get("umdNm", item.get("법정동", ""))
+        rent_type = "전세" if item.is_jeonse else "월세"
 
-        rent_type = "전세" if monthly == "0" or monthly == "" else "월세"
-
-        output.append(f"### {i}. {apt_name} ({rent_type})")
-        output.append(f"- **보증금**: {deposit}")
+        output.append(f"### {i}. {item.name or '정보없음'} ({rent_type})")
+        output.append(f"- **보증금**: {format_price(item.amount)}")
         if rent_type == "월세":
-            output.append(f"- **월세**: {monthly}만원")
-        output.append(f"- **전용면적**: {area}㎡")
-        output.append(f"- **층**: {floor}층")
-        output.append(f"- **법정동**: {dong}")
+            output.append(f"- **월세**: {item.monthly_rent:,}만원")
+        output.append(f"- **전용면적**: {format_area(item.area)}㎡")
+        output.append(f"- **층**: {'' if item.floor is None else item.floor}층")
+        output.append(f"- **법정동**: {item.dong}")
 
         # 계약 정보
-        contract_type = item.get("contractType", item.get("계약구분", ""))
-        if contract_type:
-            output.append(f"- **계약구분**: {contract_type}")
-        contract_term = item.get("contractTerm", item.get("계약기간", ""))
-        if contract_term:
-            output.append(f"- **계약기간**: {contract_term}")
+        if item.contract_type:
+            output.append(f"- **계약구분**: {item.contract_type}")
+        if item.contract_term:
+            output.append(f"- **계약기간**: {item.contract_term}")
         output.append("")
 
     if page_no < total_pages:
@@ -428,7 +1369,7 @@ def format_apt_rent_result(result: dict, sigungu_code: str, year_month: str, tot
     return "\n".join(output)
 
 
-def format_general_result(result: dict, property_type: str, trade_type: str, sigungu_code: str, year_month: str, total_count: int, page_no: int, num_of_rows: int) -> str:
+def format_general_result(result: dict, property_type: str, trade_type: str, sigungu_code: str, year_month: str, total_count: int, page_no: int, num_of_rows: int, summary: list | None = None) -> str:
     """일반 부동산 거래 결과를 마크다운 형식으로 포맷팅"""
     if "error" in result:
         return f"오류: {result['error']}"
@@ -438,6 +1379,7 @@ def format_general_result(result: dict, property_type: str, trade_type: str, sig
     end_idx = min(page_no * num_of_rows, total_count)
 
     output = [f"## {property_type} {trade_type} 실거래가 조회 결과"]
+    output.extend(summary or ())
     output.append(f"- 지역코드: {sigungu_code}")
     output.append(f"- 계약년월: {year_month}")
     output.append(f"- **총 {total_count}건 중 {start_idx}~{end_idx}건 표시 (page {page_no}/{total_pages})**\n")
@@ -447,47 +1389,27 @@ def format_general_result(result: dict, property_type: str, trade_type: str, sig
         return "\n".join(output)
 
     for i, item in enumerate(result["items"], start_idx):
-        # 부동산명 추출 (여러 필드명 시도)
-        name = (item.get("aptNm") or item.get("offiNm") or item.get("mhouseNm") or
-                item.get("아파트") or item.get("단지") or item.get("연립다세대") or
-                item.get("법정동", "정보없음"))
-
-        output.append(f"### {i}. {name}")
+        output.append(f"### {i}. {item.name or item.dong or '정보없음'}" + (" (해제)" if item.cancelled else ""))
 
         # 거래금액 (매매인 경우)
-        if trade_type == "매매":
-            price = item.get("dealAmount", item.get("거래금액", ""))
-            if price:
-                output.append(f"- **거래금액**: {format_price(price)}")
+        if trade_type == "매매" and item.amount is not None:
+            output.append(f"- **거래금액**: {format_price(item.amount)}")
 
         # 보증금/월세 (전월세인 경우)
         if trade_type == "전월세":
-            deposit = item.get("deposit", item.get("보증금액", item.get("보증금", "")))
-            monthly = item.get("monthlyRent", item.get("월세금액", item.get("월세", "")))
-            if deposit:
-                output.append(f"- **보증금**: {format_price(deposit)}")
-            if monthly and monthly != "0":
-                output.append(f"- **월세**: {monthly}만원")
-
-        # 면적
-        area = item.get("excluUseAr", item.get("전용면적", item.get("계약면적", "")))
-        if area:
-            output.append(f"- **면적**: {area}㎡")
-
-        # 층
-        floor = item.get("floor", item.get("층", ""))
-        if floor:
-            output.append(f"- **층**: {floor}층")
-
-        # 법정동
-        dong = item.get("umdNm", item.get("법정동", ""))
-        if dong:
-            output.append(f"- **법정동**: {dong}")
-
-        # 건축년도
-        build_year = item.get("buildYear", item.get("건축년도", ""))
-        if build_year:
-            output.append(f"- **건축년도**: {build_year}년")
+            if item.amount is not None:
+                output.append(f"- **보증금**: {format_price(item.amount)}")
+            if item.monthly_rent:
+                output.append(f"- **월세**: {item.monthly_rent:,}만원")
+
+        if item.area is not None:
+            output.append(f"- **면적**: {format_area(item.area)}㎡")
+        if item.floor is not None:
+            output.append(f"- **층**: {item.floor}층")
+        if item.dong:
+            output.append(f"- **법정동**: {item.dong}")
+        if item.build_year:
+            output.append(f"- **건축년도**: {item.build_year}년")
 
         output.append("")
 
@@ -497,6 +1419,429 @@ def format_general_result(result: dict, property_type: str, trade_type: str, sig
     return "\n".join(output)
 
 
+def fetch_page(endpoint_key: str, sigungu_code: str, year_month: str, num_of_rows: int, page_no: int) -> dict:
+    """실거래가 API 한 페이지 조회 (호출 속도/일일 호출건수 제한 적용)
+
+    Returns:
+        {"items", "totalCount", "resultCode", ...} 또는 {"error": 사용자에게 보여줄 오류 메시지}
+    """
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    params = urllib.parse.urlencode({
+        "serviceKey": api_key,
+        "LAWD_CD": sigungu_code,
+        "DEAL_YMD": year_month,
+        "numOfRows": str(num_of_rows),
+        "pageNo": str(page_no),
+    }, quote_via=urllib.parse.quote)
+
+    path = f"{API_PATH}{ENDPOINTS[endpoint_key]}?{params}"
+
+    limiter = get_rate_limiter(api_key)
+    wait, quota_error = limiter.reserve(endpoint_key)
+    if quota_error:
+        return {"error": f"오류: {quota_error}"}
+
+    received = None  # 응답을 받으면 결과 코드 (받지 못했으면 예약 취소)
+    try:
+        if wait:
+            time.sleep(wait)
+        status, reason, body = connection_pool.request("GET", path, headers=API_HEADERS)
+        received = f"HTTP {status}"
+        if status != 200:
+            return {"error": f"HTTP 오류: {status} - {reason}"}
+        result = parse_xml_response(body)
+        received = result.get("resultCode", "")
+        if "error" in result:
+            return dict(result, error=f"오류: {result['error']}")
+        return result
+
+    except TimeoutError as e:
+        return {"error": f"네트워크 오류: 응답 시간 초과 ({e})"}
+    except (http.client.HTTPException, OSError) as e:
+        return {"error": f"네트워크 오류: {e}"}
+    except Exception as e:
+        return {"error": f"오류 발생: {e}"}
+    finally:
+        if received is None:
+            limiter.release(endpoint_key)
+        else:
+            limiter.record(endpoint_key, received)
+
+
+def month_range(start: str, end: str) -> list:
+    """YYYYMM 부터 YYYYMM 까지의 계약년월 목록 (양 끝 포함)"""
+    year, month = int(start[:4]), int(start[4:])
+    months = []
+    while f"{year:04d}{month:02d}" <= end:
+        months.append(f"{year:04d}{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def fetch_month(endpoint_key: str, sigungu_code: str, year_month: str, use_store: bool = True) -> dict:
+    """한 달치 전체 조회 - 저장소에 최신 파티션이 있으면 API 를 호출하지 않음
+
+    Returns:
+        {"items", "totalCount", "failedPages", "source": "store"|"api"} 또는 {"error"}
+        - 첫 페이지로 totalCount 를 확인한 뒤 나머지 페이지는 동시에(최대 MONTH_FETCH_CONCURRENCY 개) 조회
+        - API 로 전체 페이지를 받으면 저장소에 저장
+    """
+    partition = (sigungu_code, year_month)
+    results, failures = fetch_partitions(endpoint_key, [partition], MONTH_FETCH_CONCURRENCY, use_store)
+    if partition in results:
+        return results[partition]
+    return {"error": failures[partition]}
+
+
+def fetch_store_or_first_page(endpoint_key: str, sigungu_code: str, year_month: str, use_store: bool) -> dict:
+    """저장소에 최신 파티션이 있으면 그 결과, 없으면 API 첫 페이지 (totalCount 확인용)"""
+    if use_store:
+        stored = transaction_store.get(endpoint_key, sigungu_code, year_month)
+        if stored is not None:
+            items, total_count = stored
+            return {"items": items, "totalCount": total_count, "failedPages": [], "source": "store"}
+    return fetch_page(endpoint_key, sigungu_code, year_month, FETCH_ROWS_PER_PAGE, 1)
+
+
+def fetch_partitions(endpoint_key: str, partitions: list, concurrency: int, use_store: bool = True) -> tuple:
+    """(시군구코드, 계약년월) 파티션 여러 개의 전체 페이지를 동시에(최대 concurrency 개 요청) 조회
+
+    파티션마다 첫 페이지(또는 저장소)를 먼저 요청하고, totalCount 를 확인하는 대로 나머지 페이지를
+    같은 executor 에 넣음 → 페이지가 많은 달 하나가 전체 시간을 좌우하지 않음
+    호출 속도는 공유 RateLimiter 가 조절
+
+    Returns:
+        ({(시군구코드, 계약년월): 결과}, {(시군구코드, 계약년월): 오류 메시지}) - 실패한 파티션이 있어도 나머지 결과는 유지
+    """
+    results, failures = {}, {}
+    pages = {}  # partition -> {"totalCount", "items": {page: items}, "failed": [page], "remaining": int}
+
+    def finish(partition) -> None:
+        """파티션의 모든 페이지가 끝나면 페이지 순서대로 합치고, 빠진 페이지가 없으면 저장"""
+        state = pages.pop(partition)
+        items = [item for page in sorted(state["items"]) for item in state["items"][page]]
+        failed_pages = sorted(state["failed"])
+        if not failed_pages:
+            transaction_store.put(endpoint_key, *partition, items, state["totalCount"])
+        results[partition] = {"items": items, "totalCount": state["totalCount"], "failedPages": failed_pages, "source": "api"}
+        if failed_pages:
+            failures[partition] = f"일부 페이지 조회 실패 (page {', '.join(map(str, failed_pages))}, {FETCH_ROWS_PER_PAGE}건 단위)"
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        pending = {
+            executor.submit(fetch_store_or_first_page, endpoint_key, code, ym, use_store): ((code, ym), 1)
+            for code, ym in partitions
+        }
+        while pending:
+            done, _ = wait_futures(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                partition, page = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"error": f"오류 발생: {e}"}
+
+                if page == 1:
+                    if "error" in result:
+                        failures[partition] = result["error"]
+                    elif result.get("source") == "store":
+                        results[partition] = result
+                    else:
+                        total_pages = max(1, (result["totalCount"] + FETCH_ROWS_PER_PAGE - 1) // FETCH_ROWS_PER_PAGE)
+                        pages[partition] = {
+                            "totalCount": result["totalCount"], "items": {1: result["items"]}, "failed": [], "remaining": total_pages - 1,
+                        }
+                        for next_page in range(2, total_pages + 1):
+                            page_future = executor.submit(fetch_page, endpoint_key, *partition, FETCH_ROWS_PER_PAGE, next_page)
+                            pending[page_future] = (partition, next_page)
+                        if total_pages == 1:
+                            finish(partition)
+                    continue
+
+                state = pages[partition]
+                if "error" in result:
+                    state["failed"].append(page)
+                else:
+                    state["items"][page] = result["items"]
+                state["remaining"] -= 1
+                if state["remaining"] == 0:
+                    finish(partition)
+    return results, failures
+
+
+def fetch_month_range(endpoint_key: str, sigungu_code: str, months: list) -> tuple:
+    """여러 달을 동시에(최대 MONTH_FETCH_CONCURRENCY 개) 조회
+
+    Returns:
+        ({계약년월: 결과}, {계약년월: 오류 메시지}) - 실패한 달이 있어도 나머지 결과는 유지
+    """
+    results, failures = fetch_partitions(endpoint_key, [(sigungu_code, ym) for ym in months], MONTH_FETCH_CONCURRENCY)
+    return {ym: result for (_, ym), result in results.items()}, {ym: error for (_, ym), error in failures.items()}
+
+
+def deal_date_key(item: Transaction) -> date:
+    """계약일 정렬 키 (계약일이 없으면 맨 앞)"""
+    return item.deal_date or date.min
+
+
+def format_month_summary(months: list, results: dict, failures: dict, trade_type: str) -> list:
+    """월별 거래 건수와 중위 금액 표"""
+    label = "중위 거래금액" if trade_type == "매매" else "중위 보증금"
+    output = ["### 월별 요약", f"| 계약년월 | 건수 | {label} |", "|----------|------|------|"]
+    for ym in months:
+        if ym not in results:
+            output.append(f"| {ym[:4]}.{ym[4:]} | ❌ 실패 | - |")
+            continue
+        amounts = [item.amount for item in results[ym]["items"] if item.amount is not None]
+        median = format_price(int(statistics.median(amounts))) if amounts else "-"
+        mark = " ⚠️" if ym in failures else ""
+        output.append(f"| {ym[:4]}.{ym[4:]} | {len(results[ym]['items']):,}{mark} | {median} |")
+    return output
+
+
+def format_transactions(
+    result: dict, property_type: str, trade_type: str, sigungu_code: str, year_month: str,
+    total_count: int, page_no: int, num_of_rows: int, summary: list | None = None,
+) -> str:
+    """부동산 유형/거래 유형에 맞는 포맷터로 결과 출력 (summary: 제목 바로 아래에 붙일 조건/정렬/출처 설명 줄)"""
+    if property_type == "아파트" and trade_type == "매매":
+        return format_apt_trade_result(result, sigungu_code, year_month, total_count, page_no, num_of_rows, summary)
+    elif property_type == "아파트" and trade_type == "전월세":
+        return format_apt_rent_result(result, sigungu_code, year_month, total_count, page_no, num_of_rows, summary)
+    else:
+        return format_general_result(
+            result, property_type, trade_type, sigungu_code, year_month, total_count, page_no, num_of_rows, summary
+        )
+
+
+# 정렬 기준 → 거래별 정렬 값 (값이 없는 거래는 순위에서 빠짐)
+SORT_KEYS = {
+    "price": lambda item: item.amount,
+    "price_per_area": lambda item: item.amount / item.area if item.amount is not None and item.area else None,
+    "area": lambda item: item.area,
+    "floor": lambda item: item.floor,
+    "date": lambda item: item.deal_date,
+    "build_year": lambda item: item.build_year,
+}
+SORT_LABELS = {"price": "금액", "price_per_area": "㎡당 금액", "area": "전용면적", "floor": "층", "date": "계약일", "build_year": "건축년도"}
+CANCELLED_FILTERS = ("포함", "제외", "해제만")
+
+
+def transaction_filter(
+    min_price: int = 0, max_price: int = 0, min_area: float = 0, max_area: float = 0,
+    min_floor: int = 0, max_floor: int = 0, dong: str = "", name: str = "",
+    min_build_year: int = 0, max_build_year: int = 0, cancelled: str = "포함",
+) -> tuple:
+    """거래 조건 (0/빈 값은 제한 없음) → (판정 함수 또는 None, 조건 설명 목록)
+
+    판정 함수는 지정한 조건만 검사 - 금액은 만원 (전월세는 보증금), 값이 없는 거래는 범위 조건에서 제외
+    """
+    checks, labels = [], []
+
+    def add_range(attr: str, low, high, label: str, fmt) -> None:
+        if low:
+            checks.append(lambda item: getattr(item, attr) is not None and getattr(item, attr) >= low)
+        if high:
+            checks.append(lambda item: getattr(item, attr) is not None and getattr(item, attr) <= high)
+        if low or high:
+            labels.append(f"{label} {fmt(low) if low else ''}~{fmt(high) if high else ''}")
+
+    add_range("amount", min_price, max_price, "금액", format_price)
+    add_range("area", min_area, max_area, "전용면적", lambda v: f"{v:g}㎡")
+    add_range("floor", min_floor, max_floor, "층", lambda v: f"{v}층")
+    add_range("build_year", min_build_year, max_build_year, "건축년도", lambda v: f"{v}년")
+    if dong.strip():
+        dong = dong.strip()
+        checks.append(lambda item: item.dong == dong)
+        labels.append(f"법정동 {dong}")
+    if name.strip():
+        needle = "".join(name.split())
+        checks.append(lambda item: needle in "".join(item.name.split()))
+        labels.append(f"단지명 '{name.strip()}' 포함")
+    if cancelled == "제외":
+        checks.append(lambda item: not item.cancelled)
+        labels.append("해제 거래 제외")
+    elif cancelled == "해제만":
+        checks.append(lambda item: item.cancelled)
+        labels.append("해제 거래만")
+
+    if not checks:
+        return None, labels
+    return (lambda item: all(check(item) for check in checks)), labels
+
+
+def format_filter_summary(filter_labels: list | None, sort_by: str, descending: bool, matched: int) -> list:
+    """적용한 조건/정렬 설명 (조건도 정렬도 없으면 빈 목록)"""
+    if not filter_labels and not sort_by:
+        return []
+    lines = []
+    if filter_labels:
+        lines.append(f"- **조건**: {', '.join(filter_labels)} → {matched:,}건")
+    if sort_by:
+        order = ("최근" if descending else "오래된") if sort_by == "date" else ("높은" if descending else "낮은")
+        lines.append(f"- **정렬**: {SORT_LABELS[sort_by]} {order} 순")
+    return lines
+
+
+def select_transactions(items, predicate, sort_by: str, descending: bool, page_no: int, num_of_rows: int) -> tuple:
+    """조건에 맞는 거래 중 요청한 페이지만 선택 → (페이지 거래 목록, 조건에 맞는 건수)
+
+    정렬할 때는 전체를 정렬하지 않고 page_no * num_of_rows 개 크기의 힙으로 상위 k 개만 유지 (메모리 O(k)),
+    정렬 값이 없는 거래는 순위를 매길 수 없으므로 건수에서도 제외 (페이지 수와 건수가 어긋나지 않도록)
+    """
+    matched = 0
+    key = SORT_KEYS[sort_by] if sort_by else None
+
+    def matching():
+        nonlocal matched
+        for item in items:
+            if (predicate is None or predicate(item)) and (key is None or key(item) is not None):
+                matched += 1
+                yield item
+
+    k = page_no * num_of_rows
+    if key is not None:
+        top = (heapq.nlargest if descending else heapq.nsmallest)(k, matching(), key=key)
+        return top[k - num_of_rows:], matched
+    page = []
+    for item in matching():
+        if k - num_of_rows < matched <= k:
+            page.append(item)
+    return page, matched
+
+
+def search_month_range(
+    endpoint_key: str, property_type: str, trade_type: str, sigungu_code: str,
+    start: str, end: str, num_of_rows: int, page_no: int,
+    predicate=None, sort_by: str = "", descending: bool = True, filter_labels: list | None = None,
+) -> str:
+    """기간 조회 - 월별 전체 페이지를 동시에 받아 계약일 순으로 합친 뒤 요약과 목록 출력 (조건/정렬이 있으면 서버에서 적용)"""
+    if len(end) != 6 or not end.isdigit():
+        return "오류: 마지막 계약년월은 6자리 숫자여야 합니다. (예: 202412)"
+    if end < start:
+        return "오류: end_year_month 가 year_month 보다 앞섭니다."
+    months = month_range(start, end)
+    if len(months) > MAX_RANGE_MONTHS:
+        return f"오류: 한 번에 조회할 수 있는 기간은 최대 {MAX_RANGE_MONTHS}개월입니다. (요청: {len(months)}개월)"
+
+    started = time.perf_counter()
+    results, failures = fetch_month_range(endpoint_key, sigungu_code, months)
+    elapsed = time.perf_counter() - started
+
+    merged = [item for ym in months if ym in results for item in results[ym]["items"]]
+    if not sort_by:
+        merged.sort(key=deal_date_key)
+    page_items, total_count = select_transactions(merged, predicate, sort_by, descending, page_no, num_of_rows)
+    page = {"items": page_items}
+
+    period = f"{start}~{end}"
+    output = [f"## {property_type} {trade_type} 기간 조회 ({start[:4]}.{start[4:]} ~ {end[:4]}.{end[4:]}, {len(months)}개월)"]
+    stored = sum(1 for result in results.values() if result["source"] == "store")
+    output.append(
+        f"- 성공 {len(results)}개월 (로컬 저장소 {stored}개월) / 실패 {len(months) - len(results)}개월, "
+        f"총 {len(merged):,}건 ({elapsed:.1f}초)"
+    )
+    output.extend(format_filter_summary(filter_labels, sort_by, descending, total_count))
+    if failures:
+        output.append("\n⚠️ 조회에 실패했거나 일부만 받은 달 - 해당 달만 다시 조회하세요.")
+        for ym in sorted(failures):
+            output.append(f"- {ym}: {failures[ym]}")
+    output.append("")
+    output.extend(format_month_summary(months, results, failures, trade_type))
+    output.append("")
+    output.append(format_transactions(page, property_type, trade_type, sigungu_code, period, total_count, page_no, num_of_rows))
+    return "\n".join(output)
+
+
+# 가격 통계 그룹 기준, 전용면적 구간 (상한 ㎡, 이름), 평 환산
+STAT_GROUPS = {"month": "계약년월", "year": "계약년도", "dong": "법정동", "complex": "단지", "area_band": "전용면적"}
+# 단지명이 있는 유형 (단지별 추이)
+COMPLEX_PROPERTY_TYPES = ["아파트", "오피스텔", "연립다세대"]
+AREA_BANDS = [(40, "~40㎡"), (60, "40~60㎡"), (85, "60~85㎡"), (135, "85~135㎡"), (float("inf"), "135㎡~")]
+SQM_PER_PYEONG = 3.3058
+
+
+def group_percentiles(values: np.ndarray, groups: np.ndarray, n_groups: int, quantiles: tuple) -> dict:
+    """그룹별 분위수 (선형 보간) - (그룹, 값) 순으로 한 번 정렬한 뒤 그룹 시작 위치에서 한꺼번에 계산"""
+    ordered = values[np.lexsort((values, groups))]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    result = {}
+    for q in quantiles:
+        position = starts + (counts - 1) * q
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        weight = position - lower
+        result[q] = ordered[lower] * (1 - weight) + ordered[upper] * weight
+    return result
+
+
+def stat_group_labels(items: list, areas: np.ndarray, group_by: str) -> list:
+    """거래별 그룹 이름"""
+    if group_by == "month":
+        return [item.deal_date.strftime("%Y.%m") if item.deal_date else "-" for item in items]
+    if group_by == "year":
+        return [str(item.deal_date.year) if item.deal_date else "-" for item in items]
+    if group_by == "dong":
+        return [item.dong or "-" for item in items]
+    if group_by == "complex":
+        return [f"{item.dong} {item.name}".strip() or "-" for item in items]
+    if group_by == "area_band":
+        bounds = np.array([upper for upper, _ in AREA_BANDS[:-1]])
+        bands = np.digitize(areas, bounds, right=True)
+        return [AREA_BANDS[band][1] if area == area else "-" for band, area in zip(bands.tolist(), areas.tolist())]
+    return ["전체"] * len(items)
+
+
+def price_statistics(items: list, group_by: str, labels: list | None = None) -> list:
+    """그룹별 [(그룹, 거래량, 중위, 하위 10%, 상위 10%, ㎡당 평균, 평당 평균)] - 금액 단위 만원
+
+    labels 를 주면 group_by 대신 거래별로 주어진 그룹 이름을 사용 (예: 조회한 지역 이름)
+    """
+    if labels is not None:
+        pairs = [(item, label) for item, label in zip(items, labels) if item.amount is not None]
+        items, labels = [item for item, _ in pairs], [label for _, label in pairs]
+    else:
+        items = [item for item in items if item.amount is not None]
+    if not items:
+        return []
+    amounts = np.fromiter((item.amount for item in items), dtype=np.float64, count=len(items))
+    areas = np.fromiter((item.area or np.nan for item in items), dtype=np.float64, count=len(items))
+
+    if labels is None:
+        labels = stat_group_labels(items, areas, group_by)
+    names, groups = np.unique(np.array(labels), return_inverse=True)
+    counts = np.bincount(groups, minlength=len(names))
+    pct = group_percentiles(amounts, groups, len(names), (0.5, 0.1, 0.9))
+
+    # ㎡당 가격 평균은 면적이 있는 거래만
+    has_area = areas > 0
+    per_sqm = amounts[has_area] / areas[has_area]
+    sqm_counts = np.bincount(groups[has_area], minlength=len(names))
+    sqm_sums = np.bincount(groups[has_area], weights=per_sqm, minlength=len(names))
+    per_sqm_mean = np.divide(sqm_sums, sqm_counts, out=np.full(len(names), np.nan), where=sqm_counts > 0)
+
+    return [
+        (str(names[g]), int(counts[g]), pct[0.5][g], pct[0.1][g], pct[0.9][g], per_sqm_mean[g], per_sqm_mean[g] * SQM_PER_PYEONG)
+        for g in range(len(names))
+    ]
+
+
+def sort_statistics(stats: list, group_by: str) -> list:
+    """기간은 시간 순, 면적 구간은 구간 순, 나머지는 거래량 순"""
+    if group_by in ("month", "year"):
+        return sorted(stats, key=lambda row: row[0])
+    if group_by == "area_band":
+        band_order = {name: i for i, (_, name) in enumerate(AREA_BANDS)}
+        return sorted(stats, key=lambda row: band_order.get(row[0], len(band_order)))
+    return sorted(stats, key=lambda row: (-row[1], row[0]))
+
+
+def format_statistic_price(value: float) -> str:
+    """통계 금액 (만원, 소수점 반올림)"""
+    return "-" if np.isnan(value) else format_price(int(round(value)))
+
+
 @mcp.tool()
 def search_real_estate_transaction(
     sigungu_code: str,
@@ -504,7 +1849,21 @@ def search_real_estate_transaction(
     property_type: str = "아파트",
     trade_type: str = "매매",
     num_of_rows: int = 30,
-    page_no: int = 1
+    page_no: int = 1,
+    end_year_month: str = "",
+    min_price: int = 0,
+    max_price: int = 0,
+    min_area: float = 0,
+    max_area: float = 0,
+    min_floor: int = 0,
+    max_floor: int = 0,
+    dong: str = "",
+    name: str = "",
+    min_build_year: int = 0,
+    max_build_year: int = 0,
+    cancelled: str = "포함",
+    sort_by: str = "",
+    descending: bool = True
 ) -> str:
     """
     부동산 실거래가 조회
@@ -521,6 +1880,22 @@ def search_real_estate_transaction(
             - 매매, 전월세 (토지/분양입주권/상업업무용/공장창고는 매매만 가능)
         num_of_rows: 한 페이지에 표시할 건수 (기본: 30, 최대: 100)
         page_no: 페이지 번호 (기본: 1). 더 많은 결과를 보려면 증가시키세요.
+        end_year_month: 기간 조회 시 마지막 계약년월 6자리 (예: year_month="202301", end_year_month="202412")
+            - ⭐ 여러 달 추이는 한 번에 조회하세요. 각 달의 전체 페이지를 동시에 받아 계약일 순으로 합칩니다.
+            - 월별 건수/중위 금액 요약 + 합친 목록을 num_of_rows/page_no 단위로 표시
+            - 실패한 달은 따로 표시하고 나머지 결과는 그대로 보여줌
+        ⭐ 조건/정렬 (지정하면 한 달치(또는 기간) 전체를 받아 서버에서 거른 뒤 결과만 페이지 단위로 표시, 0/빈 값은 제한 없음)
+        - "대치동 84㎡ 20층 이상 최고가 10건" → dong="대치동", min_area=80, max_area=90, min_floor=20, sort_by="price", num_of_rows=10
+        min_price, max_price: 금액 범위 (만원, 전월세는 보증금, 예: min_price=200000 → 20억 이상)
+        min_area, max_area: 전용면적 범위 (㎡)
+        min_floor, max_floor: 층 범위
+        dong: 법정동 (예: "대치동")
+        name: 단지명 포함 문자열 (공백 무시, 예: "래미안")
+        min_build_year, max_build_year: 건축년도 범위
+        cancelled: 해제 거래 - "포함" (기본), "제외", "해제만"
+        sort_by: 정렬 기준 - "price", "price_per_area" (㎡당 금액), "area", "floor", "date", "build_year"
+            (생략 시 API 순서, 기간 조회는 계약일 순)
+        descending: True(기본) 면 큰 값(최근) 순, False 면 작은 값 순
 
     Returns:
         실거래가 목록 (단지명, 거래금액, 면적, 층, 계약일 등)
@@ -549,151 +1924,744 @@ def search_real_estate_transaction(
     num_of_rows = max(1, min(100, num_of_rows))
     page_no = max(1, page_no)
 
+    if sort_by and sort_by not in SORT_KEYS:
+        return f"오류: 잘못된 정렬 기준입니다. 가능한 값: {', '.join(SORT_KEYS)}"
+    if cancelled not in CANCELLED_FILTERS:
+        return f"오류: cancelled 는 {', '.join(CANCELLED_FILTERS)} 중 하나입니다."
+    predicate, filter_labels = transaction_filter(
+        min_price, max_price, min_area, max_area, min_floor, max_floor, dong, name, min_build_year, max_build_year, cancelled
+    )
+
     # 엔드포인트 결정
     endpoint_key = f"{property_type}_{trade_type}"
     endpoint = ENDPOINTS.get(endpoint_key)
     if not endpoint:
         return f"오류: 지원하지 않는 조합입니다: {property_type} {trade_type}"
 
-    # API 호출
-    params = urllib.parse.urlencode({
-        "serviceKey": api_key,
-        "LAWD_CD": sigungu_code,
-        "DEAL_YMD": year_month,
-        "numOfRows": str(num_of_rows),
-        "pageNo": str(page_no),
-    }, quote_via=urllib.parse.quote)
+    if end_year_month:
+        return search_month_range(
+            endpoint_key, property_type, trade_type, sigungu_code, year_month, end_year_month, num_of_rows, page_no,
+            predicate, sort_by, descending, filter_labels,
+        )
+
+    # 조건/정렬은 한 달치 전체에 적용 (저장소가 꺼져 있어도 전체 페이지를 받음)
+    if predicate is not None or sort_by:
+        month = fetch_month(endpoint_key, sigungu_code, year_month)
+        if "error" in month:
+            return month["error"]
+        page_items, matched = select_transactions(month["items"], predicate, sort_by, descending, page_no, num_of_rows)
+        summary = format_filter_summary(filter_labels, sort_by, descending, matched)
+        summary.append(f"- 한 달 전체 {len(month['items']):,}건에서 선택" + (" (로컬 저장소)" if month["source"] == "store" else ""))
+        if month["failedPages"]:
+            summary.append(f"- ⚠️ 일부 페이지 조회 실패 (page {', '.join(map(str, month['failedPages']))}) - 해당 거래는 빠졌습니다.")
+        return format_transactions(
+            {"items": page_items}, property_type, trade_type, sigungu_code, year_month, matched, page_no, num_of_rows, summary
+        )
+
+    # 저장소에 받아 둔 달이면 API 호출 없이 요청한 페이지만 표시
+    stored = transaction_store.get(endpoint_key, sigungu_code, year_month)
+    if stored is not None:
+        items, total_count = stored
+        page = {"items": items[(page_no - 1) * num_of_rows:page_no * num_of_rows]}
+        output = format_transactions(page, property_type, trade_type, sigungu_code, year_month, total_count, page_no, num_of_rows)
+        return output + "\n\n_로컬 저장소에서 조회 (API 호출 없음)_"
+
+    # 없으면 요청한 페이지만 1회 호출 - 한 달 전체는 조건/기간 조회나 sync.py 로 받을 때 저장 (일일 호출건수 절약)
+    result = fetch_page(endpoint_key, sigungu_code, year_month, num_of_rows, page_no)
+    if "error" in result:
+        return result["error"]
+    if page_no == 1 and result["items"] and len(result["items"]) == result["totalCount"]:
+        # 한 페이지에 한 달치가 모두 들어왔으면 그대로 저장
+        transaction_store.put(endpoint_key, sigungu_code, year_month, result["items"], result["totalCount"])
+    return format_transactions(result, property_type, trade_type, sigungu_code, year_month, result["totalCount"], page_no, num_of_rows)
 
-    url = f"{API_BASE_URL}{endpoint}?{params}"
 
-    try:
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "Mozilla/5.0 (compatible; RealEstateBot/1.0)")
-        with urllib.request.urlopen(req, timeout=30) as response:
-            xml_text = response.read().decode("utf-8")
-            result = parse_xml_response(xml_text)
-
-            # totalCount 추출
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(xml_text)
-            total_count = int(root.findtext(".//totalCount", "0"))
-
-            # 결과 포맷팅
-            if property_type == "아파트" and trade_type == "매매":
-                return format_apt_trade_result(result, sigungu_code, year_month, total_count, page_no, num_of_rows)
-            elif property_type == "아파트" and trade_type == "전월세":
-                return format_apt_rent_result(result, sigungu_code, year_month, total_count, page_no, num_of_rows)
-            else:
-                return format_general_result(result, property_type, trade_type, sigungu_code, year_month, total_count, page_no, num_of_rows)
+@mcp.tool()
+def get_price_statistics(
+    sigungu_code: str,
+    year_month: str,
+    end_year_month: str = "",
+    property_type: str = "아파트",
+    trade_type: str = "매매",
+    group_by: str = "month",
+    rent_type: str = "전세",
+    include_cancelled: bool = False,
+    top_n: int = 50
+) -> str:
+    """
+    실거래가 통계 - 지역/기간의 전체 거래로 그룹별 거래량, 중위·하위 10%·상위 10% 가격, ㎡당·평당 평균 계산
 
-    except urllib.error.HTTPError as e:
-        return f"HTTP 오류: {e.code} - {e.reason}"
-    except urllib.error.URLError as e:
-        return f"네트워크 오류: {e.reason}"
-    except Exception as e:
-        return f"오류 발생: {e}"
+    ⭐ 시세/추이 질문에는 목록을 여러 페이지 넘겨 보지 말고 이 도구를 사용하세요. 요약 표만 반환합니다.
+
+    Args:
+        sigungu_code: 시군구코드 5자리 (예: "11680" 강남구)
+        year_month: 시작 계약년월 6자리 (예: "202401")
+        end_year_month: 마지막 계약년월 6자리 (생략 시 year_month 한 달)
+        property_type: 부동산 유형 (아파트, 오피스텔, 연립다세대, 단독다가구, 토지 등)
+        trade_type: 거래 유형 (매매: 거래금액 기준, 전월세: 보증금 기준)
+        group_by: 그룹 기준
+            - "month": 계약년월별 (기본)
+            - "year": 계약년도별
+            - "dong": 법정동별
+            - "complex": 단지별
+            - "area_band": 전용면적 구간별 (~40, 40~60, 60~85, 85~135, 135㎡~)
+        rent_type: 전월세 통계 대상 - "전세" (기본), "월세", "전체"
+        include_cancelled: 해제된 거래 포함 여부 (기본: 제외)
+        top_n: 표시할 최대 그룹 수 (법정동·단지는 거래량 순, 기본: 50)
+
+    Returns:
+        그룹별 통계 표 (금액 단위 만원, 1평 = 3.3058㎡) + 전체 합계
+    """
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        return "오류: DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다.\n공공데이터포털(data.go.kr)에서 API 키를 발급받아 설정해주세요."
+
+    if property_type not in PROPERTY_TYPES:
+        return f"오류: 잘못된 부동산 유형입니다. 가능한 값: {', '.join(PROPERTY_TYPES)}"
+    available_trades = TRADE_TYPES.get(property_type, ["매매"])
+    if trade_type not in available_trades:
+        return f"오류: {property_type}의 가능한 거래 유형: {', '.join(available_trades)}"
+    endpoint_key = f"{property_type}_{trade_type}"
+    if endpoint_key not in ENDPOINTS:
+        return f"오류: 지원하지 않는 조합입니다: {property_type} {trade_type}"
+    if group_by not in STAT_GROUPS:
+        return f"오류: 잘못된 그룹 기준입니다. 가능한 값: {', '.join(STAT_GROUPS)}"
+    if rent_type not in ("전세", "월세", "전체"):
+        return "오류: rent_type 은 전세, 월세, 전체 중 하나입니다."
+    if len(sigungu_code) != 5 or not sigungu_code.isdigit():
+        return "오류: 시군구코드는 5자리 숫자여야 합니다. (예: 11680)"
+    end_year_month = end_year_month or year_month
+    if any(len(ym) != 6 or not ym.isdigit() for ym in (year_month, end_year_month)):
+        return "오류: 계약년월은 6자리 숫자여야 합니다. (예: 202401)"
+    if end_year_month < year_month:
+        return "오류: end_year_month 가 year_month 보다 앞섭니다."
+    months = month_range(year_month, end_year_month)
+    if len(months) > MAX_RANGE_MONTHS:
+        return f"오류: 한 번에 조회할 수 있는 기간은 최대 {MAX_RANGE_MONTHS}개월입니다. (요청: {len(months)}개월)"
+
+    results, failures = fetch_month_range(endpoint_key, sigungu_code, months)
+    if not results and failures:
+        return f"오류: 모든 달의 조회에 실패했습니다. ({failures[months[0]]})"
+
+    items = [item for ym in months if ym in results for item in results[ym]["items"]]
+    cancelled = sum(1 for item in items if item.cancelled)
+    if not include_cancelled:
+        items = [item for item in items if not item.cancelled]
+    if trade_type == "전월세" and rent_type != "전체":
+        items = [item for item in items if item.is_jeonse == (rent_type == "전세")]
+
+    stats = sort_statistics(price_statistics(items, group_by), group_by)
+    shown = stats[:max(1, top_n)]
+
+    price_label = "거래금액" if trade_type == "매매" else "보증금"
+    kind = f"전월세({rent_type})" if trade_type == "전월세" else trade_type
+    period = year_month if year_month == end_year_month else f"{year_month}~{end_year_month}"
+    output = [f"## {property_type} {kind} 가격 통계 ({STAT_GROUPS[group_by]}별)"]
+    output.append(f"- 지역코드: {sigungu_code}, 계약년월: {period}")
+    output.append(f"- 대상 {len(items):,}건" + ("" if include_cancelled else f" (해제 {cancelled:,}건 제외)"))
+    if failures:
+        output.append(f"\n⚠️ 조회에 실패했거나 일부만 받은 달 (통계에서 빠짐): {', '.join(sorted(failures))}")
+    if not stats:
+        output.append("\n검색 결과가 없습니다.")
+        return "\n".join(output)
+
+    output.append("")
+    output.append(f"| {STAT_GROUPS[group_by]} | 거래량 | 중위 {price_label} | 하위 10% | 상위 10% | ㎡당 평균 | 평당 평균 |")
+    output.append("|------|--------|------|------|------|------|------|")
+    rows = list(shown)
+    if len(stats) > 1:
+        # 전체 행은 그룹 통계를 합치지 않고 모든 거래로 다시 계산 (중위/분위는 합산 불가)
+        rows.append(("**전체**",) + price_statistics(items, "all")[0][1:])
+    for label, count, median, p10, p90, per_sqm, per_pyeong in rows:
+        output.append(
+            f"| {label} | {count:,} | {format_statistic_price(median)} | {format_statistic_price(p10)} | "
+            f"{format_statistic_price(p90)} | {format_statistic_price(per_sqm)} | {format_statistic_price(per_pyeong)} |"
+        )
+    if len(stats) > len(shown):
+        output.append(f"\n※ {len(stats)}개 그룹 중 {len(shown)}개만 표시 (top_n 으로 조정)")
+    return "\n".join(output)
+
+
+@mcp.tool()
+def get_complex_price_history(
+    complex_name: str,
+    sigungu_code: str,
+    year_month: str,
+    end_year_month: str = "",
+    dong: str = "",
+    jibun: str = "",
+    property_type: str = "아파트",
+    trade_type: str = "매매",
+    group_by: str = "month",
+    min_area: float = 0,
+    max_area: float = 0,
+    rent_type: str = "전세"
+) -> str:
+    """
+    단지별 가격 추이 - 한 단지의 기간별 거래량, 중위·하위 10%·상위 10% 가격, ㎡당·평당 평균
+
+    ⭐ 특정 단지의 시세 흐름은 지역 전체 목록을 넘겨 보지 말고 이 도구를 사용하세요.
+    로컬 저장소의 단지 색인(법정동 + 지번 + 단지명)으로 해당 단지 거래만 읽습니다.
+    저장소에 없거나 오래된 달만 API 로 받아 저장하므로 같은 지역을 다시 조회하면 API 호출 없이 바로 응답합니다.
+
+    Args:
+        complex_name: 단지명 (공백 무시 부분 일치, 예: "은마", "래미안대치팰리스")
+        sigungu_code: 시군구코드 5자리 (예: "11680" 강남구)
+        year_month: 시작 계약년월 6자리 (예: "202001")
+        end_year_month: 마지막 계약년월 6자리 (생략 시 year_month 한 달)
+        dong: 법정동 (같은 이름의 단지가 여럿일 때 지정, 예: "대치동")
+        jibun: 지번 (같은 법정동에 같은 이름의 단지가 여럿일 때 지정)
+        property_type: 아파트 (기본), 오피스텔, 연립다세대
+        trade_type: 매매 (거래금액 기준), 전월세 (보증금 기준)
+        group_by: "month" (기본, 계약년월별), "year" (계약년도별), "area_band" (전용면적 구간별)
+        min_area: 최소 전용면적 ㎡ (0 이면 제한 없음, 예: 84㎡ 평형만 보려면 min_area=80, max_area=90)
+        max_area: 최대 전용면적 ㎡ (0 이면 제한 없음)
+        rent_type: 전월세 대상 - "전세" (기본), "월세", "전체"
+
+    Returns:
+        기간별 통계 표 (금액 단위 만원, 1평 = 3.3058㎡, 해제 거래 제외) + 전체 합계
+        - 이름이 같은 단지가 여럿이면 법정동/지번 후보 목록
+    """
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        return "오류: DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다.\n공공데이터포털(data.go.kr)에서 API 키를 발급받아 설정해주세요."
+    if not transaction_store.enabled:
+        return "오류: 로컬 저장소가 꺼져 있어 단지 색인을 사용할 수 없습니다. (REAL_ESTATE_STORE_PATH 설정 필요)"
+
+    if property_type not in COMPLEX_PROPERTY_TYPES:
+        return f"오류: 단지별 추이는 {', '.join(COMPLEX_PROPERTY_TYPES)}만 가능합니다."
+    if trade_type not in ("매매", "전월세"):
+        return "오류: trade_type 은 매매, 전월세 중 하나입니다."
+    endpoint_key = f"{property_type}_{trade_type}"
+    if group_by not in ("month", "year", "area_band"):
+        return "오류: group_by 는 month, year, area_band 중 하나입니다."
+    if rent_type not in ("전세", "월세", "전체"):
+        return "오류: rent_type 은 전세, 월세, 전체 중 하나입니다."
+    if not complex_name.strip():
+        return "오류: 단지명을 입력해주세요."
+    if len(sigungu_code) != 5 or not sigungu_code.isdigit():
+        return "오류: 시군구코드는 5자리 숫자여야 합니다. (예: 11680)"
+    end_year_month = end_year_month or year_month
+    if any(len(ym) != 6 or not ym.isdigit() for ym in (year_month, end_year_month)):
+        return "오류: 계약년월은 6자리 숫자여야 합니다. (예: 202401)"
+    if end_year_month < year_month:
+        return "오류: end_year_month 가 year_month 보다 앞섭니다."
+    months = month_range(year_month, end_year_month)
+    if len(months) > MAX_RANGE_MONTHS:
+        return f"오류: 한 번에 조회할 수 있는 기간은 최대 {MAX_RANGE_MONTHS}개월입니다. (요청: {len(months)}개월)"
+
+    started = time.perf_counter()
+    # 저장소에 없는 달만 받아 저장 (저장하면서 단지 색인도 갱신)
+    missing = transaction_store.missing_months(endpoint_key, sigungu_code, months)
+    failures = {}
+    if missing:
+        _, failures = fetch_month_range(endpoint_key, sigungu_code, missing)
+
+    candidates = transaction_store.find_complexes(property_type, sigungu_code, complex_name, dong.strip(), jibun.strip())
+    exact = [c for c in candidates if "".join(c[2].split()) == "".join(complex_name.split())]
+    if len(candidates) > 1 and exact:
+        candidates = exact
+    if not candidates:
+        output = [f"'{complex_name}' 단지를 찾을 수 없습니다. (지역코드: {sigungu_code}, 계약년월: {year_month}~{end_year_month})"]
+        if failures:
+            output.append(f"⚠️ 조회에 실패한 달: {', '.join(sorted(failures))}")
+        output.append("💡 search_real_estate_transaction 으로 단지명을 확인하거나 기간을 넓혀 보세요.")
+        return "\n".join(output)
+    if len(candidates) > 1:
+        output = [f"## '{complex_name}' 단지 후보 {len(candidates)}개", "", "| 단지명 | 법정동 | 지번 | 건축년도 |", "|------|------|------|------|"]
+        for c_dong, c_jibun, c_name, c_build_year in candidates[:30]:
+            output.append(f"| {c_name} | {c_dong or '-'} | {c_jibun or '-'} | {c_build_year or '-'} |")
+        if len(candidates) > 30:
+            output.append(f"\n※ {len(candidates)}개 중 30개만 표시")
+        output.append("\n💡 complex_name 을 정확히 입력하거나 dong/jibun 을 지정하세요.")
+        return "\n".join(output)
+
+    c_dong, c_jibun, c_name, c_build_year = candidates[0]
+    items = transaction_store.complex_transactions(endpoint_key, sigungu_code, c_dong, c_jibun, c_name, months[0], months[-1])
+    cancelled = sum(1 for item in items if item.cancelled)
+    predicate, _ = transaction_filter(min_area=min_area, max_area=max_area, cancelled="제외")
+    items = [item for item in items if predicate(item)]
+    if trade_type == "전월세" and rent_type != "전체":
+        items = [item for item in items if item.is_jeonse == (rent_type == "전세")]
+    stats = sort_statistics(price_statistics(items, group_by), group_by)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    price_label = "거래금액" if trade_type == "매매" else "보증금"
+    kind = f"전월세({rent_type})" if trade_type == "전월세" else trade_type
+    period = year_month if year_month == end_year_month else f"{year_month}~{end_year_month}"
+    output = [f"## {c_name} {kind} 가격 추이 ({STAT_GROUPS[group_by]}별)"]
+    output.append(f"- 위치: {c_dong} {c_jibun} (지역코드 {sigungu_code})".rstrip() + (f", {c_build_year}년 건축" if c_build_year else ""))
+    if min_area and max_area:
+        area_range = f", 전용면적 {min_area:g}~{max_area:g}㎡"
+    elif min_area or max_area:
+        area_range = f", 전용면적 {min_area or max_area:g}㎡ {'이상' if min_area else '이하'}"
+    else:
+        area_range = ""
+    output.append(f"- 계약년월: {period}{area_range}")
+    output.append(f"- 대상 {len(items):,}건 (해제 {cancelled:,}건 제외)")
+    output.append(f"- 조회 {elapsed_ms:.0f}ms" + (f" (API 로 {len(missing)}개월 받아 저장)" if missing else " (로컬 저장소 단지 색인)"))
+    if failures:
+        output.append(f"\n⚠️ 조회에 실패했거나 일부만 받은 달 (통계에서 빠짐): {', '.join(sorted(failures))}")
+    if not stats:
+        output.append("\n해당 조건의 거래가 없습니다.")
+        return "\n".join(output)
+
+    output.append("")
+    output.append(f"| {STAT_GROUPS[group_by]} | 거래량 | 중위 {price_label} | 하위 10% | 상위 10% | ㎡당 평균 | 평당 평균 |")
+    output.append("|------|--------|------|------|------|------|------|")
+    rows = list(stats)
+    if len(stats) > 1:
+        rows.append(("**전체**",) + price_statistics(items, "all")[0][1:])
+    for label, count, median, p10, p90, per_sqm, per_pyeong in rows:
+        output.append(
+            f"| {label} | {count:,} | {format_statistic_price(median)} | {format_statistic_price(p10)} | "
+            f"{format_statistic_price(p90)} | {format_statistic_price(per_sqm)} | {format_statistic_price(per_pyeong)} |"
+        )
+    return "\n".join(output)
+
+
+@mcp.tool()
+def get_jeonse_ratio(
+    sigungu_code: str,
+    year_month: str,
+    end_year_month: str = "",
+    dong: str = "",
+    name: str = "",
+    by_area_band: bool = True,
+    min_samples: int = 1,
+    sort_by: str = "ratio",
+    top_n: int = 50
+) -> str:
+    """
+    아파트 전세가율 (전세 보증금 중위 ÷ 매매가 중위) - 단지 × 전용면적 구간별, 표본 건수 포함
+
+    ⭐ 매매와 전월세를 따로 조회해 비교하지 말고 이 도구를 사용하세요.
+    같은 지역/기간의 아파트 매매와 전월세를 동시에 받아 단지(법정동 + 단지명) × 전용면적 구간으로 묶어 맞춘 요약 표만 반환합니다.
+
+    Args:
+        sigungu_code: 시군구코드 5자리 (예: "11680" 강남구)
+        year_month: 시작 계약년월 6자리 (예: "202401")
+        end_year_month: 마지막 계약년월 6자리 (생략 시 year_month 한 달, 표본이 적으면 기간을 넓히세요)
+        dong: 법정동 (예: "대치동", 생략 시 전체)
+        name: 단지명 포함 문자열 (공백 무시, 예: "래미안")
+        by_area_band: True(기본) 면 단지 × 전용면적 구간(~40, 40~60, 60~85, 85~135, 135㎡~)별, False 면 단지별
+        min_samples: 매매·전세 양쪽 모두 이 건수 이상인 그룹만 표시 (기본: 1)
+        sort_by: "ratio" (기본, 전세가율 높은 순), "samples" (표본 많은 순), "complex" (단지명 순)
+        top_n: 표시할 최대 그룹 수 (기본: 50)
+
+    Returns:
+        단지별 매매 중위·전세 중위·전세가율 표 (해제 거래와 월세 제외, 금액 단위 만원) + 전체 전세가율
+    """
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        return "오류: DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다.\n공공데이터포털(data.go.kr)에서 API 키를 발급받아 설정해주세요."
+    if sort_by not in ("ratio", "samples", "complex"):
+        return "오류: sort_by 는 ratio, samples, complex 중 하나입니다."
+    if len(sigungu_code) != 5 or not sigungu_code.isdigit():
+        return "오류: 시군구코드는 5자리 숫자여야 합니다. (예: 11680)"
+    end_year_month = end_year_month or year_month
+    if any(len(ym) != 6 or not ym.isdigit() for ym in (year_month, end_year_month)):
+        return "오류: 계약년월은 6자리 숫자여야 합니다. (예: 202401)"
+    if end_year_month < year_month:
+        return "오류: end_year_month 가 year_month 보다 앞섭니다."
+    months = month_range(year_month, end_year_month)
+    if len(months) > MAX_RANGE_MONTHS:
+        return f"오류: 한 번에 조회할 수 있는 기간은 최대 {MAX_RANGE_MONTHS}개월입니다. (요청: {len(months)}개월)"
+
+    # 매매와 전월세를 동시에 조회 (각각 안에서도 달별로 동시 조회)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        trade_future = executor.submit(fetch_month_range, "아파트_매매", sigungu_code, months)
+        rent_future = executor.submit(fetch_month_range, "아파트_전월세", sigungu_code, months)
+        trade_results, trade_failures = trade_future.result()
+        rent_results, rent_failures = rent_future.result()
+    elapsed = time.perf_counter() - started
+    if not trade_results and not rent_results:
+        return f"오류: 모든 달의 조회에 실패했습니다. ({(trade_failures or rent_failures)[months[0]]})"
+
+    predicate, filter_labels = transaction_filter(dong=dong, name=name, cancelled="제외")
+    trades = [item for ym in months if ym in trade_results for item in trade_results[ym]["items"] if predicate(item)]
+    jeonses = [
+        item for ym in months if ym in rent_results for item in rent_results[ym]["items"]
+        if predicate(item) and item.is_jeonse
+    ]
+
+    def join_labels(items: list) -> list:
+        """단지(법정동 + 단지명) [× 전용면적 구간] 조인 키"""
+        complexes = stat_group_labels(items, None, "complex")
+        if not by_area_band:
+            return complexes
+        areas = np.fromiter((item.area or np.nan for item in items), dtype=np.float64, count=len(items))
+        return [f"{c}\t{band}" for c, band in zip(complexes, stat_group_labels(items, areas, "area_band"))]
+
+    # 양쪽을 각각 한 번씩 그룹 집계한 뒤 키로 해시 조인 (거래 목록은 출력하지 않음)
+    trade_stats = {row[0]: row for row in price_statistics(trades, "", join_labels(trades))}
+    rent_stats = {row[0]: row for row in price_statistics(jeonses, "", join_labels(jeonses))}
+    min_samples = max(1, min_samples)
+    joined = []
+    for key, trade_row in trade_stats.items():
+        rent_row = rent_stats.get(key)
+        if rent_row is None or min(trade_row[1], rent_row[1]) < min_samples:
+            continue
+        joined.append((key, trade_row[1], trade_row[2], rent_row[1], rent_row[2], rent_row[2] / trade_row[2]))
+    if sort_by == "ratio":
+        joined.sort(key=lambda row: (-row[5], row[0]))
+    elif sort_by == "samples":
+        joined.sort(key=lambda row: (-min(row[1], row[3]), row[0]))
+    else:
+        joined.sort(key=lambda row: row[0])
+    shown = joined[:max(1, top_n)]
+
+    period = year_month if year_month == end_year_month else f"{year_month}~{end_year_month}"
+    unit = "단지 × 전용면적" if by_area_band else "단지"
+    output = [f"## 아파트 전세가율 ({unit}별)"]
+    conditions = [label for label in filter_labels if not label.startswith("해제")]
+    output.append(f"- 지역코드: {sigungu_code}, 계약년월: {period}" + (f", 조건: {', '.join(conditions)}" if conditions else ""))
+    output.append(f"- 매매 {len(trades):,}건 / 전세 {len(jeonses):,}건 (해제·월세 제외, {elapsed:.1f}초)")
+    output.append(
+        f"- 매매 {len(trade_stats):,}개 / 전세 {len(rent_stats):,}개 그룹 중 양쪽 모두 있는 그룹 {len(joined):,}개"
+        + (f" (표본 {min_samples}건 이상)" if min_samples > 1 else "")
+    )
+    failures = sorted(set(trade_failures) | set(rent_failures))
+    if failures:
+        output.append(f"\n⚠️ 조회에 실패했거나 일부만 받은 달 (계산에서 빠짐): {', '.join(failures)}")
+    if not joined:
+        output.append("\n매매와 전세가 모두 있는 그룹이 없습니다. 기간을 넓히거나 min_samples 를 낮춰 보세요.")
+        return "\n".join(output)
+
+    output.append("")
+    if by_area_band:
+        output.append("| 단지 | 전용면적 | 매매 건수 | 매매 중위 | 전세 건수 | 전세 중위 | 전세가율 |")
+        output.append("|------|------|------|------|------|------|------|")
+    else:
+        output.append("| 단지 | 매매 건수 | 매매 중위 | 전세 건수 | 전세 중위 | 전세가율 |")
+        output.append("|------|------|------|------|------|------|")
+    for key, trade_count, trade_median, rent_count, rent_median, ratio in shown:
+        columns = key.split("\t")
+        output.append(
+            f"| {' | '.join(columns)} | {trade_count:,} | {format_statistic_price(trade_median)} | "
+            f"{rent_count:,} | {format_statistic_price(rent_median)} | {ratio:.1%} |"
+        )
+    if trades and jeonses:
+        # 전체 전세가율은 그룹 값을 합치지 않고 전체 중위로 다시 계산
+        trade_median = price_statistics(trades, "all")[0][2]
+        rent_median = price_statistics(jeonses, "all")[0][2]
+        blanks = "| " if by_area_band else ""
+        output.append(
+            f"| **전체** | {blanks}{len(trades):,} | {format_statistic_price(trade_median)} | "
+            f"{len(jeonses):,} | {format_statistic_price(rent_median)} | {rent_median / trade_median:.1%} |"
+        )
+    if len(joined) > len(shown):
+        output.append(f"\n※ {len(joined)}개 그룹 중 {len(shown)}개만 표시 (top_n 으로 조정)")
+    return "\n".join(output)
+
+
+@mcp.tool()
+def search_multi_region_transaction(
+    regions: list[str],
+    year_month: str,
+    end_year_month: str = "",
+    property_type: str = "아파트",
+    trade_type: str = "매매",
+    merge: bool = False,
+    rent_type: str = "전세",
+    num_of_rows: int = 30,
+    page_no: int = 1
+) -> str:
+    """
+    여러 지역 실거래가 동시 조회 - 서울 25개 구, "경기_" 전체 등을 한 번에 비교
+
+    ⭐ 지역마다 search_real_estate_transaction 을 따로 부르지 말고 이 도구로 한 번에 조회하세요.
+    모든 (지역, 월)을 동시에 받으므로 가장 느린 지역 하나를 조회하는 시간 정도면 끝납니다.
+
+    Args:
+        regions: 지역 목록 - 시군구코드(예: "11680"), 지역코드 접두사(예: "서울", "경기_", "경기_수원"), 지역명(예: "강남구")
+        year_month: 계약년월 6자리 (예: "202401")
+        end_year_month: 마지막 계약년월 6자리 (생략 시 year_month 한 달)
+        property_type: 부동산 유형 (아파트, 오피스텔, 연립다세대, 단독다가구, 토지 등)
+        trade_type: 거래 유형 (매매, 전월세)
+        merge: False(기본) 면 지역별 거래량·중위·하위 10%·상위 10%·㎡당 평균 표 (해제 거래 제외),
+            True 면 모든 지역의 거래를 계약일 순으로 합친 목록 (num_of_rows/page_no 단위)
+        rent_type: 전월세 지역별 통계 대상 - "전세" (기본), "월세", "전체"
+        num_of_rows: merge=True 일 때 한 페이지 건수 (기본: 30, 최대: 100)
+        page_no: merge=True 일 때 페이지 번호 (기본: 1)
+
+    Returns:
+        지역별 요약 표 또는 합친 거래 목록 + 조회에 실패한 (지역, 월)
+    """
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        return "오류: DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다.\n공공데이터포털(data.go.kr)에서 API 키를 발급받아 설정해주세요."
+
+    if property_type not in PROPERTY_TYPES:
+        return f"오류: 잘못된 부동산 유형입니다. 가능한 값: {', '.join(PROPERTY_TYPES)}"
+    available_trades = TRADE_TYPES.get(property_type, ["매매"])
+    if trade_type not in available_trades:
+        return f"오류: {property_type}의 가능한 거래 유형: {', '.join(available_trades)}"
+    endpoint_key = f"{property_type}_{trade_type}"
+    if endpoint_key not in ENDPOINTS:
+        return f"오류: 지원하지 않는 조합입니다: {property_type} {trade_type}"
+    if rent_type not in ("전세", "월세", "전체"):
+        return "오류: rent_type 은 전세, 월세, 전체 중 하나입니다."
+    end_year_month = end_year_month or year_month
+    if any(len(ym) != 6 or not ym.isdigit() for ym in (year_month, end_year_month)):
+        return "오류: 계약년월은 6자리 숫자여야 합니다. (예: 202401)"
+    if end_year_month < year_month:
+        return "오류: end_year_month 가 year_month 보다 앞섭니다."
+
+    targets, error = resolve_regions(regions)
+    if error:
+        return error
+    if not targets:
+        return "오류: 조회할 지역이 없습니다."
+    months = month_range(year_month, end_year_month)
+    partitions = [(code, ym) for code, _ in targets for ym in months]
+    if len(partitions) > MAX_FANOUT_PARTITIONS:
+        return (
+            f"오류: 한 번에 조회할 수 있는 (지역 × 월)은 최대 {MAX_FANOUT_PARTITIONS}개입니다. "
+            f"(요청: {len(targets)}개 지역 × {len(months)}개월) 지역이나 기간을 나눠 조회하세요."
+        )
+    num_of_rows = max(1, min(100, num_of_rows))
+    page_no = max(1, page_no)
+
+    started = time.perf_counter()
+    results, failures = fetch_partitions(endpoint_key, partitions, REGION_FETCH_CONCURRENCY)
+    elapsed = time.perf_counter() - started
+
+    region_names = dict(targets)
+    period = year_month if year_month == end_year_month else f"{year_month}~{end_year_month}"
+    stored = sum(1 for result in results.values() if result["source"] == "store")
+    output = [f"## {property_type} {trade_type} 여러 지역 조회 ({len(targets)}개 지역, {period})"]
+    output.append(
+        f"- 성공 {len(results)}/{len(partitions)}개 (지역 × 월, 로컬 저장소 {stored}개), {elapsed:.1f}초"
+    )
+    if failures:
+        output.append("\n⚠️ 조회에 실패했거나 일부만 받은 지역/달 - 해당 지역만 다시 조회하세요.")
+        for code, ym in sorted(failures):
+            output.append(f"- {region_names[code]}({code}) {ym}: {failures[(code, ym)]}")
+
+    # 지역 → 월 순서로 합침 (같은 달 안에서는 API 순서 유지)
+    rows = [
+        (region_names[code], item)
+        for code, ym in partitions if (code, ym) in results
+        for item in results[(code, ym)]["items"]
+    ]
+
+    if merge:
+        rows.sort(key=lambda row: deal_date_key(row[1]))
+        total_count = len(rows)
+        total_pages = (total_count + num_of_rows - 1) // num_of_rows if total_count else 1
+        start_idx = (page_no - 1) * num_of_rows
+        page = rows[start_idx:start_idx + num_of_rows]
+        output.append(
+            f"- **총 {total_count:,}건 중 {min(start_idx + 1, total_count)}~{min(start_idx + num_of_rows, total_count)}건 표시 "
+            f"(page {page_no}/{total_pages})**\n"
+        )
+        if not page:
+            output.append("검색 결과가 없습니다.")
+            return "\n".join(output)
+        price_label = "거래금액" if trade_type == "매매" else "보증금/월세"
+        output.append(f"| 지역 | 계약일 | 법정동 | 이름 | 전용면적 | 층 | {price_label} |")
+        output.append("|------|--------|--------|------|----------|----|------|")
+        for region, item in page:
+            price = format_price(item.amount)
+            if trade_type == "전월세":
+                price += f" / {item.monthly_rent:,}만원" if item.monthly_rent else " (전세)"
+            if item.cancelled:
+                price += " (해제)"
+            floor = "" if item.floor is None else f"{item.floor}층"
+            output.append(
+                f"| {region} | {format_deal_date(item.deal_date)} | {item.dong} | {item.name or '-'} | "
+                f"{format_area(item.area)}㎡ | {floor} | {price} |"
+            )
+        if page_no < total_pages:
+            output.append(f"\n※ 더 보려면 page_no={page_no + 1} 로 조회하세요.")
+        return "\n".join(output)
+
+    rows = [(region, item) for region, item in rows if not item.cancelled]
+    if trade_type == "전월세" and rent_type != "전체":
+        rows = [(region, item) for region, item in rows if item.is_jeonse == (rent_type == "전세")]
+    stats = price_statistics([item for _, item in rows], "region", [region for region, _ in rows])
+    stats.sort(key=lambda row: -row[2])
+    counted = {row[0] for row in stats}
+
+    price_label = "거래금액" if trade_type == "매매" else f"보증금({rent_type})"
+    output.append("")
+    output.append(f"| 지역 | 거래량 | 중위 {price_label} | 하위 10% | 상위 10% | ㎡당 평균 | 평당 평균 |")
+    output.append("|------|--------|------|------|------|------|------|")
+    for label, count, median, p10, p90, per_sqm, per_pyeong in stats:
+        output.append(
+            f"| {label} | {count:,} | {format_statistic_price(median)} | {format_statistic_price(p10)} | "
+            f"{format_statistic_price(p90)} | {format_statistic_price(per_sqm)} | {format_statistic_price(per_pyeong)} |"
+        )
+    for code, name in targets:
+        if name not in counted:
+            mark = "❌ 실패" if all((code, ym) in failures and (code, ym) not in results for ym in months) else "0"
+            output.append(f"| {name} | {mark} | - | - | - | - | - |")
+    output.append("\n※ 중위가 높은 순, 해제 거래 제외. 거래 목록은 merge=True 로 조회하세요.")
+    return "\n".join(output)
+
+
+@mcp.tool()
+def get_api_stats() -> str:
+    """
+    실거래가 API 호출 속도/일일 호출건수 현황
+    대량 조회 전에 오늘 남은 호출 가능 건수를 확인하세요.
+
+    Returns:
+        속도 제한 상태와 부동산유형_거래유형별 오늘 사용/남은 호출 건수, 커넥션 풀, 로컬 저장소 현황
+    """
+    api_key = os.environ.get("DATA_GO_KR_API_KEY")
+    if not api_key:
+        return "오류: DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다."
+
+    limiter = get_rate_limiter(api_key)
+    limits = limiter.stats()
+    usage = limiter.usage_today()
+
+    output = ["## 실거래가 API 호출 현황\n"]
+    output.append(f"- **속도 제한**: 초당 {limits['base_rate']:g}건 (버스트 {limits['burst']}건)")
+    output.append(
+        f"- **대기**: {limits['throttled']}회, 누적 {limits['throttled_wait_s']:.1f}초 "
+        f"(트래픽 초과 응답 {limits['traffic_errors']}회)"
+    )
+    for service, rate in limits["current_rates"].items():
+        if rate < limits["base_rate"]:
+            output.append(f"  - {service}: 트래픽 초과로 초당 {rate:.2f}건으로 감속 중")
+    output.append(f"- **오늘 남은 호출 가능 건수** (서비스별 한도 {limits['daily_limit']:,}건)")
+    for endpoint_key in ENDPOINTS:
+        used, remaining = usage.get(endpoint_key, (0, limiter.remaining(endpoint_key)))
+        remaining_text = "제한 없음" if remaining is None else f"{remaining:,}건"
+        output.append(f"  - {endpoint_key}: 사용 {used:,}건, 남음 {remaining_text}")
+
+    pool = connection_pool.stats()
+    output.append("\n### 커넥션 풀")
+    output.append(
+        f"- **요청**: {pool['requests']:,}건, 재사용률 {pool['reuse_rate']:.0%} "
+        f"(새 연결 {pool['created']}회, 평균 {pool['connect_avg_ms']:.1f}ms), 쉬는 커넥션 {pool['idle']}/{pool['max_size']}"
+    )
+    output.append(
+        f"- **전송량**: {pool['wire_bytes'] / 1024:,.0f}KB (압축 해제 후 {pool['body_bytes'] / 1024:,.0f}KB, "
+        f"압축 응답 {pool['compressed']:,}건), 시간 초과 {pool['timeouts']}회"
+    )
+    output.append(
+        f"- **시간 제한**: 연결 {connection_pool.connect_timeout:g}초, 읽기 {connection_pool.read_timeout:g}초, "
+        f"전체 {connection_pool.total_timeout:g}초"
+    )
+
+    store = transaction_store.stats()
+    output.append("\n### 로컬 저장소")
+    if not store["enabled"]:
+        output.append("- 비활성화됨 (REAL_ESTATE_STORE_PATH=)")
+        return "\n".join(output)
+    output.append(
+        f"- **적중/미스**: {store['hits']}/{store['misses']} (갱신 필요 {store['stale']}), 저장 {store['stores']}회, "
+        f"{store['bytes'] / 1024 / 1024:.1f}MB"
+    )
+    output.append(f"- **경로**: {store['path']}")
+    output.append(f"- **단지 색인**: {transaction_store.complex_count():,}개 단지")
+    for endpoint_key, lawd_cd, partitions, rows, first, last, synced_at in transaction_store.summary():
+        synced = datetime.fromtimestamp(synced_at).strftime("%Y-%m-%d %H:%M")
+        output.append(f"  - {lawd_cd} {endpoint_key}: {first}~{last} {partitions}개월, {rows:,}건 (마지막 동기화 {synced})")
+
+    return "\n".join(output)
 
 
 @mcp.tool()
 def find_region_code(query: str) -> str:
     """
-    지역명으로 시군구 코드(LAWD_CD) 검색 - 행정안전부 법정동코드 API 사용
+    지역명으로 시군구 코드(LAWD_CD) 검색 - 전국 시군구 코드표에서 바로 찾음 (API 호출 없음)
 
     Args:
         query: 검색할 지역명 (예: "영등포구", "서울특별시 강남구", "분당구", "해운대구")
-            - "서울특별시 영등포구" 형식 권장
-            - "영등포구"만 입력해도 검색 가능
+            - "서울 중구" 처럼 시도와 함께 쓰면 같은 이름의 구를 구분
+            - "영등포", "분당" 처럼 시/군/구를 빼도 되고, 오타도 어느 정도 보정
+            - "수원시" 처럼 일반구가 있는 시는 구 코드 목록, "경기" 처럼 시도만 쓰면 그 아래 전체
+            - 읍면동 이름("개포동")은 법정동코드 API 로 검색
 
     Returns:
         검색된 시군구명과 LAWD_CD 코드 (실거래가 조회에 사용)
     """
+    started = time.perf_counter()
     output = [f"## '{query}' 지역코드 검색 결과\n"]
 
-    # 1. 먼저 API로 검색 시도
+    # 1. 로컬 코드표
+    matches = sigungu_index.search(query)
+    if matches:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        output.append(f"### 검색된 지역 (코드표, {elapsed_ms:.2f}ms)")
+        labels = {"exact": "", "code": "", "area": "", "prefix": " (접두사)", "fuzzy": " (유사)"}
+        for code, name, kind, _ in matches:
+            output.append(f"- **{name}**: `{code}`{labels[kind]}")
+
+        exact = [code for code, _, kind, _ in matches if kind in ("exact", "code")]
+        if len(matches) == 1 or len(exact) == 1:
+            output.append(f"\n✅ 실거래가 조회에 이 코드를 사용하세요: `{(exact or [matches[0][0]])[0]}`")
+        elif all(kind == "area" for _, _, kind, _ in matches):
+            output.append(f"\n💡 {len(matches)}개 지역 - search_multi_region_transaction(regions=[\"{query}\"]) 로 한 번에 조회할 수 있습니다.")
+        else:
+            output.append(f"\n⚠️ {len(matches)}개 지역이 검색되었습니다. 원하는 지역의 코드를 선택하세요. (예: \"서울 중구\")")
+        return "\n".join(output)
+
+    # 2. 코드표에 없는 이름(읍면동 등)은 법정동코드 API 로 검색
     api_result = search_region_code_api(query)
 
     if api_result["success"] and api_result["results"]:
-        results = api_result["results"]
-
-        # 시군구 레벨 코드만 추출 (중복 제거됨)
         unique_codes = {}
-        for r in results:
+        for r in api_result["results"]:
             code = r["lawd_cd"]
             if code not in unique_codes:
-                # 주소에서 시군구 부분 추출
-                addr_parts = r["full_address"].split()
-                if len(addr_parts) >= 2:
-                    sigungu_name = " ".join(addr_parts[:2])  # "서울특별시 영등포구"
-                else:
-                    sigungu_name = r["full_address"]
-                unique_codes[code] = sigungu_name
+                unique_codes[code] = sigungu_index.names.get(code) or r["full_address"]
 
-        output.append("### 검색된 지역 (API)")
+        output.append("### 검색된 지역 (법정동코드 API)")
         for code, name in unique_codes.items():
             output.append(f"- **{name}**: `{code}`")
 
         if len(unique_codes) == 1:
-            code, name = list(unique_codes.items())[0]
+            code = next(iter(unique_codes))
             output.append(f"\n✅ 실거래가 조회에 이 코드를 사용하세요: `{code}`")
         else:
             output.append(f"\n⚠️ {len(unique_codes)}개 지역이 검색되었습니다. 원하는 지역의 코드를 선택하세요.")
-
         return "\n".join(output)
 
-    # 2. API 실패 시 로컬 캐시에서 검색
-    local_results = find_sigungu_code_local(query)
-
-    if local_results:
-        output.append("### 검색된 지역 (로컬 캐시)")
-        for name, code in local_results:
-            output.append(f"- **{name}**: `{code}`")
-
-        if len(local_results) == 1:
-            output.append(f"\n✅ 이 코드를 사용하세요: `{local_results[0][1]}`")
-        else:
-            output.append(f"\n⚠️ {len(local_results)}개 지역이 검색되었습니다.")
-    else:
-        # 광역시/도 필터 시도
-        filtered = {k: v for k, v in SIGUNGU_CODES.items() if query in k}
-        if filtered:
-            output.append(f"### {query} 지역 목록 (로컬 캐시)")
-            for name, code in sorted(filtered.items()):
-                district = "_".join(name.split("_")[1:])
-                output.append(f"- {district}: `{code}`")
-        else:
-            if api_result.get("error"):
-                output.append(f"API 오류: {api_result['error']}\n")
-            output.append("검색 결과가 없습니다.\n")
-            output.append("### 검색 팁")
-            output.append("- 정확한 지역명: `서울특별시 강남구`, `경기도 성남시 분당구`")
-            output.append("- 구/군 이름만: `강남구`, `분당구`, `해운대구`")
-
+    if api_result.get("error"):
+        output.append(f"API 오류: {api_result['error']}\n")
+    output.append("검색 결과가 없습니다.\n")
+    output.append("### 검색 팁")
+    output.append("- 정확한 지역명: `서울특별시 강남구`, `경기도 성남시 분당구`")
+    output.append("- 구/군 이름만: `강남구`, `분당구`, `해운대구`")
     return "\n".join(output)
 
 
 @mcp.tool()
-def list_all_regions() -> str:
+def list_all_regions(sido: str = "") -> str:
     """
-    지원되는 전체 지역 목록 조회
+    전국 시군구 코드 목록 조회
+
+    Args:
+        sido: 시도 이름으로 좁히기 (예: "서울", "경기도", 생략 시 전국)
 
     Returns:
-        광역시/도별 시군구 코드 전체 목록
+        광역시/도별 시군구 코드 목록 (일반구가 있는 시는 구 단위)
     """
-    output = ["## 전체 시군구 코드 목록\n"]
-
-    current_region = ""
-    for name, code in sorted(SIGUNGU_CODES.items()):
-        region_name = name.split("_")[0]
-        if region_name != current_region:
-            current_region = region_name
-            output.append(f"\n### {current_region}")
-
-        district = "_".join(name.split("_")[1:])
-        output.append(f"- {district}: `{code}`")
-
+    groups = sigungu_index.by_sido()
+    if sido:
+        key = "".join(sido.split())
+        groups = {name: rows for name, rows in groups.items() if key in (name, SIDO_SHORT_NAMES.get(name), *SIDO_OLD_NAMES.get(name, ()))}
+        if not groups:
+            return f"오류: '{sido}' 에 해당하는 시도가 없습니다. 가능한 값: {', '.join(SIDO_SHORT_NAMES.values())}"
+
+    output = ["## 전체 시군구 코드 목록" if not sido else f"## {sido} 시군구 코드 목록"]
+    total = 0
+    for name, rows in sorted(groups.items(), key=lambda group: group[1][0][0]):
+        output.append(f"\n### {name}")
+        output.extend(f"- {district}: `{code}`" for code, district in rows)
+        total += len(rows)
+
+    stats = sigungu_index.stats()
     output.append("\n---")
-    output.append(f"총 {len(SIGUNGU_CODES)}개 지역")
-    output.append("\n※ 더 많은 지역코드는 행정표준코드관리시스템(code.go.kr)에서 확인 가능")
+    output.append(f"총 {total}개 지역")
+    output.append(f"\n※ 코드표: {stats.get('source', stats['path'])} - 행정구역이 바뀌면 build_sigungu_table.py 로 갱신")
     return "\n".join(output)
 
 
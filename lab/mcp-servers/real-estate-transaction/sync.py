@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+실거래가 로컬 저장소 동기화 (배치 작업)
+지역(LAWD_CD)·기간·부동산유형_거래유형별로 저장소에 없는 달과 아직 신고가 들어오는 최근 달만 API 로 받아 저장
+- 지난 달은 한 번 받으면 다시 요청하지 않으므로 같은 명령을 주기적으로(cron 등) 실행하면 됨
+- 일일 호출건수 초과 등으로 중단되면 같은 명령으로 다시 실행 → 이미 받은 달은 건너뜀
+
+사용법:
+    python sync.py --lawd 11680 11650 --from 202001
+    python sync.py --lawd 11680 --from 202301 --to 202412 --types 아파트_매매 아파트_전월세 오피스텔_매매
+    python sync.py --status
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from server import ENDPOINTS, current_year_month, fetch_month, month_range, transaction_store
+
+STOP_MARKERS = ("일일 호출건수", "서비스키", "등록되지 않은")
+
+
+def plan(endpoint_key: str, lawd_cd: str, months: list, refresh_settling: bool) -> list:
+    """받아야 할 달 목록 (저장된 적 없는 달 + 최근 settling 달)"""
+    todo = []
+    for ym in months:
+        partition = transaction_store.partition(endpoint_key, lawd_cd, ym)
+        if partition is None:
+            todo.append(ym)
+        elif transaction_store.is_settling(ym) and (refresh_settling or not transaction_store.is_fresh(ym, partition[1])):
+            todo.append(ym)
+    return todo
+
+
+def print_status() -> None:
+    """저장소 현황 출력"""
+    rows = transaction_store.summary()
+    if not rows:
+        print(f"저장된 데이터가 없습니다. ({transaction_store.path})")
+        return
+    for endpoint_key, lawd_cd, partitions, count, first, last, synced_at in rows:
+        synced = time.strftime("%Y-%m-%d %H:%M", time.localtime(synced_at))
+        print(f"{lawd_cd} {endpoint_key}: {first}~{last} {partitions}개월, {count:,}건 (마지막 동기화 {synced})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lawd", nargs="*", default=[], help="시군구코드(LAWD_CD) 5자리 목록 (예: 11680 11650)")
+    parser.add_argument("--from", dest="start", help="시작 계약년월 (예: 202001)")
+    parser.add_argument("--to", dest="end", default=current_year_month(), help="마지막 계약년월 (기본: 이번 달)")
+    parser.add_argument("--types", nargs="*", default=["아파트_매매", "아파트_전월세"], help="부동산유형_거래유형 (기본: 아파트_매매 아파트_전월세)")
+    parser.add_argument("--refresh-settling", action="store_true", help="최근 달을 마지막 동기화 시각과 관계없이 다시 받기")
+    parser.add_argument("--status", action="store_true", help="저장소 현황만 출력")
+    args = parser.parse_args()
+
+    if not transaction_store.enabled:
+        sys.exit("오류: REAL_ESTATE_STORE_PATH 가 비어 있어 저장소를 사용할 수 없습니다.")
+    if args.status:
+        print_status()
+        return
+    if not args.lawd or not args.start:
+        parser.error("--lawd 와 --from 을 지정하세요.")
+    unknown = [key for key in args.types if key not in ENDPOINTS]
+    if unknown:
+        parser.error(f"알 수 없는 유형: {', '.join(unknown)} (가능한 값: {', '.join(ENDPOINTS)})")
+    if not os.environ.get("DATA_GO_KR_API_KEY"):
+        sys.exit("오류: DATA_GO_KR_API_KEY 환경변수가 설정되지 않았습니다.")
+
+    months = month_range(args.start, args.end)
+    fetched = failed = skipped = 0
+    try:
+        for lawd_cd in args.lawd:
+            for endpoint_key in args.types:
+                todo = plan(endpoint_key, lawd_cd, months, args.refresh_settling)
+                skipped += len(months) - len(todo)
+                for ym in todo:
+                    result = fetch_month(endpoint_key, lawd_cd, ym, use_store=False)
+                    if "error" in result:
+                        failed += 1
+                        print(f"  ! {lawd_cd} {endpoint_key} {ym}: {result['error']}", file=sys.stderr)
+                        if any(marker in result["error"] for marker in STOP_MARKERS):
+                            print("\n중단: 같은 명령으로 다시 실행하면 받은 달은 건너뛰고 이어서 받습니다.", file=sys.stderr)
+                            sys.exit(2)
+                        continue
+                    if result["failedPages"]:
+                        failed += 1
+                        print(f"  ! {lawd_cd} {endpoint_key} {ym}: 일부 페이지 실패 - 저장하지 않음", file=sys.stderr)
+                        continue
+                    fetched += 1
+                    print(f"  {lawd_cd} {endpoint_key} {ym}: {len(result['items']):,}건")
+    except KeyboardInterrupt:
+        print("\n중단됨 - 같은 명령으로 다시 실행하면 이어서 받습니다.", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        print(f"\n받은 달 {fetched}개, 건너뜀 {skipped}개, 실패 {failed}개 (저장소: {transaction_store.path})")
+
+
+if __name__ == "__main__":
+    main()
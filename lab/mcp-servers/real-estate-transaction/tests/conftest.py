@@ -0,0 +1,8 @@
+"""테스트 픽스처 - 서버 로드/응답 픽스처는 bench/server_fixtures.py 에서 공유"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "bench"))
+
+from server_fixtures import load_test_server, read_fixture  # noqa: E402,F401
@@ -0,0 +1,150 @@
+"""transaction_filter / select_transactions - 서버 측 조건 필터와 상위 k 정렬/페이지"""
+
+import copy
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def server(load_test_server):
+    return load_test_server("real-estate-transaction")
+
+
+@pytest.fixture(scope="module")
+def trades(server, read_fixture):
+    """매매 픽스처 응답 (100건, 대치동/개포동 5개 단지)"""
+    return server.parse_xml_response(read_fixture("real-estate-transaction", "getRTMSDataSvcAptTrade.xml"))["items"]
+
+
+def reference_page(items, key, descending, page_no, num_of_rows):
+    """비교 기준: 전체 정렬 후 페이지 슬라이스"""
+    ranked = sorted((item for item in items if key(item) is not None), key=key, reverse=descending)
+    return ranked[(page_no - 1) * num_of_rows:page_no * num_of_rows]
+
+
+def test_no_conditions_returns_no_predicate(server):
+    predicate, labels = server.transaction_filter()
+    assert predicate is None
+    assert labels == []
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"min_area": 80, "max_area": 90}, lambda t: 80 <= t.area <= 90),
+        ({"min_floor": 10}, lambda t: t.floor >= 10),
+        ({"max_floor": 3}, lambda t: t.floor <= 3),
+        ({"min_build_year": 2015, "max_build_year": 2019}, lambda t: 2015 <= t.build_year <= 2019),
+        ({"dong": " 개포동 "}, lambda t: t.dong == "개포동"),
+        ({"name": "대치 아이파크"}, lambda t: "대치아이파크" in t.name),
+        ({"dong": "대치동", "min_floor": 5, "max_area": 85}, lambda t: t.dong == "대치동" and t.floor >= 5 and t.area <= 85),
+    ],
+)
+def test_predicate_matches_brute_force(server, trades, kwargs, expected):
+    predicate, labels = server.transaction_filter(**kwargs)
+    selected = [t for t in trades if predicate(t)]
+    assert selected == [t for t in trades if expected(t)]
+    assert 0 < len(selected) < len(trades)
+    assert labels
+
+
+def test_price_range_uses_amount(server, trades):
+    prices = sorted(t.amount for t in trades)
+    low, high = prices[25], prices[75]
+    predicate, labels = server.transaction_filter(min_price=low, max_price=high)
+    assert [t for t in trades if predicate(t)] == [t for t in trades if low <= t.amount <= high]
+    assert labels[0].startswith("금액 ")
+
+
+def test_range_excludes_missing_values(server, trades):
+    item = copy.copy(trades[0])
+    item.floor = None
+    predicate, _ = server.transaction_filter(min_floor=1)
+    assert not predicate(item)
+
+
+def test_cancelled_modes(server, trades):
+    items = [copy.copy(t) for t in trades[:10]]
+    for item in items[:3]:
+        item.cancelled = True
+
+    include, _ = server.transaction_filter(cancelled="포함")
+    exclude, exclude_labels = server.transaction_filter(cancelled="제외")
+    only, only_labels = server.transaction_filter(cancelled="해제만")
+
+    assert include is None
+    assert [t for t in items if exclude(t)] == items[3:]
+    assert [t for t in items if only(t)] == items[:3]
+    assert exclude_labels == ["해제 거래 제외"]
+    assert only_labels == ["해제 거래만"]
+
+
+@pytest.mark.parametrize("sort_by", ["price", "price_per_area", "area", "floor", "date", "build_year"])
+@pytest.mark.parametrize("descending", [True, False])
+def test_top_k_pages_match_full_sort(server, trades, sort_by, descending):
+    key = server.SORT_KEYS[sort_by]
+    for page_no in (1, 2, 5, 11):
+        page, matched = server.select_transactions(trades, None, sort_by, descending, page_no, 10)
+        assert page == reference_page(trades, key, descending, page_no, 10)
+        assert matched == len(trades)
+    # 마지막 페이지 뒤는 빈 목록
+    page, matched = server.select_transactions(trades, None, sort_by, descending, 11, 10)
+    assert page == [] and matched == 100
+
+
+def test_top_k_applies_predicate_before_ranking(server, trades):
+    predicate, _ = server.transaction_filter(dong="개포동", min_area=80)
+    expected = [t for t in trades if predicate(t)]
+    key = server.SORT_KEYS["price"]
+
+    pages, page_no = [], 1
+    while True:
+        page, matched = server.select_transactions(trades, predicate, "price", True, page_no, 7)
+        assert matched == len(expected)
+        if not page:
+            break
+        pages.extend(page)
+        page_no += 1
+    assert pages == sorted(expected, key=key, reverse=True)
+
+
+def test_top_k_skips_items_without_sort_value(server, trades):
+    items = [copy.copy(t) for t in trades[:20]]
+    for item in items[:5]:
+        item.build_year = None
+
+    page, matched = server.select_transactions(items, None, "build_year", False, 1, 50)
+    assert matched == 15
+    assert page == sorted(items[5:], key=lambda t: t.build_year)
+
+
+def test_unsorted_paging_keeps_response_order(server, trades):
+    predicate, _ = server.transaction_filter(dong="대치동")
+    expected = [t for t in trades if predicate(t)]
+
+    first, matched = server.select_transactions(trades, predicate, "", True, 1, 20)
+    third, _ = server.select_transactions(trades, predicate, "", True, 3, 20)
+    beyond, _ = server.select_transactions(trades, predicate, "", True, 4, 20)
+
+    assert matched == len(expected) == 59
+    assert first == expected[:20]
+    assert third == expected[40:60]
+    assert beyond == []
+
+
+def test_filter_summary(server):
+    assert server.format_filter_summary([], "", True, 0) == []
+    lines = server.format_filter_summary(["법정동 대치동"], "price_per_area", False, 59)
+    assert lines == ["- **조건**: 법정동 대치동 → 59건", "- **정렬**: ㎡당 금액 낮은 순"]
+    assert server.format_filter_summary(None, "date", True, 100) == ["- **정렬**: 계약일 최근 순"]
+
+
+@pytest.mark.parametrize("property_type, trade_type", [("아파트", "매매"), ("아파트", "전월세"), ("오피스텔", "매매")])
+def test_summary_follows_heading(server, trades, property_type, trade_type):
+    summary = server.format_filter_summary(["법정동 대치동"], "price", True, 59)
+    lines = server.format_transactions(
+        {"items": trades[:3]}, property_type, trade_type, "11680", "202401", 59, 1, 3, summary
+    ).split("\n")
+    assert lines[0].startswith("## ")
+    assert lines[1:3] == summary
+    assert lines[3] == "- 지역코드: 11680"